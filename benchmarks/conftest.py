@@ -0,0 +1,27 @@
+"""
+conftest.py: the benchmarks are not collected by default, run them with ``pytest benchmarks``.
+"""
+
+import os
+import sys
+
+import pytest
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Skip the Abaqus execution and import the packages from the source tree.
+
+    Args:
+        config (pytest.Config): The pytest config object.
+    """
+    os.environ["ABQPY_SKIP_ABAQUS"] = "true"
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the ``--bench-json`` option to write the import benchmark report to a JSON file.
+
+    Args:
+        parser (pytest.Parser): The pytest command line parser.
+    """
+    parser.addoption("--bench-json", default=None, help="Write the import benchmark report to this JSON file")
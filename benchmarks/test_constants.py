@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import timeit
+from enum import Enum
+
+import pytest
+
+from abaqus.UtilityAndView.SymbolicConstant import (
+    LazyEnum,
+    LazyEnumMeta,
+    SymbolicConstant,
+    abaqusConstants,
+)
+
+NAMES = list(abaqusConstants._member_values_)
+
+
+def make_enum() -> type:
+    """The ``abaqusConstants`` class as it was defined before, an :class:`enum.Enum` of all the constants."""
+    return Enum("abaqusConstants", [(name, name) for name in NAMES], type=SymbolicConstant)
+
+
+def make_lazy_enum() -> type:
+    return LazyEnumMeta("abaqusConstants", (SymbolicConstant, LazyEnum), {name: name for name in NAMES})
+
+
+def best_of(func, number: int = 1, repeat: int = 5) -> float:
+    """The best time of a function call in microseconds."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+
+@pytest.fixture(scope="module")
+def report():
+    lines = []
+    yield lines.append
+    print("", f"abaqusConstants: {len(NAMES)} members", *lines, sep="\n")
+
+
+def test_class_creation(report):
+    enum_time, lazy_time = best_of(make_enum), best_of(make_lazy_enum)
+    report(f"class creation: Enum {enum_time:10.1f} us, LazyEnum {lazy_time:10.1f} us")
+
+
+def test_first_access(report):
+    def access_all(make_class):
+        cls = make_class()
+        return best_of(lambda: [getattr(cls, name) for name in NAMES], repeat=1) / len(NAMES)
+
+    enum_time, lazy_time = access_all(make_enum), access_all(make_lazy_enum)
+    report(f"first access:   Enum {enum_time:10.3f} us, LazyEnum {lazy_time:10.3f} us (per member)")
+
+
+def test_cached_access(report):
+    enum, lazy = make_enum(), make_lazy_enum()
+    list(lazy)
+    enum_time = best_of(lambda: enum.THREE_D, number=100000)
+    lazy_time = best_of(lambda: lazy.THREE_D, number=100000)
+    report(f"cached access:  Enum {enum_time:10.3f} us, LazyEnum {lazy_time:10.3f} us")
+    assert lazy.THREE_D is lazy["THREE_D"] is lazy("THREE_D")
+
+
+def test_import_time(report):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    module = "abaqus.UtilityAndView.abaqusConstants"
+    subprocess.run([sys.executable, "-c", f"import {module}"], env=env, check=True)  # Write the bytecode cache
+    command = [sys.executable, "-X", "importtime", "-c", f"import {module}"]
+    stderr = subprocess.run(command, env=env, check=True, capture_output=True, text=True).stderr
+    # Lines of "import time: self [us] | cumulative [us] | module"
+    times = {
+        line.split("|")[2].strip(): int(line.split("|")[0].split(":")[1]) for line in stderr.splitlines()[1:]
+    }
+    self_time = times[module] + times["abaqus.UtilityAndView.SymbolicConstant"]
+    report(f"import time:    {self_time} us (SymbolicConstant and abaqusConstants modules)")
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from abqpy.benchmark import MODULES, benchmark_imports, format_report
+from abqpy.cli import AbqpyCLI
+
+
+@pytest.fixture(scope="module")
+def report(request: pytest.FixtureRequest) -> dict:
+    report = benchmark_imports(MODULES, repeat=3)
+    print("", format_report(report), sep="\n")
+    output = request.config.getoption("--bench-json")
+    if output:
+        with open(output, "w") as file:
+            json.dump(report, file, indent=2)
+    return report
+
+
+def test_report(report: dict):
+    assert [result["module"] for result in report["results"]] == MODULES
+    for result in report["results"]:
+        assert 0 < result["warm_import_time"] < result["wall_time"]
+        assert result["peak_rss"] is None or result["peak_rss"] > 0
+
+
+@pytest.mark.parametrize("module", ["abaqus", "abaqusConstants", "odbAccess", "caeModules"])
+def test_stubs_are_lazy(module: str, report: dict):
+    # Only the modules needed to bootstrap the stubs are imported, not the ~1300 modules of the Abaqus object model
+    (result,) = [result for result in report["results"] if result["module"] == module]
+    assert result["modules"] < 400
+
+
+def test_cli(tmp_path, capsys: pytest.CaptureFixture):
+    output = tmp_path / "bench.json"
+    AbqpyCLI().bench("abaqusConstants", repeat=1, output=str(output))
+    assert "abaqusConstants" in capsys.readouterr().out
+    assert json.loads(output.read_text())["results"][0]["module"] == "abaqusConstants"
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from inpParser import InputFile
+
+
+def deck(nodes: int) -> str:
+    """An input file with ``nodes`` nodes and linear hexahedra, the elements are continued on a second line."""
+    lines = ["*Heading", "*Node"]
+    lines.extend(f"{i}, {i * 0.001:.6f}, {i * 0.002:.6f}, {i * 0.003:.6f}" for i in range(1, nodes + 1))
+    lines.append("*Element, type=C3D8R, elset=EALL")
+    for i in range(1, nodes // 8):
+        lines.append(f"{i}, {i}, {i + 1}, {i + 2}, {i + 3},\n{i + 4}, {i + 5}, {i + 6}, {i + 7}")
+    lines.extend(["*Step", "*Static", "*Output, field, variable=PRESELECT", "*End Step", ""])
+    return "\n".join(lines)
+
+
+@pytest.fixture(scope="module")
+def path(tmp_path_factory: pytest.TempPathFactory) -> str:
+    path = tmp_path_factory.mktemp("inpstat") / "deck.inp"
+    path.write_text(deck(500_000))
+    return str(path)
+
+
+def test_inpstat(path: str):
+    start = time.perf_counter()
+    stats = InputFile(path).stats()
+    scanned = time.perf_counter() - start
+    start = time.perf_counter()
+    keywords = InputFile(path).parse(usePyArray=True)
+    parsed = time.perf_counter() - start
+    print(f"\nstats {scanned * 1e3:.1f} ms, parse {parsed * 1e3:.1f} ms")
+    assert stats.nodes == len(keywords[1].data) and stats.elements == {"C3D8R": len(keywords[2].data)}
+    assert stats.dof == 3 * stats.nodes and stats.outputs == {"FIELD OUTPUT": 1}
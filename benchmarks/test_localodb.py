@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import json
+import time
+
+import numpy as np
+import pytest
+
+from abqpy.localodb import openOdb
+
+
+@pytest.fixture(scope="module")
+def path(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """An export of one frame with the displacement of ``count`` nodes, as written by ``abqpy export-odb``."""
+    output = tmp_path_factory.mktemp("localodb") / "job-export"
+    (output / "0" / "U").mkdir(parents=True)
+    count = 200_000
+    np.save(output / "0/U/0-0-data.npy", np.random.default_rng(0).random((count, 3), dtype=np.float32))
+    np.save(output / "0/U/0-0-nodeLabels.npy", np.arange(1, count + 1, dtype=np.int32))
+    block = {
+        "instance": "PART-1-1",
+        "elementType": None,
+        "position": "NODAL",
+        "type": "VECTOR",
+        "componentLabels": ["U1", "U2", "U3"],
+        "sectionPoint": None,
+        "data": "0/U/0-0-data.npy",
+        "nodeLabels": "0/U/0-0-nodeLabels.npy",
+        "length": count,
+    }
+    field = {"name": "U", "description": "Spatial displacement", "type": "VECTOR", "blocks": [block]}
+    field.update(componentLabels=["U1", "U2", "U3"], validInvariants=["MAGNITUDE"], isComplex=False)
+    frame = {"index": 0, "frameId": 0, "frameValue": 1.0, "description": "", "fieldOutputs": {"U": field}}
+    step = {"index": 0, "name": "Step-1", "number": 1, "frames": [frame], "historyRegions": {}}
+    (output / "manifest.json").write_text(json.dumps({"version": 1, "name": "job", "steps": [step]}))
+    return str(output)
+
+
+def test_bulk_data(path: str):
+    field = openOdb(path).steps["Step-1"].frames[0].fieldOutputs["U"]
+    start = time.perf_counter()
+    bulk = max(float(np.abs(block.data[:, 0]).max()) for block in field.bulkDataBlocks)
+    blocks = time.perf_counter() - start
+    start = time.perf_counter()
+    values = max(abs(value.data[0]) for value in field.values)
+    iterated = time.perf_counter() - start
+    print(f"\nbulkDataBlocks {blocks * 1e3:.1f} ms, values {iterated * 1e3:.1f} ms")
+    assert bulk == pytest.approx(values)
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from abaqus.InputFileParser._nesting import organize_keywords
+from inpParser import InputFile, Keyword
+
+# A step with its procedure, loads and output requests, and a material with its behaviors
+STEP = """*Step, name=Step-{i}
+*Static
+0.1, 1.
+*Boundary
+Fixed, 1, 6
+*Cload
+Load, 2, {i}.
+*Output, field
+*Node Output
+U, RF
+*Element Output
+S, E
+*End Step
+"""
+MATERIAL = """*Material, name=Material-{i}
+*Elastic
+210000., 0.3
+*Density
+7.85e-09
+*Plastic
+355., 0.
+"""
+
+
+def deck(keywords: int) -> str:
+    """An input file with about ``keywords`` keywords, the steps and materials are 75% and 25% of them."""
+    steps = [STEP.format(i=i) for i in range(keywords * 3 // 4 // 8)]
+    materials = [MATERIAL.format(i=i) for i in range(keywords // 4 // 4)]
+    return "*Heading\n" + "".join(materials) + "".join(steps)
+
+
+def measure(path: str) -> tuple[int, float, float]:
+    keywords = InputFile(path).parse()
+    start = time.perf_counter()
+    organize_keywords(keywords)
+    organized = time.perf_counter() - start
+    start = time.perf_counter()
+    InputFile(path).parse(organize=True)
+    return len(keywords), organized, time.perf_counter() - start
+
+
+@pytest.fixture(scope="module")
+def results(tmp_path_factory: pytest.TempPathFactory) -> dict[int, tuple[int, float, float]]:
+    results = {}
+    for size in (10_000, 100_000):
+        path = tmp_path_factory.mktemp("organize") / f"deck-{size}.inp"
+        path.write_text(deck(size))
+        results[size] = measure(str(path))
+    lines = ["", f"{'keywords':>10}{'organize [ms]':>15}{'parse [ms]':>12}"]
+    for count, organized, parsed in results.values():
+        lines.append(f"{count:>10}{organized * 1e3:15.1f}{parsed * 1e3:12.1f}")
+    print(*lines, sep="\n")
+    return results
+
+
+def test_linear(results: dict[int, tuple[int, float, float]]):
+    (small, small_time, _), (large, large_time, _) = results[10_000], results[100_000]
+    assert large >= 100_000
+    # Ten times more keywords take about ten times longer, a quadratic nesting would take a hundred times longer
+    assert large_time / small_time < 30
+    print(f"\n{large / small:.1f} times more keywords organized in {large_time / small_time:.1f} times longer")
+
+
+def test_nesting(results: dict[int, tuple[int, float, float]], tmp_path):
+    path = tmp_path / "deck.inp"
+    path.write_text(deck(1_000))
+    keywords = InputFile(str(path)).parse(organize=True)
+    assert [keyword.name for keyword in keywords[1].suboptions] == ["Elastic", "Density", "Plastic"]
+    step = next(keyword for keyword in keywords if keyword.name == "Step")
+    assert [keyword.name for keyword in step.suboptions] == ["Static", "Boundary", "Cload", "Output", "End Step"]
+    assert isinstance(step.suboptions[3].suboptions[0], Keyword)
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Measure the import time of the command line interface and the time of a call of its methods, with a ``run`` method
+# that does not start any command, so that only the overhead of the type checking is measured
+CHILD = """
+import json, sys, time, timeit
+start = time.perf_counter()
+from abqpy.cli import AbqpyCLI
+from abqpy.process import CommandResult
+imported = time.perf_counter() - start
+result = CommandResult("", 0, 0.0)
+cli = AbqpyCLI()
+cli.run = lambda cmd, **kwargs: result
+calls = {
+    "_parse_options": lambda: cli._parse_options(gui=True, database="model.cae", replay=None),
+    "cae": lambda: cli.cae("script.py", "arg", gui=True, database="model.cae"),
+}
+times = {name: min(timeit.repeat(call, number=2000, repeat=5)) / 2000 * 1e6 for name, call in calls.items()}
+json.dump({"import_time": imported * 1e3, "typeguard": "typeguard" in sys.modules, "calls": times}, sys.stdout)
+"""
+
+
+def measure(mode: str) -> dict:
+    env = dict(os.environ, ABQPY_TYPECHECK=mode, ABQPY_TYPECHECK_RATE="0.1", PYTHONPATH=os.pathsep.join(sys.path))
+    return json.loads(subprocess.run([sys.executable, "-c", CHILD], env=env, check=True, capture_output=True).stdout)
+
+
+@pytest.fixture(scope="module")
+def results() -> dict:
+    results = {mode: measure(mode) for mode in ("off", "sample", "full")}
+    lines = ["", f"{'mode':<8}{'import [ms]':>12}{'_parse_options [us]':>21}{'cae [us]':>10}"]
+    for mode, result in results.items():
+        calls = result["calls"]
+        lines.append(f"{mode:<8}{result['import_time']:12.1f}{calls['_parse_options']:21.2f}{calls['cae']:10.2f}")
+    print(*lines, sep="\n")
+    return results
+
+
+def test_overhead(results: dict):
+    assert not results["off"]["typeguard"] and results["sample"]["typeguard"] and results["full"]["typeguard"]
+    assert all(result["calls"].keys() == {"_parse_options", "cae"} for result in results.values())
@@ -41,27 +41,23 @@ import os
 import numpy as np
 import pandas as pd
 
-
-def fitness(x: float, maxdisp_expected: float = -0.1):
-    # Change the working directory to a new folder
-    wd = os.path.join(os.path.dirname(__file__), f"Job-E={x}")
-    os.makedirs(wd, exist_ok=True)
-    os.chdir(wd)
-
-    # Run the model and read the output, the additional argument can be read by the Abaqus/Python script
-    os.system(f"python ../compression.py {x},0.2")
-
-    # Read the output and calculate the fitness
-    data = pd.read_csv("data.csv")
-    maxdisp = data["U3"].iloc[-1]
-    return abs(maxdisp - maxdisp_expected)
+from abqpy import sweep
 
 
 def grid_search(search_space: list[float], expected: float):
-    fs = []
-    for x in search_space:
-        print(f"Running model for E={x}")
-        fs.append(fitness(x, expected))
+    # Run the model for every modulus in its own working directory, the additional argument can be read by the
+    # Abaqus/Python script
+    rows = sweep(
+        os.path.join(os.path.dirname(__file__), "compression.py"),
+        {"E": search_space, "nu": [0.2]},
+        argv=lambda params: [f"{params['E']},{params['nu']}"],
+        result="data.csv",
+        directory=os.path.join(os.path.dirname(__file__), "sweep"),
+    )
+
+    # Read the maximum displacement of every case and calculate the fitness
+    maxdisp = pd.DataFrame(rows).groupby("E")["U3"].last()
+    fs = [abs(maxdisp[x] - expected) for x in search_space]
     argmin = np.argmin(fs)
     best = search_space[argmin]
     print("Search results:", pd.DataFrame({"modulus": search_space, "fitness": fs}), sep="\n")
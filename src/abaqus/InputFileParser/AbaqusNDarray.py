@@ -1,10 +1,24 @@
 from __future__ import annotations
 
+import warnings
+from typing import Any
+
 from abqpy.decorators import abaqus_class_doc
 
+try:
+    import numpy as np
+
+    ndarray: type = np.ndarray
+except ImportError:  # numpy is only needed to parse the input files with usePyArray=True
+    np = None  # type: ignore
+    ndarray = object
+
+# The characters of the data lines handled by parse_text
+SPACE, TAB, RETURN, NEWLINE, COMMA = b" \t\r\n,"
+
 
 @abaqus_class_doc
-class AbaqusNDarray:
+class AbaqusNDarray(ndarray):  # type: ignore[misc,valid-type]
     """The AbaqusNDarray object is a sequence object derived from numpy.ndarray and is used to store numeric
     keyword data from an Abaqus input file. This object is similar to the numpy.ndarray object, but the numeric
     elements are returned as standard Python objects, not numpy numeric types. The numeric elements can be:
@@ -17,4 +31,114 @@ class AbaqusNDarray:
     cases, it will be False.
     """
 
-    ...
+    #: A Boolean specifying whether the first column holds ints and the other columns floats. The first column is
+    #: stored as floats, which represent the labels exactly up to 2**53.
+    colZeroIsInt: bool = False
+
+    def __new__(cls, data: Any, colZeroIsInt: bool = False, dtype: Any = None):
+        array = np.asarray(data, dtype=dtype).view(cls)
+        array.colZeroIsInt = colZeroIsInt  # type: ignore[attr-defined]
+        return array
+
+    def __array_finalize__(self, obj: Any) -> None:
+        self.colZeroIsInt = getattr(obj, "colZeroIsInt", False)
+
+    def __reduce__(self):
+        function, arguments, state = super().__reduce__()
+        return function, arguments, (state, self.colZeroIsInt)
+
+    def __setstate__(self, state):
+        state, self.colZeroIsInt = state
+        super().__setstate__(state)
+
+    def __getitem__(self, index):
+        item = super().__getitem__(index)
+        if isinstance(item, np.generic):
+            value = item.item()
+            return int(value) if self.colZeroIsInt and self._column(index) == 0 else value
+        if isinstance(item, AbaqusNDarray) and item.colZeroIsInt and self.ndim == 2 and isinstance(index, tuple):
+            # The first column of a column slice is not the first column of the array
+            column = index[1] if len(index) > 1 else slice(None)
+            item.colZeroIsInt = isinstance(column, slice) and column.start in (None, 0) and column.step in (None, 1)
+        return item
+
+    def _column(self, index: Any) -> int | None:
+        if self.ndim == 1 and isinstance(index, (int, np.integer)):
+            return int(index) % self.shape[0]
+        if self.ndim == 2 and isinstance(index, tuple) and len(index) == 2 and isinstance(index[1], (int, np.integer)):
+            return int(index[1]) % self.shape[1]
+        return None
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def tolist(self) -> Any:
+        """The data as nested lists of Python ints and floats."""
+        rows = super().tolist()
+        if not self.colZeroIsInt:
+            return rows
+        if self.ndim == 1:
+            return [int(rows[0]), *rows[1:]] if rows else rows
+        return [[int(row[0]), *row[1:]] for row in rows]
+
+    @property
+    def labels(self) -> np.ndarray:
+        """The first column of the data, the labels of the nodes or elements, as an int64 array."""
+        return np.asarray(self)[:, 0].astype(np.int64)
+
+    @property
+    def values(self) -> np.ndarray:
+        """The columns of the data after the labels, e.g. the coordinates of the nodes, as a plain array."""
+        return np.asarray(self)[:, 1:]
+
+
+def parse_text(text: str, dtype: Any) -> np.ndarray | None:
+    """Convert data lines with the same number of numeric fields to a 2D array at once.
+
+    The blanks, blank lines and trailing commas are removed, and the fields of each line are counted, with array
+    operations on the characters of the text, which is then converted by :func:`numpy.fromstring` in one call, so that
+    the lines are never handled one by one.
+
+    Parameters
+    ----------
+    text : str
+        The data lines, blank lines and a trailing comma are ignored.
+    dtype : Any
+        The type of the array, ``numpy.int64`` or ``numpy.float64``.
+
+    Returns
+    -------
+    numpy.ndarray | None
+        The array of the data lines, or None if the lines do not all have the same number of fields or if a field is
+        blank or is not a number of the type.
+    """
+    characters = np.frombuffer(text.encode("latin-1"), dtype=np.uint8)
+    characters = characters[(characters != SPACE) & (characters != TAB) & (characters != RETURN)]
+    newline = characters == NEWLINE
+    characters = characters[~(newline & np.append(True, newline[:-1]))]  # Blank lines
+    if characters.size and characters[-1] == NEWLINE:
+        characters = characters[:-1]
+    if not characters.size:
+        return np.empty((0, 0), dtype=dtype)
+    newline, comma = characters == NEWLINE, characters == COMMA
+    trailing = comma & np.append(newline[1:], True)
+    if trailing.any():
+        characters = characters[~trailing]
+        newline, comma = characters == NEWLINE, characters == COMMA
+    if comma[0] or (comma[1:] & (comma[:-1] | newline[:-1])).any():  # A blank field
+        return None
+    ends = np.append(np.flatnonzero(newline), characters.size)
+    counts = np.diff(np.searchsorted(np.flatnonzero(comma), ends), prepend=0)
+    if (counts != counts[0]).any():
+        return None
+    characters = np.where(newline, COMMA, characters).astype(np.uint8)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)  # Raised by numpy < 2 when the text is not all numbers
+        try:
+            array = np.fromstring(characters.tobytes(), dtype=dtype, sep=",")
+        except (ValueError, DeprecationWarning):
+            return None
+    columns = int(counts[0]) + 1
+    if array.size != ends.size * columns:
+        return None
+    return array.reshape(ends.size, columns)
@@ -1,8 +1,100 @@
 from __future__ import annotations
 
+import os
+from typing import Any, Iterable, Iterator
+
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
 from ..UtilityAndView.abaqusConstants import Boolean
+from ._cache import ParseCache, cache_path
+from ._diff import BlockDiff, diff_files
+from ._index import (
+    KeywordIndex,
+    build_index,
+    index_path,
+    load_index,
+    matches,
+    save_index,
+)
+from ._nesting import organize_keywords
+from ._parallel import parse_deck
+from ._reader import BULK_KEYWORDS, Block, normalize, read_blocks
+from ._stats import DeckStats, deck_stats
+from .AbaqusNDarray import AbaqusNDarray, np
+from .Keyword import Keyword
+from .KeywordSequence import KeywordSequence
+
+
+def block_keyword(block: Block) -> Keyword:
+    """Convert the data lines of a keyword block, to an AbaqusNDarray if they were converted to arrays."""
+    block.flush()
+    data: Any = tuple(block.rows)
+    if block.arrays:
+        array = np.concatenate(block.arrays) if len(block.arrays) > 1 else block.arrays[0]
+        if array.dtype == np.int64 and array.size and -(2**31) <= array.min() and array.max() < 2**31:
+            array = array.astype(np.int32)
+        data = AbaqusNDarray(array, colZeroIsInt=block.colZeroIsInt)
+    return Keyword(block.name, block.parameter, data, comments=tuple(block.comments))
+
+
+def iterKeywords(
+    file: str,
+    directory: str = "",
+    bulk: Boolean = True,
+    usePyArray: Boolean = False,
+    names: Iterable[str] | None = None,
+    verbose: Boolean = False,
+) -> Iterator[Keyword]:
+    """Read the keywords of an input file one at a time in deck order, the ``*INCLUDE`` keywords are replaced by the
+    keywords of the included files.
+
+    Only the keyword being read is held in memory, so that huge input files can be scanned with a small memory
+    footprint, e.g. for their steps or materials::
+
+        from inpParser import iterKeywords
+
+        for keyword in iterKeywords("model.inp", bulk=False, names=["*STEP", "*MATERIAL"]):
+            print(keyword.name, keyword.parameter)
+
+    Parameters
+    ----------
+    file
+        A String specifying the path to the input file.
+    directory
+        A String specifying the path to the directory containing the input file, see :class:`InputFile`.
+    bulk
+        A Boolean specifying whether the data of the bulk keywords, e.g. ``*NODE`` or ``*ELSET``, is parsed, otherwise
+        it is skipped without being converted and their data is empty. The default is True.
+    usePyArray
+        A Boolean specifying whether the data can be an AbaqusNDarray object, see :meth:`InputFile.parse`. The default
+        is False.
+    names
+        The names of the keywords to read, case-insensitive and with or without the leading ``*``, the data of the
+        other keywords is skipped without being converted. By default, all the keywords are read.
+    verbose
+        A Boolean specifying whether the errors are printed. The default is False.
+
+    Yields
+    ------
+    Keyword
+        The keywords, without suboptions.
+    """
+    wanted = None if names is None else {normalize(name) for name in names}
+
+    def skip(key: str) -> bool:
+        return (wanted is not None and key not in wanted) or (not bulk and key in BULK_KEYWORDS)
+
+    path = os.path.abspath(os.path.join(directory, file))
+    blocks = read_blocks(
+        path,
+        os.path.dirname(path),
+        skip=skip,
+        verbose=bool(verbose),
+        array=bool(usePyArray) and np is not None,
+    )
+    for block in blocks:
+        if wanted is None or block.key in wanted:
+            yield block_keyword(block)
 
 
 @abaqus_class_doc
@@ -51,7 +143,16 @@ class InputFile:
         InputFile
             An InputFile object.
         """
-        ...
+        self.file = file
+        self.directory = os.path.dirname(os.path.abspath(os.path.join(directory, file)))
+        self.includes = ()
+        self.missingIncludes = ()
+        self._parsed = False
+        self._index: KeywordIndex | None = None
+
+    @property
+    def _path(self) -> str:
+        return os.path.join(self.directory, os.path.basename(self.file))
 
     @abaqus_method_doc
     def parse(
@@ -60,14 +161,17 @@ class InputFile:
         verbose: Boolean = False,
         bulk: Boolean = True,
         usePyArray: Boolean = False,
-    ):
+        cache: bool | str = False,
+        workers: int = 1,
+    ) -> KeywordSequence:
         """This method parses the input file associated with the InputFile object.
 
         Parameters
         ----------
         organize
             A Boolean specifying whether keywords should be organized into suboptions. The default
-            is False.
+            is False. The nesting of the keywords is declared by
+            :data:`abaqus.InputFileParser._nesting.NESTING`.
         verbose
             A Boolean specifying whether verbose output is to be printed. If **verbose** is True,
             information about fatal errors is printed. If no fatal errors occur, there is no output.
@@ -80,6 +184,14 @@ class InputFile:
             data value. In cases where large amounts of numerical data (i.e., large node arrays) are
             expected, it is recommended that you use the option usePyArray=True. The default is
             False.
+        cache
+            Whether to cache the parsed keywords in the ``{file}.cache`` directory next to the input file, or the
+            path of the cache directory. Every file of the deck is cached on its own and parsed again only when it
+            changes, and the arrays are loaded as read-only memory maps. The default is False.
+        workers
+            The number of worker processes parsing the input file and its included files. The included files, and
+            the parts of the large files, are parsed at the same time and merged back in deck order. The default is
+            1, the input file is then read as a stream in the current process.
 
         Returns
         -------
@@ -92,4 +204,156 @@ class InputFile:
             If you parse an input file more than once, a ValueError is raised for each subsequent
             parsing.
         """
-        ...
+        if self._parsed:
+            raise ValueError(f"The input file {self.file} has already been parsed")
+        self._parsed = True
+        includes: list[str] = []
+        missing: list[str] = []
+        array = bool(usePyArray) and np is not None  # The data stays as tuples without numpy
+        store = ParseCache(cache if isinstance(cache, str) else cache_path(self._path), bool(bulk), array)
+        if workers > 1:
+            parsed = parse_deck(
+                self._path,
+                self.directory,
+                bulk=bool(bulk),
+                array=array,
+                workers=workers,
+                cache=store if cache else None,
+                includes=includes,
+                missing=missing,
+                verbose=bool(verbose),
+            )
+            keywords = KeywordSequence(parsed)
+        elif cache:
+            keywords = KeywordSequence(store.keywords(self._path, self.directory, includes, missing, bool(verbose)))
+        else:
+            blocks = read_blocks(
+                self._path,
+                self.directory,
+                skip=None if bulk else BULK_KEYWORDS.__contains__,
+                includes=includes,
+                missing=missing,
+                verbose=bool(verbose),
+                array=array,
+            )
+            keywords = KeywordSequence(block_keyword(block) for block in blocks)
+        self.includes, self.missingIncludes = tuple(includes), tuple(missing)
+        return organize_keywords(keywords) if organize else keywords
+
+    def index(self, persist: bool | str = False) -> KeywordIndex:
+        """Index the keyword lines of the input file and its included files, for random access to the keywords with
+        :meth:`keyword` and :meth:`keywords`.
+
+        The index holds the file and the offset in bytes of every keyword line, building it reads the whole deck once
+        without converting the data lines. It is built by the first call, or by the first call to :meth:`keyword` or
+        :meth:`keywords`, and reused by the following ones.
+
+        Parameters
+        ----------
+        persist
+            Whether to persist the index as JSON next to the input file, ``{file}.index.json``, or the path of the
+            JSON file. A persisted index is loaded instead of indexing the deck again, unless the size or the
+            modification time of one of the files of the deck has changed. The default is False.
+
+        Returns
+        -------
+        KeywordIndex
+            The keyword lines of the deck, with the included files and the included files that could not be found.
+        """
+        if self._index is None:
+            output = (persist if isinstance(persist, str) else index_path(self._path)) if persist else None
+            index = load_index(output) if output else None
+            if index is None:
+                index = build_index(self._path, self.directory)
+                if output:
+                    save_index(index, self._path, output)
+            self._index = index
+        self.includes, self.missingIncludes = tuple(self._index.includes), tuple(self._index.missing)
+        return self._index
+
+    def keywords(self, keywordName: str, usePyArray: Boolean = False, **parameters: str) -> Iterator[Keyword]:
+        """Read the keywords with a name and parameters, e.g. ``inp.keywords("*NSET")``, only the blocks of these
+        keywords are read from the deck, see :meth:`index`.
+
+        Parameters
+        ----------
+        keywordName
+            The name of the keywords, case-insensitive and with or without the leading ``*``.
+        usePyArray
+            A Boolean specifying whether the data can be returned as AbaqusNDarray objects, see :meth:`parse`.
+            The default is False.
+        **parameters
+            The values of the parameters of the keywords, case-insensitive, e.g. ``elset="EALL"`` or
+            ``name="Steel"``.
+
+        Yields
+        ------
+        Keyword
+            The keywords in deck order.
+        """
+        key = normalize(keywordName)
+        for entry in self.index().entries:
+            if matches(entry, key, parameters):
+                blocks = read_blocks(
+                    entry.file,
+                    self.directory,
+                    array=bool(usePyArray) and np is not None,
+                    offset=entry.offset,
+                    lineno=entry.line,
+                )
+                yield block_keyword(next(blocks))
+
+    def keyword(self, keywordName: str, usePyArray: Boolean = False, **parameters: str) -> Keyword | None:
+        """Read the first keyword with a name and parameters, e.g. ``inp.keyword("*ELEMENT", elset="EALL")``, see
+        :meth:`keywords`.
+
+        Returns
+        -------
+        Keyword | None
+            The keyword, or None if there is no such keyword in the deck.
+        """
+        return next(self.keywords(keywordName, usePyArray, **parameters), None)
+
+    def diff(self, other: InputFile | str, rows: Boolean = True) -> list[BlockDiff]:
+        """Compare the keyword blocks of the input file with those of another input file, e.g.
+        ``InputFile("old.inp").diff("new.inp")``.
+
+        Both decks are read as streams and the raw bytes of the data lines of their blocks are hashed, the blocks are
+        matched by name, normalized parameters, the last keyword with a ``name`` parameter before them, e.g. the
+        ``*MATERIAL`` of an ``*ELASTIC`` block, and occurrence. Only the changed blocks are read again and converted.
+        The comments are ignored.
+
+        Parameters
+        ----------
+        other
+            The other InputFile object, or the path of the other input file.
+        rows
+            A Boolean specifying whether the rows added, removed or changed in the changed blocks are reported, with
+            the deltas of their numeric values. The rows are matched by label when the first entries of the rows are
+            distinct integers, e.g. the nodes and elements, otherwise by position. The default is True.
+
+        Returns
+        -------
+        list[BlockDiff]
+            The removed and changed blocks in the order of the input file, then the blocks added by the other input
+            file in its order.
+        """
+        path = os.path.abspath(other) if isinstance(other, str) else other._path
+        return diff_files(self._path, path, rows=bool(rows))
+
+    def stats(self) -> DeckStats:
+        """Count the nodes, the elements by type, the sets, surfaces, materials, steps and output requests of the input
+        file and its included files, and estimate the number of degrees of freedom.
+
+        The deck is scanned once as memory-mapped bytes, only the keyword lines are decoded and the data lines of the
+        nodes and elements are counted without being converted, so that it is much faster than :meth:`parse`. The
+        nodes and elements of a part are counted once for every instance of the part.
+
+        Returns
+        -------
+        DeckStats
+            The model statistics.
+        """
+        stats = deck_stats(self._path, self.directory)
+        self.includes, self.missingIncludes = tuple(stats.includes), tuple(stats.missing)
+        return stats
@@ -3,6 +3,7 @@ from __future__ import annotations
 from abqpy.decorators import abaqus_class_doc
 
 from .AbaqusNDarray import AbaqusNDarray
+from .KeywordSequence import KeywordSequence
 
 
 @abaqus_class_doc
@@ -30,7 +31,28 @@ class Keyword:
     data: tuple[tuple[float, ...], ...] | AbaqusNDarray = ()
 
     #: A KeywordSequence specifying the suboptions of the keyword.
-    suboptions: str = ""
+    suboptions: KeywordSequence | None = None
 
     #: A sequence of Strings specifying the comments.
     comments: tuple[str, ...] = ()
+
+    def __init__(
+        self,
+        name: str,
+        parameter: dict | None = None,
+        data: tuple[tuple[float, ...], ...] | AbaqusNDarray = (),
+        suboptions: KeywordSequence | None = None,
+        comments: tuple[str, ...] = (),
+    ):
+        self.name = name
+        self.parameter = parameter if parameter is not None else {}
+        self.data = data
+        self.suboptions = suboptions if suboptions is not None else KeywordSequence()
+        self.comments = comments
+
+    def __repr__(self) -> str:
+        parameters = "".join(
+            f", {name}={value}" if value else f", {name}" for name, value in (self.parameter or {}).items()
+        )
+        lines, suboptions = len(self.data), len(self.suboptions or ())  # type: ignore[arg-type]
+        return f"<Keyword *{self.name}{parameters}: {lines} data lines, {suboptions} suboptions>"
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List
+
+from abqpy.decorators import abaqus_class_doc
+
+if TYPE_CHECKING:
+    from .Keyword import Keyword
+
+
+@abaqus_class_doc
+class KeywordSequence(List["Keyword"]):
+    """The KeywordSequence object is a sequence of Keyword objects in the order of the input file. KeywordSequence
+    objects are returned via the InputFile.parse() method, and by the **suboptions** member of the Keyword object.
+
+    .. note::
+        This object can be accessed by::
+
+            import inpParser
+    """
+
+    def __repr__(self) -> str:
+        return f"<KeywordSequence of {len(self)} keywords>"
+
+    def write(self, path: str, includeSize: int = 0) -> list[str]:
+        """Write the keywords and their suboptions to an input file.
+
+        The AbaqusNDarray data is formatted by chunks of rows at once, the floats are written with the shortest
+        representation reading back the same value, and the data lines hold at most 16 entries, a longer row is
+        continued on the next lines.
+
+        Parameters
+        ----------
+        path
+            The path of the input file.
+        includeSize
+            The number of data lines above which a keyword is written to its own file next to the input file,
+            ``{name}-{index}-{keyword}.inp``, which is included by an ``*INCLUDE`` keyword. The default is 0, the
+            keywords are all written to the input file.
+
+        Returns
+        -------
+        list[str]
+            The paths of the included files written.
+        """
+        from ._writer import write_keywords
+
+        included: list[str] = []
+        with open(path, "w", encoding="latin-1", newline="\n") as file:
+            write_keywords(file, self, path, includeSize, included)
+        return included
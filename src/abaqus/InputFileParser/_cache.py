@@ -0,0 +1,212 @@
+"""On-disk cache of the parsed keywords of input files, for ``InputFile.parse(cache=True)``.
+
+Every file of a deck is cached on its own, as a segment holding its keywords and its ``*INCLUDE`` keywords, so that
+editing an included file only parses that file again, and the segments are assembled in deck order when they are
+loaded. A segment is identified by the absolute path of its file and the options of the parse, and it is valid as long
+as the size and modification time of the file are unchanged, or, if only the modification time has changed, as long
+as the SHA-256 hash of its content is unchanged. The arrays of the keywords are stored as ``.npy`` files loaded as
+read-only memory maps, the other keywords are pickled.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import tempfile
+from typing import Any, Callable
+
+from abqpy.cache import file_digest
+
+from ._reader import BULK_KEYWORDS, read_blocks, resolve_include
+from .AbaqusNDarray import AbaqusNDarray, np
+from .Keyword import Keyword
+
+#: The version of the format of the cache entries
+VERSION = 1
+
+#: The file of a cache entry describing the cached file
+STAMP = "stamp.json"
+
+#: The file of a cache entry holding the keywords
+SEGMENT = "segment.pickle"
+
+
+def cache_path(path: str) -> str:
+    """The default directory of the parse cache of an input file."""
+    return f"{path}.cache"
+
+
+def _stamp(path: str) -> dict[str, Any]:
+    stat = os.stat(path)
+    return {"path": os.path.abspath(path), "size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+
+def assemble(
+    path: str,
+    directory: str,
+    segment: Callable[[str], list[Keyword | str]],
+    includes: list[str] | None = None,
+    missing: list[str] | None = None,
+    verbose: bool = False,
+) -> list[Keyword]:
+    """Assemble the segments of an input file and its included files in deck order.
+
+    Parameters
+    ----------
+    path : str
+        The path of the input file.
+    directory : str
+        The directory the relative paths of the included files are resolved against first.
+    segment : Callable[[str], list[Keyword | str]]
+        A function of the path of a file returning its keywords, and the names of the files included by its
+        ``*INCLUDE`` keywords.
+    includes, missing : list[str], optional
+        The lists the paths of the included files, and of the included files that could not be found, are appended to.
+    verbose : bool, optional
+        Whether to print the included files that could not be found, by default False.
+    """
+    keywords = []
+    for item in segment(path):
+        if isinstance(item, Keyword):
+            keywords.append(item)
+            continue
+        found = resolve_include(item, path, directory)
+        if found is None:
+            if missing is not None:
+                missing.append(item)
+            if verbose:
+                print(f"{path}: included file not found: {item}")
+            continue
+        if includes is not None:
+            includes.append(found)
+        keywords.extend(assemble(found, directory, segment, includes, missing, verbose))
+    return keywords
+
+
+class ParseCache:
+    """A directory of cached segments, one subdirectory per file and options of the parse.
+
+    Parameters
+    ----------
+    directory : str
+        The directory of the cache.
+    bulk, array : bool, optional
+        The options of the parse, see :meth:`abaqus.InputFileParser.InputFile.InputFile.parse`.
+    """
+
+    def __init__(self, directory: str, bulk: bool = True, array: bool = False):
+        self.directory = os.path.abspath(directory)
+        self.options = {"version": VERSION, "bulk": bulk, "array": array}
+
+    def entry(self, path: str) -> str:
+        """The directory of the cache entry of a file."""
+        key = json.dumps([os.path.abspath(path), self.options], sort_keys=True)
+        return os.path.join(self.directory, hashlib.sha256(key.encode()).hexdigest()[:32])
+
+    def keywords(
+        self,
+        path: str,
+        directory: str = "",
+        includes: list[str] | None = None,
+        missing: list[str] | None = None,
+        verbose: bool = False,
+    ) -> list[Keyword]:
+        """The keywords of an input file and its included files in deck order, the segments of the files are loaded
+        from the cache, or parsed and stored if they are not cached or not valid."""
+        return assemble(path, directory, self.segment, includes, missing, verbose)
+
+    def segment(self, path: str) -> list[Keyword | str]:
+        """The keywords of a file, and the names of the files included by its ``*INCLUDE`` keywords."""
+        segment = self.load(path)
+        if segment is None:
+            stamp = self.stamp(path)
+            segment = self.parse(path)
+            self.store(path, segment, stamp)
+        return segment
+
+    def stamp(self, path: str) -> dict[str, Any]:
+        """The size, modification time and hash of a file, taken before it is parsed so that a file changed during the
+        parse is not cached with the stamp of its new content."""
+        return {**_stamp(path), "sha256": file_digest(path)}
+
+    def parse(self, path: str) -> list[Keyword | str]:
+        """Parse the keywords of a file, without following its ``*INCLUDE`` keywords."""
+        from .InputFile import block_keyword
+
+        blocks = read_blocks(
+            path,
+            skip=None if self.options["bulk"] else BULK_KEYWORDS.__contains__,
+            array=bool(self.options["array"]),
+            follow=False,
+        )
+        return [
+            block.parameter.get("input", "").strip('"') if block.key == "INCLUDE" else block_keyword(block)
+            for block in blocks
+        ]
+
+    def load(self, path: str) -> list[Keyword | str] | None:
+        """Load the segment of a file, or None if it is not cached or if the file has changed."""
+        entry = self.entry(path)
+        try:
+            with open(os.path.join(entry, STAMP)) as file:
+                stamp = json.load(file)
+            current = _stamp(path)
+            if stamp["size"] != current["size"]:
+                return None
+            if stamp["mtime"] != current["mtime"]:  # The file may have been touched or copied without changes
+                if stamp["sha256"] != file_digest(path):
+                    return None
+                with open(os.path.join(entry, STAMP), "w") as file:
+                    json.dump({**stamp, "mtime": current["mtime"]}, file)
+            with open(os.path.join(entry, SEGMENT), "rb") as file:
+                items = pickle.load(file)
+        except (OSError, ValueError, KeyError, pickle.UnpicklingError, EOFError):
+            return None
+        segment: list[Keyword | str] = []
+        for item in items:
+            if isinstance(item, str):
+                segment.append(item)
+                continue
+            name, parameter, data, comments, array = item
+            if array is not None:
+                if np is None:
+                    return None
+                filename, colZeroIsInt = array
+                data = AbaqusNDarray(np.load(os.path.join(entry, filename), mmap_mode="r"), colZeroIsInt=colZeroIsInt)
+            segment.append(Keyword(name, parameter, data, comments=comments))
+        return segment
+
+    def store(self, path: str, segment: list[Keyword | str], stamp: dict[str, Any]) -> None:
+        """Store the segment of a file with the :meth:`stamp` of the file taken before it was parsed, the cache is left
+        unchanged if it cannot be written."""
+        entry = self.entry(path)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            staging = tempfile.mkdtemp(prefix=".tmp-", dir=self.directory)
+        except OSError:
+            return
+        try:
+            items: list[Any] = []
+            for item in segment:
+                if isinstance(item, str):
+                    items.append(item)
+                elif isinstance(item.data, AbaqusNDarray):
+                    filename = f"{len(items)}.npy"
+                    np.save(os.path.join(staging, filename), np.asarray(item.data))
+                    items.append((item.name, item.parameter, (), item.comments, (filename, item.data.colZeroIsInt)))
+                else:
+                    items.append((item.name, item.parameter, item.data, item.comments, None))
+            with open(os.path.join(staging, SEGMENT), "wb") as file:
+                pickle.dump(items, file, protocol=pickle.HIGHEST_PROTOCOL)
+            with open(os.path.join(staging, STAMP), "w") as file:
+                json.dump({**stamp, **self.options}, file)
+            if os.path.isdir(entry):
+                shutil.rmtree(entry)
+            os.replace(staging, entry)
+        except OSError:
+            pass
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
@@ -0,0 +1,212 @@
+"""Block-hash diff of two input files, for ``InputFile.diff`` and ``abqpy inpdiff``.
+
+Both input files are read as streams, and the raw bytes of the data lines of every keyword block are hashed instead of
+being converted. A block is identified by its normalized name and parameters, by the last keyword with a ``name``
+parameter before it, e.g. the ``*MATERIAL`` of an ``*ELASTIC`` block, and by its occurrence among the blocks with the
+same identity, so that the blocks of both files are matched without being aligned. Only the changed blocks are read
+again and converted, to report the deltas of their rows.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterator, NamedTuple, Sequence
+
+from ._reader import normalize, read_blocks
+from ._writer import keyword_line
+from .AbaqusNDarray import AbaqusNDarray, np
+
+#: The keywords whose data lines start with a label, e.g. the number of a node or element
+LABELED_KEYWORDS = frozenset({"NODE", "ELEMENT", "NODAL THICKNESS"})
+
+
+class BlockDigest(NamedTuple):
+    """The hash of a keyword block of an input file."""
+
+    #: The identity of the block, used to match the blocks of two input files
+    identity: tuple
+
+    #: The name of the keyword
+    name: str
+
+    #: The parameters of the keyword
+    parameter: dict[str, str]
+
+    #: The hexadecimal hash of the normalized parameters and of the raw bytes of the data lines
+    digest: str
+
+    #: The path of the file of the block
+    file: str
+
+    #: The offset in bytes of the keyword line in its file
+    offset: int
+
+    #: The number of the keyword line in its file
+    line: int
+
+
+class RowDelta(NamedTuple):
+    """A row of the data of a changed block."""
+
+    #: ``added``, ``removed`` or ``changed``
+    status: str
+
+    #: The label of the row, its first entry, or its position starting from 1 if the rows have no labels
+    label: Any
+
+    #: The new values minus the old values of the entries after the label, or None if they are not numbers
+    delta: tuple[float, ...] | None = None
+
+
+class BlockDiff(NamedTuple):
+    """A keyword block added, removed or changed between two input files."""
+
+    #: ``added``, ``removed`` or ``changed``
+    status: str
+
+    #: The block in the old input file, or None if it was added
+    old: BlockDigest | None
+
+    #: The block in the new input file, or None if it was removed
+    new: BlockDigest | None
+
+    #: The rows of a changed block which were added, removed or changed
+    rows: Sequence[RowDelta] = ()
+
+
+def _parameters(parameter: dict[str, str]) -> tuple[tuple[str, str], ...]:
+    return tuple(sorted((name, value.strip('"').upper()) for name, value in parameter.items()))
+
+
+def digest_blocks(path: str, directory: str = "") -> Iterator[BlockDigest]:
+    """Hash the keyword blocks of an input file and its included files in deck order."""
+    occurrences: dict[tuple, int] = {}
+    context = ""
+    for block in read_blocks(path, directory, digest=True):
+        parameters = _parameters(block.parameter)
+        if "name" in block.parameter:
+            context = f"{block.key}={block.parameter['name'].strip(chr(34)).upper()}"
+        identity = (context, block.key, parameters)
+        occurrences[identity] = occurrences.get(identity, 0) + 1
+        block.digest.update(repr((block.key, parameters)).encode())
+        yield BlockDigest(
+            (*identity, occurrences[identity]),
+            block.name,
+            block.parameter,
+            block.digest.hexdigest(),
+            block.file,
+            block.offset,
+            block.line,
+        )
+
+
+def read_block(digest: BlockDigest, array: bool = True) -> Any:
+    """The converted data of a hashed block."""
+    from .InputFile import block_keyword
+
+    blocks = read_blocks(digest.file, array=array and np is not None, offset=digest.offset, lineno=digest.line)
+    return block_keyword(next(blocks)).data
+
+
+def _number(value: Any) -> bool:
+    return isinstance(value, (int, float))
+
+
+def row_deltas(old: Any, new: Any, keyword: str = "") -> list[RowDelta]:
+    """The rows added, removed or changed between the data of two blocks of a keyword.
+
+    The rows of the keywords of :data:`LABELED_KEYWORDS`, e.g. the nodes or elements, are matched by label when the
+    first entries of all the rows of both blocks are distinct integers, the other rows are matched by position, e.g.
+    the ``210000, 0.3`` row of an ``*ELASTIC`` block. The removed rows come first, then the changed rows, then the
+    added rows.
+    """
+    labeled = normalize(keyword) in LABELED_KEYWORDS
+    if labeled and isinstance(old, AbaqusNDarray) and isinstance(new, AbaqusNDarray) and old.shape[1:] == new.shape[1:]:
+        integers = old.colZeroIsInt or old.dtype.kind == "i"
+        if integers and len(np.unique(old[:, 0])) == len(old) and len(np.unique(new[:, 0])) == len(new):
+            return _array_deltas(old, new)
+    old = old.tolist() if isinstance(old, AbaqusNDarray) else [list(row) for row in old]
+    new = new.tolist() if isinstance(new, AbaqusNDarray) else [list(row) for row in new]
+    if labeled and all(isinstance(row[0], int) for row in old + new if row):
+        if len(set(row[0] for row in old if row)) == len(old) and len(set(row[0] for row in new if row)) == len(new):
+            return _row_deltas({row[0]: row for row in old}, {row[0]: row for row in new})
+    positions = dict(enumerate(old, 1)), dict(enumerate(new, 1))
+    return _row_deltas(*positions, labeled=False)
+
+
+def _row_deltas(old: dict[Any, list], new: dict[Any, list], labeled: bool = True) -> list[RowDelta]:
+    deltas = [RowDelta("removed", label) for label in old if label not in new]
+    for label, row in old.items():
+        if label in new and new[label] != row:
+            values = (row[1:], new[label][1:]) if labeled else (row, new[label])
+            numeric = len(values[0]) == len(values[1]) and all(map(_number, values[0] + values[1]))
+            delta = tuple(b - a for a, b in zip(*values)) if numeric else None
+            deltas.append(RowDelta("changed", label, delta))
+    deltas.extend(RowDelta("added", label) for label in new if label not in old)
+    return deltas
+
+
+def _array_deltas(old: AbaqusNDarray, new: AbaqusNDarray) -> list[RowDelta]:
+    old_values, new_values = np.asarray(old), np.asarray(new)
+    labels, old_rows, new_rows = np.intersect1d(old_values[:, 0], new_values[:, 0], return_indices=True)
+    delta = new_values[new_rows, 1:] - old_values[old_rows, 1:]
+    changed = np.flatnonzero((delta != 0).any(axis=1))
+    removed = np.setdiff1d(old_values[:, 0], labels)
+    added = np.setdiff1d(new_values[:, 0], labels)
+    deltas = [RowDelta("removed", int(label)) for label in removed.tolist()]
+    deltas.extend(RowDelta("changed", int(labels[i]), tuple(delta[i].tolist())) for i in changed.tolist())
+    deltas.extend(RowDelta("added", int(label)) for label in added.tolist())
+    return deltas
+
+
+def diff_files(old: str, new: str, directory: str = "", rows: bool = True) -> list[BlockDiff]:
+    """The keyword blocks added, removed or changed between two input files.
+
+    Parameters
+    ----------
+    old, new : str
+        The paths of the input files.
+    directory : str, optional
+        The directory the relative paths of the included files are resolved against first.
+    rows : bool, optional
+        Whether to read the changed blocks again to report the deltas of their rows, by default True.
+
+    Returns
+    -------
+    list[BlockDiff]
+        The removed and changed blocks in the order of the old input file, then the added blocks in the order of the
+        new input file.
+    """
+    digests = {digest.identity: digest for digest in digest_blocks(old, directory)}
+    changed: dict[tuple, BlockDiff] = {}
+    added = []
+    for digest in digest_blocks(new, directory):
+        previous = digests.get(digest.identity)
+        if previous is None:
+            added.append(BlockDiff("added", None, digest))
+        elif previous.digest == digest.digest:
+            changed[digest.identity] = BlockDiff("same", previous, digest)
+        else:
+            deltas = row_deltas(read_block(previous), read_block(digest), digest.name) if rows else ()
+            changed[digest.identity] = BlockDiff("changed", previous, digest, deltas)
+    diffs = [changed.get(identity, BlockDiff("removed", digest, None)) for identity, digest in digests.items()]
+    return [diff for diff in diffs if diff.status != "same"] + added
+
+
+def format_diff(diffs: list[BlockDiff], limit: int = 10) -> str:
+    """Format the differences between two input files, with at most ``limit`` rows of each changed block."""
+    if not diffs:
+        return "The input files have the same keyword blocks"
+    lines = []
+    for diff in diffs:
+        block = diff.new if diff.old is None else diff.old
+        assert block is not None
+        where = " -> ".join(f"{digest.file}:{digest.line}" for digest in (diff.old, diff.new) if digest is not None)
+        lines.append(f"{diff.status:<8} {keyword_line(block.name, block.parameter).rstrip()}  ({where})")
+        for row in diff.rows[:limit]:
+            delta = "" if row.delta is None else "  delta " + ", ".join(f"{value:.6g}" for value in row.delta)
+            lines.append(f"    {row.status:<8} {row.label}{delta}")
+        if len(diff.rows) > limit:
+            lines.append(f"    ... {len(diff.rows) - limit} more rows")
+    counts = {status: sum(diff.status == status for diff in diffs) for status in ("added", "removed", "changed")}
+    lines.append(", ".join(f"{count} {status}" for status, count in counts.items()) + " blocks")
+    return "\n".join(lines)
@@ -0,0 +1,112 @@
+"""Index of the keyword lines of an input file and its included files, for random access to the keyword blocks.
+
+Every keyword line is indexed with the file it is in and its offset in bytes in that file, so that a block is read by
+seeking to its keyword line and reading until the next one. Building the index reads the whole deck once without
+converting the data lines, and the index can be persisted as JSON next to the input file, together with the size and
+modification time of every file of the deck, so that it is rebuilt only when one of them changes.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import NamedTuple
+
+from ._reader import normalize, read_blocks
+
+#: The version of the format of the persisted indexes
+VERSION = 1
+
+
+class IndexEntry(NamedTuple):
+    """A keyword line of an input file."""
+
+    #: The name of the keyword, without the leading ``*``
+    name: str
+
+    #: The normalized name of the keyword, see :func:`abaqus.InputFileParser._reader.normalize`
+    key: str
+
+    #: The parameters of the keyword, their names are lower case
+    parameter: dict[str, str]
+
+    #: The absolute path of the file of the keyword line
+    file: str
+
+    #: The offset in bytes of the keyword line in its file
+    offset: int
+
+    #: The number of the keyword line in its file
+    line: int
+
+
+class KeywordIndex(NamedTuple):
+    """The keyword lines of an input file and its included files, in deck order."""
+
+    #: The keyword lines
+    entries: list[IndexEntry]
+
+    #: The absolute paths of the included files
+    includes: list[str]
+
+    #: The included files that could not be found
+    missing: list[str]
+
+
+def index_path(path: str) -> str:
+    """The path of the persisted index of an input file."""
+    return f"{path}.index.json"
+
+
+def _stamp(path: str) -> list[int]:
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def build_index(path: str, directory: str = "") -> KeywordIndex:
+    """Index the keyword lines of an input file and its included files, the data lines are skipped."""
+    includes: list[str] = []
+    missing: list[str] = []
+    entries = [
+        IndexEntry(block.name, block.key, block.parameter, os.path.abspath(block.file), block.offset, block.line)
+        for block in read_blocks(path, directory, skip=lambda key: True, includes=includes, missing=missing)
+    ]
+    return KeywordIndex(entries, [os.path.abspath(include) for include in includes], missing)
+
+
+def save_index(index: KeywordIndex, path: str, output: str) -> None:
+    """Persist the index of an input file as JSON."""
+    files = [os.path.abspath(path), *index.includes]
+    data = {
+        "version": VERSION,
+        "files": {file: _stamp(file) for file in files},
+        "includes": index.includes,
+        "missing": index.missing,
+        "entries": [[entry.name, entry.parameter, entry.file, entry.offset, entry.line] for entry in index.entries],
+    }
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(data, file, separators=(",", ":"))
+
+
+def load_index(output: str) -> KeywordIndex | None:
+    """Load a persisted index, or None if it does not exist or if a file of the deck has changed since."""
+    try:
+        with open(output, encoding="utf-8") as file:
+            data = json.load(file)
+        if data.get("version") != VERSION or any(_stamp(file) != stamp for file, stamp in data["files"].items()):
+            return None
+    except (OSError, ValueError, KeyError, AttributeError):
+        return None
+    entries = [IndexEntry(name, normalize(name), parameter, *rest) for name, parameter, *rest in data["entries"]]
+    return KeywordIndex(entries, data["includes"], data["missing"])
+
+
+def matches(entry: IndexEntry, key: str, parameters: dict[str, str]) -> bool:
+    """Whether a keyword line has a normalized name and parameters, the values are compared case-insensitively."""
+    if entry.key != key:
+        return False
+    for name, value in parameters.items():
+        actual = entry.parameter.get(name.lower())
+        if actual is None or actual.strip('"').upper() != str(value).strip('"').upper():
+            return False
+    return True
@@ -0,0 +1,170 @@
+"""The nesting of the keywords of an input file into the suboptions of other keywords, for ``organize=True``.
+
+The nesting is declared by the :data:`NESTING` table, a keyword either opens a block closed by an end keyword, e.g.
+``*STEP`` and ``*END STEP``, which holds all the keywords until the end keyword, or holds the keywords of a set of
+suboptions following it, e.g. ``*MATERIAL`` and ``*ELASTIC``, until another keyword is found. The keywords are nested in
+a single pass with a stack of the open keywords, so that the time is linear in the number of keywords.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, NamedTuple
+
+from ._reader import normalize
+from .Keyword import Keyword
+from .KeywordSequence import KeywordSequence
+
+
+class Nesting(NamedTuple):
+    """The keywords nested into the suboptions of a keyword."""
+
+    #: The end keyword closing the block of the keyword, all the keywords until the end keyword are nested
+    end: str | None = None
+
+    #: The suboptions of the keyword, they are nested until another keyword is found
+    suboptions: frozenset[str] = frozenset()
+
+
+def _suboptions(*names: str) -> Nesting:
+    return Nesting(suboptions=frozenset(names))
+
+
+#: The nesting of the keywords, by normalized name of the parent keyword
+NESTING: dict[str, Nesting] = {
+    "PART": Nesting(end="END PART"),
+    "ASSEMBLY": Nesting(end="END ASSEMBLY"),
+    "INSTANCE": Nesting(end="END INSTANCE"),
+    "STEP": Nesting(end="END STEP"),
+    "MATERIAL": _suboptions(
+        "CONCRETE COMPRESSION DAMAGE",
+        "CONCRETE COMPRESSION HARDENING",
+        "CONCRETE DAMAGED PLASTICITY",
+        "CONCRETE TENSION DAMAGE",
+        "CONCRETE TENSION STIFFENING",
+        "CONDUCTIVITY",
+        "CREEP",
+        "CYCLIC HARDENING",
+        "DAMAGE INITIATION",
+        "DAMPING",
+        "DENSITY",
+        "DEPVAR",
+        "DIELECTRIC",
+        "DRUCKER PRAGER",
+        "DRUCKER PRAGER HARDENING",
+        "ELASTIC",
+        "ELECTRICAL CONDUCTIVITY",
+        "EOS",
+        "EXPANSION",
+        "HEAT GENERATION",
+        "HYPERELASTIC",
+        "HYPERFOAM",
+        "HYSTERESIS",
+        "INELASTIC HEAT FRACTION",
+        "LATENT HEAT",
+        "MOHR COULOMB",
+        "MOHR COULOMB HARDENING",
+        "MULLINS EFFECT",
+        "PERMEABILITY",
+        "PIEZOELECTRIC",
+        "PLASTIC",
+        "POTENTIAL",
+        "RATE DEPENDENT",
+        "REGULARIZE",
+        "SHEAR FAILURE",
+        "SPECIFIC HEAT",
+        "SWELLING",
+        "TENSILE FAILURE",
+        "USER DEFINED FIELD",
+        "USER MATERIAL",
+        "VISCOELASTIC",
+        "VISCOUS",
+    ),
+    "DAMAGE INITIATION": _suboptions("DAMAGE EVOLUTION", "DAMAGE STABILIZATION"),
+    "SURFACE INTERACTION": _suboptions(
+        "COHESIVE BEHAVIOR",
+        "CONTACT DAMPING",
+        "DAMAGE INITIATION",
+        "FRICTION",
+        "GAP CONDUCTANCE",
+        "GAP HEAT GENERATION",
+        "GAP RADIATION",
+        "SURFACE BEHAVIOR",
+    ),
+    "CONNECTOR BEHAVIOR": _suboptions(
+        "CONNECTOR CONSTITUTIVE REFERENCE",
+        "CONNECTOR DAMAGE EVOLUTION",
+        "CONNECTOR DAMAGE INITIATION",
+        "CONNECTOR DAMPING",
+        "CONNECTOR DERIVED COMPONENT",
+        "CONNECTOR ELASTICITY",
+        "CONNECTOR FRICTION",
+        "CONNECTOR HARDENING",
+        "CONNECTOR LOCK",
+        "CONNECTOR PLASTICITY",
+        "CONNECTOR POTENTIAL",
+        "CONNECTOR STOP",
+        "CONNECTOR UNIAXIAL BEHAVIOR",
+    ),
+    "CONTACT": _suboptions(
+        "CONTACT CONTROLS ASSIGNMENT",
+        "CONTACT EXCLUSIONS",
+        "CONTACT FORMULATION",
+        "CONTACT INCLUSIONS",
+        "CONTACT INITIALIZATION ASSIGNMENT",
+        "CONTACT PROPERTY ASSIGNMENT",
+        "CONTACT STABILIZATION",
+        "SURFACE PROPERTY ASSIGNMENT",
+    ),
+    "OUTPUT": _suboptions(
+        "CONTACT OUTPUT",
+        "ELEMENT OUTPUT",
+        "ENERGY OUTPUT",
+        "INCREMENTATION OUTPUT",
+        "INTEGRATED OUTPUT",
+        "NODE OUTPUT",
+        "RADIATION OUTPUT",
+    ),
+}
+
+
+def organize_keywords(keywords: Iterable[Keyword], nesting: dict[str, Nesting] | None = None) -> KeywordSequence:
+    """Nest the keywords into the suboptions of their parent keywords.
+
+    Parameters
+    ----------
+    keywords : Iterable[Keyword]
+        The keywords in deck order.
+    nesting : dict[str, Nesting], optional
+        The nesting of the keywords, by default :data:`NESTING`.
+
+    Returns
+    -------
+    KeywordSequence
+        The keywords which are not nested into another one, the end keywords are the last suboptions of the keywords
+        they close.
+    """
+    nesting = NESTING if nesting is None else nesting
+    root = KeywordSequence()
+    stack: list[tuple[Keyword, Nesting]] = []
+    ends: dict[str, int] = {}  # The number of open blocks closed by each end keyword
+    for keyword in keywords:
+        key = normalize(keyword.name)
+        # The open keywords without an end keyword are closed by any keyword which is not one of their suboptions
+        while stack and stack[-1][1].end is None and key not in stack[-1][1].suboptions:
+            stack.pop()
+        if ends.get(key):  # The end keyword closes its block, and the blocks left open inside it
+            while True:
+                parent, block = stack.pop()
+                if block.end is not None:
+                    ends[block.end] -= 1
+                if block.end == key:
+                    break
+            parent.suboptions.append(keyword)  # type: ignore[union-attr]
+            continue
+        (stack[-1][0].suboptions if stack else root).append(keyword)  # type: ignore[union-attr]
+        if key in nesting:
+            stack.append((keyword, nesting[key]))
+            end = nesting[key].end
+            if end is not None:
+                ends[end] = ends.get(end, 0) + 1
+    return root
@@ -0,0 +1,225 @@
+"""Parallel parsing of input files, for ``InputFile.parse(workers=N)``.
+
+The graph of the included files is resolved first, by reading only the keyword lines of the files, then every file is
+split into tasks of about :data:`SPLIT_SIZE` bytes, each one a run of consecutive keyword blocks, or a part of the data
+lines of a larger block, which are parsed in a process pool. The blocks are merged back into the segments of the files,
+and the segments are assembled in deck order.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, NamedTuple
+
+from ._cache import ParseCache, assemble
+from ._reader import BULK_KEYWORDS, Block, read_blocks, resolve_include
+from .Keyword import Keyword
+
+#: The number of bytes of an input file parsed by a task
+SPLIT_SIZE = 1 << 26
+
+#: The number of bytes read to find the start of a line where the data lines of a block are split
+ALIGNMENT = 1 << 20
+
+
+class Task(NamedTuple):
+    """A range of an input file parsed by a worker."""
+
+    #: The path of the file
+    path: str
+
+    #: The offset in bytes of the range
+    offset: int
+
+    #: The size in bytes of the range
+    size: int
+
+    #: The number of the first line of the range, or 0 if it is not known
+    lineno: int
+
+    #: The name and parameters of the block the range is a part of, or None if the range starts with a keyword line
+    block: tuple[str, dict[str, str]] | None = None
+
+
+def _skip_all(key: str) -> bool:
+    return True
+
+
+def _keyword_lines(path: str) -> list[Block]:
+    return list(read_blocks(path, skip=_skip_all, follow=False))
+
+
+def _align(path: str, position: int, end: int) -> int | None:
+    """The offset of the first line after ``position`` which is not the continuation of the previous line, or None if
+    there is no such line before ``end``."""
+    with open(path, encoding="latin-1", newline="") as file:
+        file.seek(position)
+        text = file.read(min(ALIGNMENT, end - position))
+    start = text.find("\n") + 1
+    while 0 < start < len(text):
+        line = text[:start].rstrip()
+        if not line.endswith(","):
+            return position + start
+        text, position = text[start:], position + start
+        start = text.find("\n") + 1
+    return None
+
+
+def plan(path: str, blocks: list[Block], bulk: bool = True, split: int | None = None) -> list[Task]:
+    """Split an input file into tasks.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file.
+    blocks : list[Block]
+        The keyword blocks of the file, without their data lines.
+    bulk : bool, optional
+        Whether the data lines of the bulk keywords are parsed, otherwise their blocks are never split, by default
+        True.
+    split : int, optional
+        The number of bytes of a task, by default :data:`SPLIT_SIZE`.
+    """
+    if not blocks:
+        return []
+    split = split or SPLIT_SIZE
+    ends = [block.offset for block in blocks[1:]] + [os.path.getsize(path)]
+    tasks: list[Task] = []
+    start = 0  # The index of the first block of the current task
+    for index, (block, end) in enumerate(zip(blocks, ends)):
+        if end - block.offset <= split or (not bulk and block.key in BULK_KEYWORDS):
+            if end - blocks[start].offset >= split or index + 1 == len(blocks):
+                tasks.append(Task(path, blocks[start].offset, end - blocks[start].offset, blocks[start].line))
+                start = index + 1
+            continue
+        if start < index:
+            tasks.append(Task(path, blocks[start].offset, block.offset - blocks[start].offset, blocks[start].line))
+        positions = [block.offset]
+        for position in range(block.offset + split, end - split // 2, split):
+            aligned = _align(path, position, end)
+            if aligned is not None and aligned > positions[-1]:
+                positions.append(aligned)
+        positions.append(end)
+        tasks.append(Task(path, positions[0], positions[1] - positions[0], block.line))
+        for first, last in zip(positions[1:], positions[2:]):
+            tasks.append(Task(path, first, last - first, 0, (block.name, block.parameter)))
+        start = index + 1
+    return tasks
+
+
+def run_task(task: Task, bulk: bool = True, array: bool = False) -> list[Block]:
+    """Parse a range of an input file, the ``*INCLUDE`` keywords are not followed."""
+    current = None if task.block is None else Block(*task.block, task.path, 0, array, task.offset)
+    blocks = list(
+        read_blocks(
+            task.path,
+            skip=None if bulk else BULK_KEYWORDS.__contains__,
+            array=array,
+            offset=task.offset,
+            lineno=task.lineno or 1,
+            follow=False,
+            size=task.size,
+            current=current,
+        )
+    )
+    for block in blocks:
+        block.flush()
+    return blocks
+
+
+def _run(arguments: tuple[Task, bool, bool]) -> list[Block]:
+    return run_task(*arguments)
+
+
+def parse_segments(
+    paths: dict[str, list[Block]], bulk: bool = True, array: bool = False, workers: int = 1
+) -> dict[str, list[Keyword | str]]:
+    """Parse the segments of files in a process pool.
+
+    Parameters
+    ----------
+    paths : dict[str, list[Block]]
+        The paths of the files, and their keyword blocks without their data lines.
+    bulk, array : bool, optional
+        The options of the parse, see :meth:`abaqus.InputFileParser.InputFile.InputFile.parse`.
+    workers : int, optional
+        The number of worker processes, by default 1, the files are then parsed in the current process.
+
+    Returns
+    -------
+    dict[str, list[Keyword | str]]
+        The keywords of the files, and the names of the files included by their ``*INCLUDE`` keywords.
+    """
+    from .InputFile import block_keyword
+
+    tasks = [task for path, blocks in paths.items() for task in plan(path, blocks, bulk)]
+    arguments = [(task, bulk, array) for task in tasks]
+    if workers > 1 and len(tasks) > 1:
+        # The workers import the abaqus package, which must not submit the main script to Abaqus again
+        skip = os.environ.get("ABQPY_SKIP_ABAQUS")
+        os.environ["ABQPY_SKIP_ABAQUS"] = "true"
+        try:
+            with ProcessPoolExecutor(min(workers, len(tasks))) as executor:
+                results = list(executor.map(_run, arguments))
+        finally:
+            if skip is None:
+                del os.environ["ABQPY_SKIP_ABAQUS"]
+            else:
+                os.environ["ABQPY_SKIP_ABAQUS"] = skip
+    else:
+        results = [_run(argument) for argument in arguments]
+
+    merged: dict[str, list[Block]] = {path: [] for path in paths}
+    for task, result in zip(tasks, results):
+        if task.block is not None:
+            merged[task.path][-1].merge(result[0])
+        else:
+            merged[task.path].extend(result)
+    return {
+        path: [
+            block.parameter.get("input", "").strip('"') if block.key == "INCLUDE" else block_keyword(block)
+            for block in blocks
+        ]
+        for path, blocks in merged.items()
+    }
+
+
+def parse_deck(
+    path: str,
+    directory: str = "",
+    *,
+    bulk: bool = True,
+    array: bool = False,
+    workers: int = 1,
+    cache: ParseCache | None = None,
+    includes: list[str] | None = None,
+    missing: list[str] | None = None,
+    verbose: bool = False,
+) -> list[Keyword]:
+    """Parse an input file and its included files in a process pool, the files cached in ``cache`` are loaded instead
+    of being parsed, and the other ones are stored in it."""
+    segments: dict[str, list[Keyword | str]] = {}
+    pending: dict[str, list[Block]] = {}
+    stamps: dict[str, dict[str, Any]] = {}
+    stack = [path]
+    while stack:
+        file = stack.pop()
+        if file in segments or file in pending:
+            continue
+        segment = cache.load(file) if cache is not None else None
+        if segment is not None:
+            segments[file] = segment
+            names = [item for item in segment if isinstance(item, str)]
+        else:
+            if cache is not None:
+                stamps[file] = cache.stamp(file)
+            pending[file] = _keyword_lines(file)
+            names = [block.parameter.get("input", "").strip('"') for block in pending[file] if block.key == "INCLUDE"]
+        found = (resolve_include(name, file, directory) for name in names)
+        stack.extend(include for include in found if include is not None)
+    for file, segment in parse_segments(pending, bulk, array, workers).items():
+        if cache is not None:
+            cache.store(file, segment, stamps[file])
+        segments[file] = segment
+    return assemble(path, directory, segments.__getitem__, includes, missing, verbose)
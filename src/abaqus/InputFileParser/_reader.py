@@ -0,0 +1,402 @@
+"""Streaming reader of Abaqus input files, it turns the lines of a deck and its included files into keyword blocks.
+
+An input file is a sequence of keyword lines starting with ``*``, each one followed by its data lines, and of comment
+lines starting with ``**``. A keyword line ending with a comma is continued on the next line, and so is a data line of
+an ``*ELEMENT`` keyword. The files are read by large chunks of text, which are split at the lines starting with ``*``,
+so that the data lines are never handled one by one until they are converted, and only the current block is held in
+memory.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+from typing import IO, Any, Callable, Iterator
+
+#: The size of the read buffer of the input files
+BUFFER_SIZE = 1 << 22
+
+#: The keywords whose data is bulk data, it is not parsed when ``bulk=False``
+BULK_KEYWORDS = frozenset(
+    {"NODE", "ELEMENT", "NSET", "ELSET", "NCOPY", "NFILL", "NGEN", "NMAP", "ELCOPY", "ELGEN", "SURFACE", "RIGID BODY"}
+)
+
+#: The number of characters of data lines converted at once
+CHUNK_SIZE = 1 << 23
+
+# Quoted parameter values may contain commas
+QUOTED_FIELDS = re.compile(r'(?:[^,"]|"[^"]*")+')
+
+# A data line of an element ending with a comma is continued on the next line
+CONTINUATION = re.compile(r",[ \t\r]*\n")
+
+
+def normalize(name: str) -> str:
+    """The normalized name of a keyword or parameter: upper case, without the leading ``*`` and with single spaces.
+
+    Examples
+    --------
+    >>> normalize("*End  step")
+    'END STEP'
+    """
+    return " ".join(name.lstrip("*").split()).upper()
+
+
+def parse_keyword_line(line: str) -> tuple[str, dict[str, str]]:
+    """Split a keyword line into the name of the keyword and its parameters, the names of the parameters are lower
+    case and the value of a parameter without a value is an empty string.
+
+    Examples
+    --------
+    >>> parse_keyword_line("*Element, type=C3D8R, ELSET=Part-1")
+    ('Element', {'type': 'C3D8R', 'elset': 'Part-1'})
+    """
+    fields = QUOTED_FIELDS.findall(line) if '"' in line else line.split(",")
+    parameters = {}
+    for field in fields[1:]:
+        name, _, value = field.partition("=")
+        if name.strip():
+            parameters[" ".join(name.split()).lower()] = value.strip()
+    return fields[0].strip().lstrip("*").strip(), parameters
+
+
+def value(text: str) -> Any:
+    """Convert a field of a data line to an int, a float or a stripped string."""
+    try:
+        return int(text)
+    except ValueError:
+        try:
+            return float(text)
+        except ValueError:
+            return text.strip()
+
+
+def _ints(fields: list[str]) -> tuple:
+    return tuple(map(int, fields))
+
+
+def _labeled_floats(fields: list[str]) -> tuple:
+    return (int(fields[0]), *map(float, fields[1:]))
+
+
+def _floats(fields: list[str]) -> tuple:
+    return tuple(map(float, fields))
+
+
+def _values(fields: list[str]) -> tuple:
+    return tuple(map(value, fields))
+
+
+#: The converters of the data lines, from the most to the least specific one
+CONVERTERS: tuple[Callable[[list[str]], tuple], ...] = (_ints, _labeled_floats, _floats, _values)
+
+
+def convert_lines(
+    lines: list[str], converters: tuple[Callable[[list[str]], tuple], ...] = CONVERTERS
+) -> tuple[tuple, ...]:
+    """Convert data lines to tuples of values.
+
+    The lines of a block usually share the same layout, so the converter of the previous line is tried first, and
+    the following converters only if it fails.
+    """
+    rows = []
+    for line in lines:
+        fields = line.split(",")
+        if not fields[-1].strip():  # A trailing comma
+            fields.pop()
+        for converter in converters:
+            try:
+                rows.append(converter(fields))
+                break
+            except (ValueError, IndexError):
+                continue
+        converters = converters[converters.index(converter) :]
+    return tuple(rows)
+
+
+class Block:
+    """A keyword line of an input file with its data lines and comments.
+
+    The data lines are converted by chunks of about :data:`CHUNK_SIZE` characters while the block is read, so that
+    the text of at most one chunk is held in memory. With ``array=True``, the chunks of numeric data lines with the
+    same number of fields are converted at once to typed arrays, see
+    :func:`abaqus.InputFileParser.AbaqusNDarray.parse_text`, and the block falls back to tuples if a chunk is not
+    suitable.
+    """
+
+    __slots__ = (
+        "name",
+        "key",
+        "parameter",
+        "text",
+        "size",
+        "rows",
+        "arrays",
+        "dtype",
+        "colZeroIsInt",
+        "comments",
+        "file",
+        "line",
+        "offset",
+        "digest",
+    )
+
+    def __init__(
+        self, name: str, parameter: dict[str, str], file: str, line: int, array: bool = False, offset: int = 0
+    ):
+        self.name, self.key, self.parameter, self.file, self.line = name, normalize(name), parameter, file, line
+        self.offset = offset
+        self.text: list[str] = []
+        self.size = 0
+        self.rows: list[tuple] = []
+        self.arrays: list[Any] | None = [] if array else None
+        self.dtype: Any = None
+        self.colZeroIsInt = False
+        self.comments: list[str] = []
+        self.digest: Any = None  # The hash of the data lines, if they are hashed instead of being converted
+
+    def append(self, text: str) -> None:
+        """Append data lines, they are converted when the chunk is large enough."""
+        self.text.append(text)
+        self.size += len(text)
+        if self.size >= CHUNK_SIZE:
+            self.flush(final=False)
+
+    def flush(self, final: bool = True) -> None:
+        """Convert the data lines read so far, the last line of an element is kept if it is continued."""
+        text, self.text, self.size = "".join(self.text), [], 0
+        if self.key == "ELEMENT":
+            text = CONTINUATION.sub(",", text)
+            if not final and text.rstrip().endswith(","):
+                cut = text.rfind("\n") + 1
+                text, self.text, self.size = text[:cut], [text[cut:]], len(text) - cut
+        if not text.strip():
+            return
+        # The first column of the nodes is the label, the other ones are the coordinates
+        converters = CONVERTERS[1:] if self.key == "NODE" else CONVERTERS
+        if self.arrays is not None:
+            array = self._array(text, converters)
+            if array is not None:
+                self.arrays.append(array)
+                return
+            self.rows, self.arrays = self.tuples(), None
+        self.rows.extend(convert_lines([line for line in text.splitlines() if line.strip()], converters))
+
+    def tuples(self) -> list[tuple]:
+        """The data lines converted so far as tuples, even if they were converted to arrays."""
+        if self.arrays is None:
+            return self.rows
+        from .AbaqusNDarray import AbaqusNDarray
+
+        return [tuple(row) for array in self.arrays for row in AbaqusNDarray(array, self.colZeroIsInt).tolist()]
+
+    def merge(self, other: Block) -> None:
+        """Append the data lines and comments of the next part of the block, which was converted on its own."""
+        self.comments.extend(other.comments)
+        if self.arrays is not None and other.arrays is not None:
+            if not self.arrays:
+                self.arrays, self.dtype, self.colZeroIsInt = other.arrays, other.dtype, other.colZeroIsInt
+                return
+            layout = (self.dtype, self.colZeroIsInt, self.arrays[0].shape[1])
+            if not other.arrays or layout == (other.dtype, other.colZeroIsInt, other.arrays[0].shape[1]):
+                self.arrays.extend(other.arrays)
+                return
+        self.rows, self.arrays = self.tuples() + other.tuples(), None
+
+    def _array(self, text: str, converters: tuple[Callable[[list[str]], tuple], ...]) -> Any:
+        from .AbaqusNDarray import np, parse_text
+
+        if self.dtype is None:  # The type of the array is the type of the first line
+            (row,) = convert_lines([next(line for line in text.splitlines() if line.strip())], converters)
+            if not all(isinstance(value, (int, float)) for value in row):
+                return None
+            self.colZeroIsInt = isinstance(row[0], int) and any(isinstance(value, float) for value in row)
+            self.dtype = np.int64 if all(isinstance(value, int) for value in row) else np.float64
+        array = parse_text(text, self.dtype)
+        if array is not None and self.arrays and array.shape[1] != self.arrays[0].shape[1]:
+            return None
+        return array
+
+
+def scan(file: IO[str], size: int | None = None) -> Iterator[tuple[bool, str]]:
+    """Split the text of a file into the lines starting with ``*`` and the runs of lines between them, at most
+    ``size`` characters are read from the current position.
+
+    Yields
+    ------
+    tuple[bool, str]
+        Whether the text is a line starting with ``*``, and the text with its line breaks.
+    """
+    rest = ""
+    while size is None or size > 0:
+        chunk = file.read(BUFFER_SIZE if size is None else min(BUFFER_SIZE, size))
+        if not chunk:
+            break
+        if size is not None:
+            size -= len(chunk)
+        text = rest + chunk
+        cut = text.rfind("\n") + 1
+        text, rest = text[:cut], text[cut:]
+        yield from _split(text)
+    if rest:
+        yield from _split(rest + "\n")
+
+
+def _split(text: str) -> Iterator[tuple[bool, str]]:
+    start, size = 0, len(text)
+    while start < size:
+        if text[start] == "*":
+            end = text.find("\n", start) + 1
+            yield True, text[start:end]
+        else:
+            end = text.find("\n*", start) + 1 or size
+            yield False, text[start:end]
+        start = end
+
+
+def read_blocks(
+    path: str,
+    directory: str = "",
+    *,
+    skip: Callable[[str], bool] | None = None,
+    includes: list[str] | None = None,
+    missing: list[str] | None = None,
+    verbose: bool = False,
+    array: bool = False,
+    offset: int = 0,
+    lineno: int = 1,
+    follow: bool = True,
+    size: int | None = None,
+    current: Block | None = None,
+    digest: bool = False,
+) -> Iterator[Block]:
+    """Read the keyword blocks of an input file, the ``*INCLUDE`` keywords are replaced by the blocks of the included
+    files.
+
+    Parameters
+    ----------
+    path : str
+        The path of the input file.
+    directory : str, optional
+        The directory the relative paths of the included files are resolved against first, then against the directory
+        of the including file.
+    skip : Callable[[str], bool], optional
+        A function of the normalized name of a keyword returning whether its data lines are skipped.
+    includes, missing : list[str], optional
+        The lists the paths of the included files, and of the included files that could not be found, are appended to.
+    verbose : bool, optional
+        Whether to print the errors, by default False.
+    array : bool, optional
+        Whether to convert the numeric data lines to arrays, see :class:`Block`, by default False.
+    offset, lineno : int, optional
+        The offset in bytes and the number of the line the file is read from, e.g. the offset and line of a keyword
+        line, by default the start of the file.
+    follow : bool, optional
+        Whether to replace the ``*INCLUDE`` keywords by the blocks of the included files, otherwise they are yielded
+        as blocks, by default True.
+    size : int, optional
+        The number of bytes read from the offset, by default the rest of the file.
+    current : Block, optional
+        The block the data lines at the offset belong to, when the file is read from the middle of a block.
+    digest : bool, optional
+        Whether to hash the raw bytes of the data lines of the blocks into their ``digest`` instead of converting
+        them, by default False.
+
+    Yields
+    ------
+    Block
+        The keyword blocks in deck order.
+    """
+    block: Block | None = current
+    keep = current is None or skip is None or not skip(current.key)
+    number = lineno - 1  # The number of the last line read
+    position = offset  # The offset of the text read, the files are read without newline translation
+
+    def start(line: str, offset: int) -> Iterator[Block]:
+        nonlocal block, keep
+        if block is not None:
+            yield block
+        block = None
+        name, parameter = parse_keyword_line(line)
+        if follow and normalize(name) == "INCLUDE":
+            yield from _include(parameter, path, directory, skip, includes, missing, verbose, array, digest)
+            return
+        block = Block(name, parameter, path, number, array, offset)
+        if digest:
+            block.digest = hashlib.blake2b(digest_size=16)
+        keep = skip is None or not skip(block.key)
+
+    with open(path, encoding="latin-1", newline="") as file:
+        file.seek(offset)
+        pending, origin = None, 0  # A keyword line continued on the next lines, and its offset
+        for star, text in scan(file, size):
+            region, position = position, position + len(text)
+            while pending is not None and text and not star:
+                line, _, text = text.partition("\n")
+                number += 1
+                pending += line.rstrip()
+                if not pending.endswith(","):
+                    yield from start(pending, origin)
+                    pending = None
+            if pending is not None and star:
+                yield from start(pending, origin)
+                pending = None
+            if not text:
+                continue
+            if star:
+                number += 1
+                line = text.rstrip()
+                if line.startswith("**"):
+                    if block is not None:
+                        block.comments.append(line[2:].strip())
+                elif line.endswith(","):
+                    pending, origin = line, region
+                else:
+                    yield from start(line, region)
+                continue
+            number += text.count("\n")
+            if block is None:
+                if verbose and text.strip():
+                    print(f"{path}:{number}: data lines without a keyword: {text.strip().splitlines()[0]}")
+            elif block.digest is not None:
+                block.digest.update(text.encode("latin-1"))
+            elif keep:
+                block.append(text)
+        if pending is not None:
+            yield from start(pending, origin)
+    if block is not None:
+        yield block
+
+
+def resolve_include(name: str, path: str, directory: str = "") -> str | None:
+    """The path of a file included by an input file, resolved against ``directory`` first, then against the directory
+    of the including file, or None if it cannot be found."""
+    candidates = [os.path.join(directory, name), os.path.join(os.path.dirname(path), name)]
+    return next((candidate for candidate in candidates if os.path.isfile(candidate)), None)
+
+
+def _include(
+    parameter: dict[str, str],
+    path: str,
+    directory: str,
+    skip: Callable[[str], bool] | None,
+    includes: list[str] | None,
+    missing: list[str] | None,
+    verbose: bool,
+    array: bool,
+    digest: bool,
+) -> Iterator[Block]:
+    name = parameter.get("input", "").strip('"')
+    found = resolve_include(name, path, directory)
+    if found is None:
+        if missing is not None:
+            missing.append(name)
+        if verbose:
+            print(f"{path}: included file not found: {name}")
+        return
+    if includes is not None:
+        includes.append(found)
+    yield from read_blocks(
+        found, directory, skip=skip, includes=includes, missing=missing, verbose=verbose, array=array, digest=digest
+    )
@@ -0,0 +1,243 @@
+"""Model statistics of an input file, for ``InputFile.stats`` and ``abqpy inpstat``.
+
+The input file and its included files are memory mapped and scanned once for the lines starting with ``*``. Only the
+keyword lines are decoded, the data lines of the ``*NODE`` and ``*ELEMENT`` blocks are counted by counting the line
+breaks of their bytes, and the data lines of the other keywords are skipped, so that no keyword is built. The nodes and
+elements of a part are counted once for every instance of the part.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import re
+from typing import NamedTuple
+
+from ._reader import normalize, parse_keyword_line, resolve_include
+
+#: The number of bytes counted at once
+WINDOW_SIZE = 1 << 22
+
+#: The empty or whitespace only lines following a line break, they are not data lines
+BLANK_LINE = re.compile(rb"\n[ \t\r]*(?=\n)")
+
+#: The keywords requesting output, ``*OUTPUT`` is reported as ``FIELD OUTPUT`` or ``HISTORY OUTPUT``
+OUTPUT_KEYWORDS = frozenset(
+    {
+        "OUTPUT",
+        "NODE OUTPUT",
+        "ELEMENT OUTPUT",
+        "CONTACT OUTPUT",
+        "ENERGY OUTPUT",
+        "INTEGRATED OUTPUT",
+        "INCREMENTATION OUTPUT",
+        "RADIATION OUTPUT",
+        "NODE PRINT",
+        "EL PRINT",
+        "CONTACT PRINT",
+        "ENERGY PRINT",
+        "NODE FILE",
+        "EL FILE",
+        "CONTACT FILE",
+        "ENERGY FILE",
+    }
+)
+
+#: The degrees of freedom of the nodes of the element types, by pattern of the element type, the first match is used
+DOF_PER_NODE: list[tuple[re.Pattern, int]] = [
+    (re.compile(r"DC|DS|DCC|DCOUP|AC"), 1),  # Heat transfer, mass diffusion and acoustic elements
+    (re.compile(r"(C3D|CPE|CPS|CAX|CGAX)\d+[A-Z]*[TPE]"), 4),  # Coupled temperature and pore pressure elements
+    (re.compile(r"S\d|STRI|B3|PIPE3|ELBOW|FRAME3D"), 6),
+    (re.compile(r"C3D|SC\d|M3D|SFM3D|T3D|COH3D|SAX|CGAX|B2|PIPE2|FRAME2D"), 3),
+    (re.compile(r"CPE|CPS|CAX|CPEG|T2D|COH2D|COHAX|MAX|SFMAX"), 2),
+    (re.compile(r"R2D|R3D|RAX"), 0),  # The nodes of rigid elements follow their reference node
+]
+
+
+class DeckStats(NamedTuple):
+    """The model statistics of an input file and its included files."""
+
+    #: The number of nodes
+    nodes: int
+
+    #: The number of elements, by element type
+    elements: dict[str, int]
+
+    #: The number of node sets and element sets, by keyword
+    sets: dict[str, int]
+
+    #: The number of surfaces
+    surfaces: int
+
+    #: The number of materials
+    materials: int
+
+    #: The number of steps
+    steps: int
+
+    #: The number of output requests, by keyword
+    outputs: dict[str, int]
+
+    #: The estimated number of degrees of freedom, the nodes times the largest number of degrees of freedom per node of
+    #: the element types, see :data:`DOF_PER_NODE`
+    dof: int
+
+    #: The number of parts and instances
+    parts: int
+    instances: int
+
+    #: The absolute paths of the included files, and the included files that could not be found
+    includes: list[str]
+    missing: list[str]
+
+
+def dof_per_node(elementType: str) -> int | None:
+    """The degrees of freedom of the nodes of an element type, or None if it is unknown, e.g. ``SPRING1``."""
+    key = elementType.upper()
+    return next((dof for pattern, dof in DOF_PER_NODE if pattern.match(key)), None)
+
+
+def count_lines(view: mmap.mmap, start: int, end: int, continued: bool = False) -> int:
+    """Count the data lines between two offsets, the lines ending with a comma are not counted if ``continued``, the
+    empty lines are not counted."""
+    lines = 0
+    while start < end:
+        stop = view.rfind(b"\n", start, min(end, start + WINDOW_SIZE)) + 1 or min(end, start + WINDOW_SIZE)
+        window = view[start:stop]
+        lines += window.count(b"\n") + (not window.endswith(b"\n"))
+        # The windows start at the beginning of a line, the last line of the block may not end with a line break
+        lines -= len(BLANK_LINE.findall(b"\n" + window))
+        lines -= not window.endswith(b"\n") and not window[window.rfind(b"\n") + 1 :].strip()
+        if continued:
+            lines -= window.count(b",\n") + window.count(b",\r\n")
+        start = stop
+    return lines
+
+
+def deck_stats(path: str, directory: str = "") -> DeckStats:
+    """Scan an input file and its included files once for their model statistics.
+
+    Parameters
+    ----------
+    path : str
+        The path of the input file.
+    directory : str, optional
+        The directory the relative paths of the included files are resolved against first.
+
+    Returns
+    -------
+    DeckStats
+        The model statistics.
+    """
+    totals = {"nodes": 0, "surfaces": 0, "materials": 0, "steps": 0, "parts": 0, "instances": 0}
+    elements: dict[str, int] = {}
+    sets = {"NSET": 0, "ELSET": 0}
+    outputs: dict[str, int] = {}
+    includes: list[str] = []
+    missing: list[str] = []
+    parts: dict[str, tuple[int, dict[str, int]]] = {}  # The nodes and elements of the parts, by name
+    part: tuple[str, int, dict[str, int]] | None = None  # The name, nodes and elements of the current part
+
+    def add(nodes: int, types: dict[str, int]) -> None:
+        nonlocal part
+        if part is None:
+            totals["nodes"] += nodes
+            for name, count in types.items():
+                elements[name] = elements.get(name, 0) + count
+        else:
+            counts = dict(part[2])
+            for name, count in types.items():
+                counts[name] = counts.get(name, 0) + count
+            part = (part[0], part[1] + nodes, counts)
+
+    def keyword(key: str, parameter: dict[str, str], file: str) -> None:
+        nonlocal part
+        if key == "PART":
+            totals["parts"] += 1
+            part = (normalize(parameter.get("name", "").strip('"')), 0, {})
+        elif key == "END PART" and part is not None:
+            parts[part[0]] = part[1:]
+            part = None
+        elif key == "INSTANCE":
+            totals["instances"] += 1
+            add(*parts.get(normalize(parameter.get("part", "").strip('"')), (0, {})))
+        elif key in ("NSET", "ELSET"):
+            sets[key] += 1
+        elif key in ("SURFACE", "MATERIAL", "STEP"):
+            totals[key.lower() + "s"] += 1
+        elif key in OUTPUT_KEYWORDS:
+            name = ("HISTORY " if "history" in parameter else "FIELD ") + key if key == "OUTPUT" else key
+            outputs[name] = outputs.get(name, 0) + 1
+        elif key == "INCLUDE":
+            name = parameter.get("input", "").strip('"')
+            found = resolve_include(name, file, directory)
+            if found is None:
+                missing.append(name)
+            else:
+                includes.append(found)
+                scan(found)
+
+    def scan(file: str) -> None:
+        with open(file, "rb") as stream:
+            if not os.fstat(stream.fileno()).st_size:
+                return
+            with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                size, position, counted = len(view), 0, None
+                while position < size:
+                    star = position  # The offset of the next line starting with *
+                    if view[position : position + 1] != b"*":
+                        star = view.find(b"\n*", position) + 1 or size
+                    if counted is not None and star > position:  # The data lines of a *NODE or *ELEMENT block
+                        lines = count_lines(view, position, star, continued=counted != "NODE")
+                        if counted == "NODE":
+                            add(lines, {})
+                        else:
+                            add(0, {counted: lines})
+                    if star == size:
+                        break
+                    end = view.find(b"\n", star) + 1 or size
+                    if view[star : star + 2] == b"**":  # A comment line inside the block
+                        position = end
+                        continue
+                    while view[star:end].rstrip().endswith(b",") and end < size:  # A continued keyword line
+                        end = view.find(b"\n", end) + 1 or size
+                    name, parameter = parse_keyword_line(view[star:end].decode("latin-1").replace("\n", ""))
+                    key = normalize(name)
+                    counted = key if key == "NODE" else parameter.get("type", "").upper() if key == "ELEMENT" else None
+                    keyword(key, parameter, file)
+                    position = end
+
+    scan(os.path.abspath(path))
+    if not totals["instances"]:  # The parts of an input file without assembly are counted once
+        for counts in parts.values():
+            add(*counts)
+    dofs = [dof_per_node(name) for name in elements]
+    dof = max((dof for dof in dofs if dof is not None), default=3)
+    return DeckStats(
+        totals["nodes"],
+        elements,
+        sets,
+        totals["surfaces"],
+        totals["materials"],
+        totals["steps"],
+        outputs,
+        totals["nodes"] * dof,
+        totals["parts"],
+        totals["instances"],
+        includes,
+        missing,
+    )
+
+
+def format_stats(stats: DeckStats) -> str:
+    """Format the model statistics of an input file as a report."""
+    lines = [f"{'nodes':<24}{stats.nodes:>12,}", f"{'elements':<24}{sum(stats.elements.values()):>12,}"]
+    lines.extend(f"  {name:<22}{count:>12,}" for name, count in sorted(stats.elements.items()))
+    lines.extend(f"{name.lower() + 's':<24}{count:>12,}" for name, count in stats.sets.items())
+    for name in ("surfaces", "materials", "steps", "parts", "instances"):
+        lines.append(f"{name:<24}{getattr(stats, name):>12,}")
+    lines.append(f"{'output requests':<24}{sum(stats.outputs.values()):>12,}")
+    lines.extend(f"  {name.lower():<22}{count:>12,}" for name, count in sorted(stats.outputs.items()))
+    lines.append(f"{'estimated DOF':<24}{stats.dof:>12,}")
+    lines.extend(f"{'missing include':<24}{name:>12}" for name in stats.missing)
+    return "\n".join(lines)
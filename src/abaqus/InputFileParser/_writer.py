@@ -0,0 +1,107 @@
+"""Writer of Abaqus input files, it turns keywords back into keyword lines, data lines and comment lines.
+
+The data lines hold at most :data:`ENTRIES_PER_LINE` entries, and a row with more entries, e.g. an element with more
+than 15 nodes, is continued on the next lines, each line but the last one ending with a comma. The arrays are written
+by chunks of rows formatted at once with a single format string, as :func:`numpy.savetxt` does for each row.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import IO, TYPE_CHECKING, Any, Iterable, Sequence
+
+from .AbaqusNDarray import AbaqusNDarray, np
+
+if TYPE_CHECKING:
+    from .Keyword import Keyword
+
+#: The maximum number of entries of a data line
+ENTRIES_PER_LINE = 16
+
+#: The number of rows of an array formatted at once
+CHUNK_ROWS = 1 << 15
+
+
+def keyword_line(name: str, parameter: dict[str, str] | None = None) -> str:
+    """Format a keyword line, a parameter without a value is written without ``=``.
+
+    Examples
+    --------
+    >>> keyword_line("Element", {"type": "C3D8R", "elset": "EALL"})
+    '*Element, type=C3D8R, elset=EALL\\n'
+    """
+    parameters = "".join(f", {key}={value}" if value else f", {key}" for key, value in (parameter or {}).items())
+    return f"*{name}{parameters}\n"
+
+
+def row_format(formats: Sequence[str]) -> str:
+    """Join the formats of the entries of a row, with a line break after every :data:`ENTRIES_PER_LINE` entries."""
+    lines = [", ".join(formats[i : i + ENTRIES_PER_LINE]) for i in range(0, len(formats), ENTRIES_PER_LINE)]
+    return ",\n".join(lines) + "\n"
+
+
+def _format(value: Any) -> str:
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def write_rows(file: IO[str], rows: Iterable[Sequence[Any]]) -> None:
+    """Write data lines of values, the floats are written with the shortest representation reading back the same."""
+    for row in rows:
+        file.write(row_format([_format(value) for value in row]))
+
+
+def write_array(file: IO[str], array: AbaqusNDarray) -> None:
+    """Write the rows of an array by chunks of :data:`CHUNK_ROWS` rows."""
+    if array.ndim != 2 or not array.size:
+        return write_rows(file, array.tolist())
+    floats = array.dtype.kind == "f"
+    formats = ["%r" if floats else "%d"] * array.shape[1]
+    if floats and array.colZeroIsInt:
+        formats[0] = "%d"
+    fmt = row_format(formats)
+    for start in range(0, array.shape[0], CHUNK_ROWS):
+        chunk = array[start : start + CHUNK_ROWS]
+        # The values are converted to Python numbers, whose repr is the shortest one
+        file.write((fmt * len(chunk)) % tuple(np.asarray(chunk).ravel().tolist()))
+
+
+def write_keywords(
+    file: IO[str], keywords: Iterable[Keyword], path: str = "", includeSize: int = 0, included: list[str] | None = None
+) -> None:
+    """Write keywords and their suboptions, see :meth:`abaqus.InputFileParser.KeywordSequence.KeywordSequence.write`.
+
+    Parameters
+    ----------
+    file : IO[str]
+        The input file written.
+    keywords : Iterable[Keyword]
+        The keywords.
+    path : str, optional
+        The path of the input file, the included files are written next to it.
+    includeSize : int, optional
+        The number of data lines above which a keyword is written to an included file, by default 0, the keywords are
+        not written to included files.
+    included : list[str], optional
+        The list the paths of the included files written are appended to.
+    """
+    included = [] if included is None else included
+    for keyword in keywords:
+        data = keyword.data
+        if includeSize and len(data) > includeSize:
+            stem, _ = os.path.splitext(os.path.basename(path))
+            name = f"{stem}-{len(included) + 1}-{'-'.join(keyword.name.lower().split())}.inp"
+            included.append(os.path.join(os.path.dirname(path), name))
+            with open(included[-1], "w", encoding="latin-1", newline="\n") as include:
+                write_keywords(
+                    include, [type(keyword)(keyword.name, keyword.parameter, data, comments=keyword.comments)]
+                )
+            file.write(keyword_line("Include", {"input": name}))
+        else:
+            file.write(keyword_line(keyword.name, keyword.parameter))
+            if isinstance(data, AbaqusNDarray):
+                write_array(file, data)
+            else:
+                write_rows(file, data)
+            file.writelines(f"** {comment}\n" for comment in keyword.comments)
+        if keyword.suboptions:
+            write_keywords(file, keyword.suboptions, path, includeSize, included)
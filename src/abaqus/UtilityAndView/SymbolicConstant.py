@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from enum import Enum
+import sys
+from typing import TYPE_CHECKING, Any, Iterator
 
 from abqpy.decorators import abaqus_class_doc, abaqus_method_doc
 
@@ -68,7 +69,78 @@ class SymbolicConstant(str):
             return super().__new__(cls, name)
 
 
-class abaqusConstants(SymbolicConstant, Enum):
+class LazyEnumMeta(type):
+    """Metaclass of :class:`LazyEnum`, the string attributes defined in the class body are the member names and
+    values, the members are only created when they are accessed for the first time."""
+
+    _member_values_: dict[str, str]
+    _members_: dict[str, Any]
+
+    def __new__(mcs, name: str, bases: tuple, namespace: dict[str, Any]):
+        values = {key: value for key, value in namespace.items() if not key.startswith("_") and type(value) is str}
+        cls = super().__new__(mcs, name, bases, {k: v for k, v in namespace.items() if k not in values})
+        cls._member_values_ = {sys.intern(key): value for key, value in values.items()}
+        cls._members_ = {}
+        return cls
+
+    def __getattr__(cls, name: str) -> Any:
+        try:
+            value = cls._member_values_[name]
+        except KeyError:
+            raise AttributeError(f"type object {cls.__name__!r} has no attribute {name!r}") from None
+        member = super().__call__(value)
+        member._name_, member._value_ = name, value
+        # Only one member object is kept per name, even if it is created concurrently
+        member = cls._members_.setdefault(name, member)
+        type.__setattr__(cls, name, member)
+        return member
+
+    def __call__(cls, value: str) -> Any:
+        if value not in cls._member_values_:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}")
+        return getattr(cls, value)
+
+    def __getitem__(cls, name: str) -> Any:
+        if name not in cls._member_values_:
+            raise KeyError(name)
+        return getattr(cls, name)
+
+    def __iter__(cls) -> Iterator[Any]:
+        return (getattr(cls, name) for name in cls._member_values_)
+
+    def __len__(cls) -> int:
+        return len(cls._member_values_)
+
+    @property
+    def __members__(cls) -> dict[str, Any]:
+        return {name: getattr(cls, name) for name in cls._member_values_}
+
+
+if TYPE_CHECKING:
+    # Type checkers see an enumeration, so that the members can be used in ``Literal`` type annotations
+    from enum import Enum as LazyEnum
+else:
+
+    class LazyEnum(metaclass=LazyEnumMeta):
+        """A lightweight replacement of :class:`enum.Enum` for the thousands of Abaqus symbolic constants, creating an
+        :class:`enum.Enum` of this size is slow and memory-heavy."""
+
+        _name_: str
+        _value_: str
+
+        @property
+        def name(self) -> str:
+            return self._name_
+
+        @property
+        def value(self) -> str:
+            return self._value_
+
+        def __reduce_ex__(self, protocol: int):
+            return type(self), (self._value_,)
+
+
+class abaqusConstants(SymbolicConstant, LazyEnum):
     def __str__(self) -> str:
         return self.name
 
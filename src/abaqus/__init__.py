@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import auto_all
 
 from abqpy import run  # noqa
+from abqpy.lazy import lazy_attributes
 
 run(cae=True)
 auto_all.start_all()
@@ -11,23 +14,49 @@ from math import *  # noqa
 
 from .builtin import *  # noqa
 from .Canvas.Highlight import *  # noqa
-from .Mdb.Mdb import Mdb  # noqa
-from .Mdb.MdbCommands import *  # noqa
-from .Odb.Odb import Odb  # noqa
-from .Session.Session import Session  # noqa
-from .UtilityAndView import abaqusConstants  # noqa
-from .UtilityAndView.abaqusConstants import OFF, Boolean  # noqa
-from .UtilityAndView.AbaqusException import AbaqusException  # noqa
-from .UtilityAndView.BackwardCompatibility import BackwardCompatibility  # noqa
-from .UtilityAndView.SymbolicConstant import SymbolicConstant  # noqa
 from .UtilityAndView.User import *  # noqa
 
-session = Session()
-mdb = Mdb()
-
-backwardCompatibility = BackwardCompatibility()
-
-YES = abaqusConstants.YES
-NO = abaqusConstants.NO
-
 auto_all.end_all()
+
+if TYPE_CHECKING:
+    from .Mdb.Mdb import Mdb  # noqa
+    from .Mdb.MdbCommands import CombineOptResults, openMdb, upgradeMdb  # noqa
+    from .Odb.Odb import Odb  # noqa
+    from .Session.Session import Session  # noqa
+    from .UtilityAndView import abaqusConstants  # noqa
+    from .UtilityAndView.abaqusConstants import OFF, Boolean  # noqa
+    from .UtilityAndView.AbaqusException import AbaqusException  # noqa
+    from .UtilityAndView.BackwardCompatibility import BackwardCompatibility  # noqa
+    from .UtilityAndView.SymbolicConstant import SymbolicConstant  # noqa
+
+    session = Session()
+    mdb = Mdb()
+
+    backwardCompatibility = BackwardCompatibility()
+
+    YES = abaqusConstants.YES
+    NO = abaqusConstants.NO
+
+# The stubs of the Abaqus object model are imported when they are accessed for the first time
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "Mdb": ".Mdb.Mdb:Mdb",
+        "upgradeMdb": ".Mdb.MdbCommands:upgradeMdb",
+        "CombineOptResults": ".Mdb.MdbCommands:CombineOptResults",
+        "openMdb": ".Mdb.MdbCommands:openMdb",
+        "Odb": ".Odb.Odb:Odb",
+        "Session": ".Session.Session:Session",
+        "abaqusConstants": ".UtilityAndView.abaqusConstants",
+        "OFF": ".UtilityAndView.abaqusConstants:OFF",
+        "Boolean": ".UtilityAndView.abaqusConstants:Boolean",
+        "AbaqusException": ".UtilityAndView.AbaqusException:AbaqusException",
+        "BackwardCompatibility": ".UtilityAndView.BackwardCompatibility:BackwardCompatibility",
+        "SymbolicConstant": ".UtilityAndView.SymbolicConstant:SymbolicConstant",
+        "session": ".Session.Session:Session()",
+        "mdb": ".Mdb.Mdb:Mdb()",
+        "backwardCompatibility": ".UtilityAndView.BackwardCompatibility:BackwardCompatibility()",
+        "YES": ".UtilityAndView.abaqusConstants:YES",
+        "NO": ".UtilityAndView.abaqusConstants:NO",
+    },
+)
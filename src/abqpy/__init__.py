@@ -2,10 +2,20 @@ from __future__ import annotations
 
 from pathlib import Path
 from re import error as RegexError
+from typing import TYPE_CHECKING
 
-from .cli import AbqpyCLI, abaqus
+from .lazy import lazy_attributes
 from .run import run
 
+if TYPE_CHECKING:
+    from .cli import AbqpyCLI, abaqus
+    from .sweep import sweep
+
+# The command line interface is only imported when it is used, the type checking of its methods is expensive
+__getattr__, __dir__ = lazy_attributes(
+    __name__, {"AbqpyCLI": ".cli:AbqpyCLI", "abaqus": ".cli:abaqus", "sweep": ".sweep:sweep"}
+)
+
 try:
     from ._version import version as _default_version
 except ImportError:
@@ -32,6 +42,7 @@ __all__ = [
     "run",
     "abaqus",
     "AbqpyCLI",
+    "sweep",
     "__version__",
     "__semver__",
 ]
@@ -1,9 +1,11 @@
+import asyncio
 import sys
 
 import fire
 
 from .cli import AbqpyCLI
 from .config import config
+from .process import CommandResult
 
 
 def main():
@@ -11,7 +13,24 @@ def main():
     # Print to stdout, a workaround from https://github.com/google/python-fire/issues/188#issuecomment-1528976874
     fire.core.Display = lambda lines, out: out.write("\n".join(lines) + "\n")
     sys.tracebacklimit = config.cli_traceback_limit
-    fire.Fire(AbqpyCLI())
+    codes = []
+
+    def serialize(result):
+        # The awaitable commands are run to completion, the result of a command is not printed, its return code is
+        # used as the exit status instead, the cases of a batch that raised or were cancelled exit with 1
+        if asyncio.iscoroutine(result):
+            result = asyncio.run(result)
+        outcomes = (CommandResult, BaseException, type(None))
+        if isinstance(result, list) and result and all(isinstance(item, outcomes) for item in result):
+            codes.extend(item.returncode if isinstance(item, CommandResult) else 1 for item in result)
+            return None
+        if isinstance(result, CommandResult):
+            codes.append(result.returncode)
+            return None
+        return result
+
+    fire.Fire(AbqpyCLI(), serialize=serialize)
+    sys.exit(next((code for code in codes if code), 0))
 
 
 if __name__ == "__main__":
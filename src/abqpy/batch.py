@@ -0,0 +1,201 @@
+"""Run many Abaqus scripts or input files through a bounded pool of workers, see :meth:`abqpy.cli.AbqpyCLI.batch`."""
+
+from __future__ import annotations
+
+import glob
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Sequence, Union
+
+from .process import CommandResult
+
+if TYPE_CHECKING:
+    from .cli import AbqpyCLI
+
+#: The outcome of a case: its result, the error it raised, or None if it was cancelled before it started
+Outcome = Union[CommandResult, BaseException, None]
+
+
+def license_tokens(cpus: int) -> int:
+    """The number of Abaqus analysis license tokens checked out by an analysis on ``cpus`` cores."""
+    return int(5 * cpus**0.422)
+
+
+def collect_files(patterns: Sequence[str]) -> list[str]:
+    """Expand the glob patterns into a sorted list of files without duplicates, in the order of the patterns.
+
+    Raises
+    ------
+    FileNotFoundError
+        If a pattern does not match any file.
+    """
+    files: list[str] = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True))
+        if not matches:
+            raise FileNotFoundError(f"No files match {pattern!r}")
+        files += [os.path.abspath(file) for file in matches if os.path.abspath(file) not in files]
+    return files
+
+
+def batch_workers(cases: int, cpus: int = 1, workers: int | None = None, tokens: int | None = None) -> int:
+    """The number of cases to run at the same time, limited by the CPU count and the license token budget.
+
+    Parameters
+    ----------
+    cases : int
+        The number of cases.
+    cpus : int, optional
+        The number of CPUs used by each case, by default 1.
+    workers : int, optional
+        The maximum number of workers, by default the number of CPUs divided by ``cpus``.
+    tokens : int, optional
+        The license token budget, by default it is not limited.
+
+    Raises
+    ------
+    ValueError
+        If the token budget is less than the tokens of a single case.
+    """
+    limits = [cases, workers or max((os.cpu_count() or 1) // cpus, 1)]
+    if tokens is not None:
+        if tokens < license_tokens(cpus):
+            raise ValueError(f"A case on {cpus} CPUs needs {license_tokens(cpus)} license tokens, {tokens} available")
+        limits.append(tokens // license_tokens(cpus))
+    return max(min(limits), 1)
+
+
+def case_directories(files: Sequence[str], directory: str) -> list[str]:
+    """One working directory per file inside ``directory``, named after the file without its extension."""
+    names: dict[str, int] = {}
+    directories = []
+    for file in files:
+        name = os.path.splitext(os.path.basename(file))[0]
+        names[name] = names.get(name, 0) + 1
+        directories.append(os.path.join(directory, name if names[name] == 1 else f"{name}-{names[name]}"))
+    return directories
+
+
+def run_case(cli: AbqpyCLI, file: str, mode: str, cpus: int) -> CommandResult:
+    """Run an input file as an Abaqus job, or a script with ``abaqus cae noGUI`` or ``abaqus python``."""
+    if file.lower().endswith(".inp"):
+        job = os.path.splitext(os.path.basename(file))[0]
+        return cli.abaqus(job=job, input=file, cpus=cpus, interactive=True)
+    return cli.cae(file) if mode == "cae" else cli.python(file)
+
+
+def wait_cases(futures: Sequence[Future], cancel: threading.Event) -> None:
+    """Wait for the cases submitted to a pool of workers.
+
+    If the wait is interrupted, e.g. by Ctrl-C, ``cancel`` is set to terminate the commands of the running cases, the
+    pending cases are cancelled, and the :class:`KeyboardInterrupt` is raised again once the running cases stopped.
+    """
+    try:
+        wait(futures)
+    except KeyboardInterrupt:
+        cancel.set()
+        for future in futures:  # As Executor.shutdown(cancel_futures=True) does from Python 3.9
+            future.cancel()
+        wait(futures)
+        raise
+
+
+def outcome(future: Future) -> Any:
+    """The result of a finished case, the error it raised, or None if it was cancelled before it started."""
+    if future.cancelled():
+        return None
+    return future.exception() or future.result()
+
+
+def format_summary(cases: Sequence[str], results: Sequence[Outcome]) -> str:
+    """Format the status and timings of the cases of a batch as a table, followed by the errors of the cases."""
+    width = max([len(case) for case in cases] + [4])
+    header = f"{'case':<{width}}  {'status':<9}{'code':>6}{'wall [s]':>12}{'peak RSS [MiB]':>16}"
+    lines, errors = [header, "-" * len(header)], []
+    for case, result in zip(cases, results):
+        if not isinstance(result, CommandResult):
+            lines.append(f"{case:<{width}}  {'cancelled' if result is None else 'failed':<9}{'-':>6}{'-':>12}{'-':>16}")
+            if result is not None:
+                errors.append(f"{case}: {type(result).__name__}: {result}")
+            continue
+        status = "ok" if not result.returncode else "timeout" if result.timed_out else "failed"
+        status = "cancelled" if result.cancelled else status
+        rss = f"{result.peak_rss / 2**20:.1f}" if result.peak_rss is not None else "-"
+        lines.append(f"{case:<{width}}  {status:<9}{result.returncode:>6}{result.wall_time:>12.1f}{rss:>16}")
+    succeeded = sum(1 for result in results if isinstance(result, CommandResult) and not result.returncode)
+    cancelled = sum(1 for result in results if result is None or isinstance(result, CommandResult) and result.cancelled)
+    lines.append(f"{succeeded} of {len(results)} cases succeeded" + (f", {cancelled} cancelled" if cancelled else ""))
+    return "\n".join(lines + errors)
+
+
+def run_batch(
+    patterns: Sequence[str],
+    *,
+    mode: str = "cae",
+    cpus: int = 1,
+    workers: int | None = None,
+    tokens: int | None = None,
+    directory: str = "batch",
+    timeout: float | None = None,
+) -> tuple[list[str], list[Outcome]]:
+    """Run the files matching the glob patterns through a pool of workers, each one in its own working directory, and
+    print a summary of their status and timings.
+
+    The output of each case is written to ``abqpy.log`` in its working directory. If the batch is interrupted, e.g. by
+    Ctrl-C, the running cases are terminated, the pending ones are cancelled, and the :class:`KeyboardInterrupt` is
+    raised again after the summary is printed.
+
+    Parameters
+    ----------
+    patterns : Sequence[str]
+        The files or glob patterns of the Python scripts or input files (``.inp``) to run.
+    mode : str, optional
+        Run the scripts with ``abaqus cae noGUI`` (``"cae"``) or ``abaqus python`` (``"python"``), by default
+        ``"cae"``.
+    cpus : int, optional
+        The number of CPUs used by each case, passed to the input files, by default 1.
+    workers : int, optional
+        The maximum number of cases to run at the same time, by default the number of CPUs divided by ``cpus``.
+    tokens : int, optional
+        The license token budget of the batch, by default :envvar:`ABQPY_LICENSE_TOKENS` or not limited.
+    directory : str, optional
+        The directory of the working directories of the cases, by default ``"batch"``.
+    timeout : float, optional
+        The maximum wall time of each case in seconds, by default None.
+
+    Returns
+    -------
+    tuple[list[str], list[CommandResult | BaseException | None]]
+        The working directories and the results of the cases, the errors raised by the cases, or None for the cases
+        cancelled before they started.
+    """
+    from .cli import AbqpyCLI
+    from .config import config
+
+    if mode not in ("cae", "python"):
+        raise ValueError(f"mode must be 'cae' or 'python', got {mode!r}")
+    files = collect_files(patterns)
+    directories = case_directories(files, directory)
+    workers = batch_workers(len(files), cpus, workers, tokens if tokens is not None else config.license_tokens)
+    cancel = threading.Event()
+
+    def run(file: str, cwd: str) -> CommandResult:
+        os.makedirs(cwd, exist_ok=True)
+        with open(os.path.join(cwd, "abqpy.log"), "w") as log:
+
+            def write(line: str) -> None:
+                print(line, file=log, flush=True)
+
+            cli = AbqpyCLI(stdout=write, stderr=write, timeout=timeout, cancel=cancel, cwd=cwd)
+            return run_case(cli, file, mode, cpus)
+
+    print(f"Running {len(files)} cases with {workers} workers in {os.path.abspath(directory)}")
+    with ThreadPoolExecutor(workers) as executor:
+        futures = [executor.submit(run, file, cwd) for file, cwd in zip(files, directories)]
+        try:
+            wait_cases(futures, cancel)
+        finally:
+            results = [outcome(future) for future in futures]
+            print(format_summary([os.path.basename(directory) for directory in directories], results))
+    return directories, results
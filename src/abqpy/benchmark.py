@@ -0,0 +1,125 @@
+"""Benchmarks of the import time, peak memory and imported modules of the public entry points of abqpy.
+
+Every measurement runs in a fresh Python interpreter with ``ABQPY_SKIP_ABAQUS=true``, so that Abaqus is never
+called. A *cold* import compiles the modules from the sources into an empty bytecode cache directory, a *warm* import
+reuses the bytecode cache written by the cold import.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Any, Sequence
+
+#: The modules to benchmark by default
+MODULES = ["abaqus", "abaqusConstants", "odbAccess", "caeModules", "visualization", "abqpy.cli"]
+
+#: The code run by the child interpreter, it prints the measurements of importing ``sys.argv[1]`` as JSON
+_CHILD = """
+import json, sys, time
+from importlib import import_module
+
+before = len(sys.modules)
+start = time.perf_counter()
+import_module(sys.argv[1])
+elapsed = time.perf_counter() - start
+try:
+    import resource
+except ImportError:
+    rss = None
+else:
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+print(json.dumps({"import_time": elapsed, "peak_rss": rss, "modules": len(sys.modules) - before}))
+"""
+
+
+def measure_import(module: str, pycache: str | None = None) -> dict[str, Any]:
+    """Import a module in a fresh interpreter and measure it.
+
+    Parameters
+    ----------
+    module : str
+        The name of the module to import.
+    pycache : str, optional
+        The bytecode cache directory (``PYTHONPYCACHEPREFIX``) used by the interpreter, by default the
+        ``__pycache__`` directories next to the sources are used.
+
+    Returns
+    -------
+    dict[str, Any]
+        The ``import_time`` and the ``wall_time`` of the whole interpreter in seconds, the ``peak_rss`` of the
+        interpreter in bytes (None if it is not available on the platform) and the number of ``modules`` imported.
+    """
+    env = dict(os.environ, ABQPY_SKIP_ABAQUS="true", PYTHONPATH=os.pathsep.join(filter(None, sys.path)))
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    if pycache is not None:
+        env["PYTHONPYCACHEPREFIX"] = pycache
+    start = time.perf_counter()
+    output = subprocess.run([sys.executable, "-c", _CHILD, module], env=env, check=True, capture_output=True, text=True)
+    result = json.loads(output.stdout.splitlines()[-1])
+    result["wall_time"] = time.perf_counter() - start
+    return result
+
+
+def benchmark_imports(modules: Sequence[str] = MODULES, repeat: int = 5) -> dict[str, Any]:
+    """Benchmark the cold and warm imports of the modules.
+
+    Parameters
+    ----------
+    modules : Sequence[str], optional
+        The names of the modules to benchmark, by default :data:`MODULES`.
+    repeat : int, optional
+        The number of warm imports of each module, the best one is reported, by default 5.
+
+    Returns
+    -------
+    dict[str, Any]
+        A JSON serializable report with the environment of the benchmark and the ``results`` of each module.
+    """
+    from . import __version__
+
+    results = []
+    for module in modules:
+        with tempfile.TemporaryDirectory(prefix="abqpy-bench-") as pycache:
+            cold = measure_import(module, pycache)
+            warm = [measure_import(module, pycache) for _ in range(repeat)]
+        best = min(warm, key=lambda result: result["import_time"])
+        results.append(
+            {
+                "module": module,
+                "cold_import_time": cold["import_time"],
+                "warm_import_time": best["import_time"],
+                "wall_time": min(result["wall_time"] for result in warm),
+                "peak_rss": best["peak_rss"],
+                "modules": best["modules"],
+            }
+        )
+    return {
+        "abqpy": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """Format a report of :func:`benchmark_imports` as a table."""
+    header = f"{'module':<16}{'cold [ms]':>12}{'warm [ms]':>12}{'wall [ms]':>12}{'peak RSS [MiB]':>16}{'modules':>10}"
+    lines = [f"abqpy {report['abqpy']}, Python {report['python']} on {report['platform']}", header, "-" * len(header)]
+    for result in report["results"]:
+        rss = f"{result['peak_rss'] / 2**20:.1f}" if result["peak_rss"] is not None else "-"
+        lines.append(
+            f"{result['module']:<16}{result['cold_import_time'] * 1e3:>12.1f}{result['warm_import_time'] * 1e3:>12.1f}"
+            f"{result['wall_time'] * 1e3:>12.1f}{rss:>16}{result['modules']:>10}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,222 @@
+"""Content-hash cache of the outputs of the scripts submitted by :func:`abqpy.run`, enabled by
+:envvar:`ABQPY_CACHE_DIR`.
+
+A submission is identified by the hash of the script, its arguments, the Abaqus command and its options, and the
+contents of the declared input files. When a submission succeeds, its declared output files are stored in the cache,
+and an identical submission restores them instead of running Abaqus again. The least recently used entries are evicted
+when the cache exceeds its size limit.
+"""
+
+from __future__ import annotations
+
+import glob
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from typing import Any, Sequence
+
+#: The file describing a cache entry, its modification time is the last time the entry was used
+MANIFEST = "manifest.json"
+
+UNITS = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+
+
+def parse_size(size: int | str) -> int:
+    """Parse a size in bytes with an optional binary unit suffix, e.g. ``"512M"`` or ``"10G"``."""
+    text = str(size).strip().upper().rstrip("IB") if not isinstance(size, int) else str(size)
+    number, unit = (text[:-1], text[-1]) if text[-1:] in UNITS else (text, "")
+    return int(float(number) * UNITS[unit])
+
+
+def file_digest(path: str) -> str:
+    """The SHA-256 hash of the content of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def expand(patterns: Sequence[str], cwd: str = ".") -> list[str]:
+    """The sorted paths relative to ``cwd`` of the files matching the glob patterns."""
+    files = {
+        os.path.relpath(path, cwd)
+        for pattern in patterns
+        for path in glob.glob(os.path.join(cwd, pattern), recursive=True)
+        if os.path.isfile(path)
+    }
+    return sorted(files)
+
+
+def submission_key(
+    script: str,
+    argv: Sequence[str],
+    command: str,
+    options: dict[str, Any],
+    inputs: Sequence[str] = (),
+    outputs: Sequence[str] = (),
+) -> str:
+    """The hash identifying a submission of a script to Abaqus.
+
+    Parameters
+    ----------
+    script : str
+        The path of the script.
+    argv : Sequence[str]
+        The arguments of the script.
+    command : str
+        The Abaqus command running the script, ``cae`` or ``python``.
+    options : dict[str, Any]
+        The options of the Abaqus command.
+    inputs : Sequence[str], optional
+        The glob patterns of the input files whose content is hashed, relative to the current working directory.
+    outputs : Sequence[str], optional
+        The glob patterns of the output files stored in the cache.
+
+    Returns
+    -------
+    str
+        The hexadecimal SHA-256 hash of the submission.
+    """
+    submission = {
+        "script": file_digest(script),
+        "argv": list(argv),
+        "command": command,
+        "abaqus": os.environ.get("ABAQUS_BAT_PATH", "abaqus"),
+        "options": options,
+        "inputs": {path: file_digest(path) for path in expand(inputs)},
+        "outputs": sorted(outputs),
+    }
+    return hashlib.sha256(json.dumps(submission, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class ResultCache:
+    """A directory of cache entries, one subdirectory named after the submission key per entry.
+
+    Parameters
+    ----------
+    directory : str
+        The directory of the cache.
+    size : int, optional
+        The maximum size of the cache in bytes, the least recently used entries are evicted when it is exceeded, by
+        default it is not limited.
+    """
+
+    def __init__(self, directory: str, size: int | None = None):
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self.size = size
+
+    def entries(self) -> list[dict[str, Any]]:
+        """The entries of the cache, from the most to the least recently used."""
+        entries = []
+        for key in os.listdir(self.directory) if os.path.isdir(self.directory) else ():
+            if key.startswith("."):  # The entries being stored
+                continue
+            manifest = os.path.join(self.directory, key, MANIFEST)
+            try:
+                with open(manifest) as file:
+                    entry = json.load(file)
+                entry.update(key=key, used=os.path.getmtime(manifest))
+            except (OSError, ValueError):
+                continue
+            entries.append(entry)
+        return sorted(entries, key=lambda entry: entry["used"], reverse=True)
+
+    def restore(self, key: str, cwd: str = ".") -> list[str] | None:
+        """Copy the output files of an entry to ``cwd``.
+
+        Returns
+        -------
+        list[str] | None
+            The restored files, or None if the entry is not in the cache.
+        """
+        entry = os.path.join(self.directory, key)
+        try:
+            with open(os.path.join(entry, MANIFEST)) as file:
+                files = json.load(file)["files"]
+            for path in files:
+                target = os.path.join(cwd, path)
+                os.makedirs(os.path.dirname(os.path.abspath(target)), exist_ok=True)
+                shutil.copy2(os.path.join(entry, "files", path), target)
+            os.utime(os.path.join(entry, MANIFEST))
+        except (OSError, ValueError):
+            return None
+        return files
+
+    def store(
+        self, key: str, outputs: Sequence[str], script: str = "", cwd: str = ".", since: float | None = None
+    ) -> list[str]:
+        """Copy the files matching the output glob patterns from ``cwd`` to a new entry, then evict the least recently
+        used entries if the cache is too large.
+
+        Parameters
+        ----------
+        key : str
+            The submission key of the entry.
+        outputs : Sequence[str]
+            The glob patterns of the output files, relative to ``cwd``.
+        script : str, optional
+            The path of the submitted script, recorded in the manifest of the entry.
+        cwd : str, optional
+            The directory the output files are written to, by default the current working directory.
+        since : float, optional
+            The time the submission was launched at, the files modified before it are left over from previous runs and
+            are not stored, by default all the matching files are stored.
+
+        Returns
+        -------
+        list[str]
+            The stored files, no entry is created if there is none.
+        """
+        files = [
+            path for path in expand(outputs, cwd) if since is None or os.path.getmtime(os.path.join(cwd, path)) >= since
+        ]
+        if not files:
+            return files
+        os.makedirs(self.directory, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix=".tmp-", dir=self.directory)
+        try:
+            for path in files:
+                target = os.path.join(staging, "files", path)
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                shutil.copy2(os.path.join(cwd, path), target)
+            size = sum(os.path.getsize(os.path.join(staging, "files", path)) for path in files)
+            with open(os.path.join(staging, MANIFEST), "w") as file:
+                json.dump({"script": script, "files": files, "size": size, "created": time.time()}, file)
+            # Another process may have stored the same submission in the meantime
+            if os.path.isdir(os.path.join(self.directory, key)):
+                shutil.rmtree(os.path.join(self.directory, key))
+            os.replace(staging, os.path.join(self.directory, key))
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+        if self.size is not None:
+            self.prune(self.size)
+        return files
+
+    def clear(self) -> int:
+        """Remove all the entries of the cache and return their number."""
+        entries = self.entries()
+        for entry in entries:
+            shutil.rmtree(os.path.join(self.directory, entry["key"]), ignore_errors=True)
+        return len(entries)
+
+    def prune(self, size: int = 0) -> list[str]:
+        """Evict the least recently used entries until the cache is not larger than ``size`` bytes.
+
+        Returns
+        -------
+        list[str]
+            The keys of the evicted entries.
+        """
+        evicted = []
+        entries = self.entries()
+        total = sum(entry["size"] for entry in entries)
+        while entries and total > size:
+            entry = entries.pop()
+            shutil.rmtree(os.path.join(self.directory, entry["key"]), ignore_errors=True)
+            total -= entry["size"]
+            evicted.append(entry["key"])
+        return evicted
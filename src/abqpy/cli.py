@@ -1,12 +1,41 @@
 from __future__ import annotations
 
+import importlib
+import json
 import os
+import shlex
+import subprocess
+import sys
+import threading
+import time
+from types import ModuleType
 
-from typeguard import typechecked
 from typing_extensions import Self
 
+from .cache import ResultCache, parse_size
+from .process import CommandResult, OutputCallback, arun_command, run_command
+from .typecheck import typecheck
 
-@typechecked
+
+def _quote(arg: str) -> str:
+    """Quote an argument of a shell command line, so that the paths with spaces or shell characters are passed as one
+    argument."""
+    return subprocess.list2cmdline([arg]) if sys.platform == "win32" else shlex.quote(arg)
+
+
+def _import_input_file_parser(name: str) -> ModuleType:
+    """Import a module of ``abaqus.InputFileParser``, without running the current script with Abaqus as importing
+    ``abaqus`` does."""
+    from .config import config
+
+    skip, config.skip_abaqus = config.skip_abaqus, True
+    try:
+        return importlib.import_module(f"abaqus.InputFileParser.{name}")
+    finally:
+        config.skip_abaqus = skip
+
+
+@typecheck
 class AbqpyCLIBase:
     """Base class for Abaqus/CAE command line interface to run Abaqus commands."""
 
@@ -15,33 +44,186 @@ class AbqpyCLIBase:
 
         If the value is a string or an integer, the option will be passed as ``option=value``; if the value is a
         boolean, the option will be passed as ``option`` if True, or ignored if False; if the value is None, the option
-        will be ignored.
+        will be ignored. The options are quoted.
         """
-        return " ".join([f"{k}={v}" if isinstance(v, (str, int)) and not isinstance(v, bool) else
+        return " ".join([_quote(f"{k}={v}") if isinstance(v, (str, int)) and not isinstance(v, bool) else
                          k for k, v in options.items() if v])  # fmt: skip
 
-    def run(self, cmd: str):
-        """Run custom command."""
+    def __init__(
+        self,
+        *,
+        stdout: OutputCallback | None = None,
+        stderr: OutputCallback | None = None,
+        timeout: float | None = None,
+        cancel: threading.Event | None = None,
+        cwd: str | None = None,
+        env: dict[str, str] | None = None,
+    ):
+        """Create a command line interface, the parameters are the defaults of :meth:`run`, ``cwd`` and ``env`` are
+        the working directory and the environment variables of the commands, by default those of the current
+        process."""
+        self._stdout, self._stderr, self._timeout, self._cancel = stdout, stderr, timeout, cancel
+        self._cwd, self._env = cwd, env
+
+    def run(
+        self,
+        cmd: str,
+        *,
+        stdout: OutputCallback | None = None,
+        stderr: OutputCallback | None = None,
+        timeout: float | None = None,
+        cancel: threading.Event | None = None,
+    ) -> CommandResult:
+        """Run custom command.
+
+        Parameters
+        ----------
+        cmd : str
+            The command to run in the system shell.
+        stdout, stderr : Callable[[str], None], optional
+            The callbacks receiving the standard output and error of the command line by line. If None, the stream is
+            printed to the console, by default the callbacks the command line interface is created with.
+        timeout : float, optional
+            The maximum wall time of the command in seconds, the command is terminated when it is exceeded, by default
+            the timeout the command line interface is created with.
+        cancel : threading.Event, optional
+            An event that terminates the command when it is set, by default the event the command line interface is
+            created with.
+
+        Returns
+        -------
+        CommandResult
+            The return code, wall time and peak memory of the command, and whether it timed out or was cancelled.
+        """
         cmd = cmd.strip()
         message = f"Running the following command: {cmd}"
-        print("", "-" * len(message), message, "-" * len(message), sep="\n")
-        os.system(cmd)
+        print("", "-" * len(message), message, "-" * len(message), sep="\n", flush=True)
+        return run_command(
+            cmd,
+            stdout=stdout or self._stdout,
+            stderr=stderr or self._stderr,
+            timeout=timeout if timeout is not None else self._timeout,
+            cancel=cancel or self._cancel,
+            cwd=self._cwd,
+            env=self._env,
+        )
+
+    async def arun(
+        self,
+        cmd: str,
+        *,
+        stdout: OutputCallback | None = None,
+        stderr: OutputCallback | None = None,
+        timeout: float | None = None,
+    ) -> CommandResult:
+        """Awaitable counterpart of :meth:`run`, the command is split into arguments and run without a shell by
+        :func:`asyncio.create_subprocess_exec`. Cancel the awaiting task to terminate the command.
+
+        Parameters
+        ----------
+        cmd : str
+            The command to run.
+        stdout, stderr : Callable[[str], None], optional
+            The callbacks receiving the standard output and error of the command line by line. If None, the stream is
+            printed to the console, by default the callbacks the command line interface is created with.
+        timeout : float, optional
+            The maximum wall time of the command in seconds, the command is terminated when it is exceeded, by default
+            the timeout the command line interface is created with.
+
+        Returns
+        -------
+        CommandResult
+            The return code and wall time of the command, and whether it timed out.
+        """
+        cmd = cmd.strip()
+        message = f"Running the following command: {cmd}"
+        print("", "-" * len(message), message, "-" * len(message), sep="\n", flush=True)
+        return await arun_command(
+            cmd,
+            stdout=stdout or self._stdout,
+            stderr=stderr or self._stderr,
+            timeout=timeout if timeout is not None else self._timeout,
+            cwd=self._cwd,
+            env=self._env,
+        )
+
+    def _command(self, *words: str) -> str:
+        """The Abaqus command line made of the already quoted ``words``, the empty ones are skipped."""
+        return " ".join([os.environ.get("ABAQUS_BAT_PATH", "abaqus"), *filter(None, words)])
+
+    def _abaqus_command(self, *args, **options) -> str:
+        """The command line of :meth:`abaqus`, shared with :meth:`aabaqus`."""
+        return self._command(*map(_quote, args), self._parse_options(**options))
 
     def abaqus(self, *args, **options):
-        """Run custom Abaqus command: ``abaqus {args} {options}``, arguments are separated by space, options are
-        handled by the :meth:`._parse_options` method.
+        """Run custom Abaqus command: ``abaqus {args} {options}``, arguments are quoted and separated by space,
+        options are handled by the :meth:`._parse_options` method.
 
         Parameters
         ----------
         args, options
             Arguments and options to be passed to the Abaqus command.
+
+        Returns
+        -------
+        CommandResult
+            The result of the command, see :meth:`run`.
+        """
+        return self.run(self._abaqus_command(*args, **options))
+
+    async def aabaqus(self, *args, **options) -> CommandResult:
+        """Awaitable counterpart of :meth:`abaqus`, the command is run by :meth:`arun`."""
+        return await self.arun(self._abaqus_command(*args, **options))
+
+
+class AbqpyCacheCLI:
+    """Inspect and prune the result cache of the submissions, see :envvar:`ABQPY_CACHE_DIR`."""
+
+    def __init__(self, cache: ResultCache | None):
+        self._cache = cache
+
+    def _enabled(self) -> ResultCache | None:
+        """The cache, or None after printing a message if it is disabled."""
+        if self._cache is None:
+            print("The result cache is disabled, set the ABQPY_CACHE_DIR environment variable to enable it")
+        return self._cache
+
+    def list(self):
+        """List the entries of the cache, from the most to the least recently used."""
+        cache = self._enabled()
+        if cache is None:
+            return
+        entries = cache.entries()
+        size = sum(entry["size"] for entry in entries)
+        print(f"{len(entries)} entries, {size / 2**20:.1f} MiB in {cache.directory}")
+        for entry in entries:
+            used = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry["used"]))
+            print(f"{entry['key'][:12]}  {used}  {entry['size'] / 2**20:>10.1f} MiB  {entry['script']}")
+
+    def prune(self, size: int | str | None = None):
+        """Evict the least recently used entries until the cache fits in the given size.
+
+        Parameters
+        ----------
+        size : int | str, optional
+            The maximum size of the cache in bytes, with an optional unit (``K``, ``M``, ``G`` or ``T``), by default
+            :envvar:`ABQPY_CACHE_SIZE`.
         """
-        abaqus = os.environ.get("ABAQUS_BAT_PATH", "abaqus")
-        args, options = " ".join(args), self._parse_options(**options)
-        self.run(abaqus + (f" {args}" if args else "") + (f" {options}" if options else ""))
+        cache = self._enabled()
+        if cache is None:
+            return
+        evicted = cache.prune(parse_size(size) if size is not None else cache.size or 0)
+        print(f"{len(evicted)} entries evicted from {cache.directory}")
+
+    def clear(self):
+        """Remove all the entries of the cache."""
+        cache = self._enabled()
+        if cache is None:
+            return
+        print(f"{cache.clear()} entries removed from {cache.directory}")
 
 
-@typechecked
+@typecheck
 class AbqpyCLI(AbqpyCLIBase):
     """The abqpy command line interface."""
 
@@ -50,6 +232,41 @@ class AbqpyCLI(AbqpyCLIBase):
         """Miscellaneous commands for backward compatibility."""
         return self
 
+    @property
+    def cache(self) -> AbqpyCacheCLI:
+        """Inspect and prune the result cache of the submissions, see :envvar:`ABQPY_CACHE_DIR`."""
+        from .config import config
+
+        return AbqpyCacheCLI(ResultCache(config.cache_dir, config.cache_size) if config.cache_dir else None)
+
+    def _cae_command(
+        self,
+        script: str,
+        *args,
+        database: str | None = None,
+        replay: str | None = None,
+        recover: str | None = None,
+        startup: str | None = None,
+        gui: bool = False,
+        envstartup: bool = True,
+        savedOptions: bool = True,
+        savedGuiPrefs: bool = True,
+        startupDialog: bool = True,
+        custom: str | None = None,
+        guiTester: str | None = None,
+        guiRecord: bool | None = None,
+    ) -> str:
+        """The command line of :meth:`cae`, shared with :meth:`acae`."""
+        options = self._parse_options(script=script if gui else None, noGUI=script if not gui else None,
+                                      database=database, replay=replay, recover=recover, startup=startup,
+                                      noenvstartup=not envstartup, noSavedOptions=not savedOptions,
+                                      noSavedGuiPrefs=not savedGuiPrefs, noStartupDialog=not startupDialog,
+                                      custom=custom, guiTester=guiTester,
+                                      guiRecord=True if guiRecord is True else None,
+                                      guiNoRecord=True if guiRecord is False else None)  # fmt: skip
+        args = ("--", *args) if args else ()
+        return self._command("cae", options, *map(_quote, args))
+
     def cae(
         self,
         script: str,
@@ -101,18 +318,10 @@ class AbqpyCLI(AbqpyCLIBase):
         guiRecord : bool, optional
             Record the GUI commands to a file, by default None
         """
-        # Parse options
-        options = self._parse_options(script=script if gui else None, noGUI=script if not gui else None,
-                                      database=database, replay=replay, recover=recover, startup=startup,
-                                      noenvstartup=not envstartup, noSavedOptions=not savedOptions,
-                                      noSavedGuiPrefs=not savedGuiPrefs, noStartupDialog=not startupDialog,
-                                      custom=custom, guiTester=guiTester,
-                                      guiRecord=True if guiRecord is True else None,
-                                      guiNoRecord=True if guiRecord is False else None)  # fmt: skip
-        args = ("--", *args) if args else ()
-
-        # Execute command
-        self.abaqus("cae", options, *args)
+        return self.run(self._cae_command(script, *args, database=database, replay=replay, recover=recover,
+                                          startup=startup, gui=gui, envstartup=envstartup, savedOptions=savedOptions,
+                                          savedGuiPrefs=savedGuiPrefs, startupDialog=startupDialog, custom=custom,
+                                          guiTester=guiTester, guiRecord=guiRecord))  # fmt: skip
 
     viewer = cae
 
@@ -128,9 +337,19 @@ class AbqpyCLI(AbqpyCLIBase):
         options
             Abaqus/CAE command line arguments
         """
-        cae_opts = self._parse_options(**options)
-        args = (*scripts,) + ((f"script={script}",) if script else ()) + ("-pde",) + ((cae_opts,) if cae_opts else ())
-        self.abaqus("pde", *args)
+        scripts_opts = " ".join(map(_quote, scripts))
+        return self.run(self._command("pde", scripts_opts, self._parse_options(script=script), "-pde",
+                                      self._parse_options(**options)))  # fmt: skip
+
+    def _python_command(
+        self,
+        script: str,
+        *args,
+        sim: str | None = None,
+        log: str | None = None,
+    ) -> str:
+        """The command line of :meth:`python`, shared with :meth:`apython`."""
+        return self._command("python", _quote(script), self._parse_options(sim=sim, log=log), *map(_quote, args))
 
     def python(
         self,
@@ -152,13 +371,24 @@ class AbqpyCLI(AbqpyCLIBase):
         log : str, optional
             The name of the log file to open, by default None
         """
-        # Parse options
-        options = self._parse_options(sim=sim, log=log)
+        return self.run(self._python_command(script, *args, sim=sim, log=log))
 
-        # Execute command
-        self.abaqus("python", script, options, *args)
+    def _optimization_command(
+        self,
+        task: str,
+        job: str,
+        *,
+        cpus: int | None = None,
+        gpus: int | None = None,
+        memory: int | None = None,
+        interactive: bool = False,
+        globalmodel: str | None = None,
+        scratch: str | None = None,
+    ) -> str:
+        """The command line of :meth:`optimization`, shared with :meth:`aoptimization`."""
+        return self._abaqus_command("optimization", task=task, job=job, cpus=cpus, gpus=gpus, memory=memory,
+                                    interactive=interactive, globalmodel=globalmodel, scratch=scratch)  # fmt: skip
 
-    @typechecked
     def optimization(
         self,
         task: str,
@@ -192,141 +422,359 @@ class AbqpyCLI(AbqpyCLIBase):
         scratch : str, optional
             The name of the directory used for scratch files.
         """
-        # Execute command
-        self.abaqus("optimization", task=task, job=job, cpus=cpus, gpus=gpus, memory=memory,
-                    interactive=interactive, globalmodel=globalmodel, scratch=scratch)  # fmt: skip
+        return self.run(self._optimization_command(task, job, cpus=cpus, gpus=gpus, memory=memory,
+                                                   interactive=interactive, globalmodel=globalmodel,
+                                                   scratch=scratch))  # fmt: skip
+
+    async def acae(self, script: str, *args, **options) -> CommandResult:
+        """Awaitable counterpart of :meth:`cae`, run by :meth:`arun`, see :meth:`cae` for the parameters."""
+        return await self.arun(self._cae_command(script, *args, **options))
+
+    async def apython(self, script: str, *args, **options) -> CommandResult:
+        """Awaitable counterpart of :meth:`python`, run by :meth:`arun`, see :meth:`python` for the parameters."""
+        return await self.arun(self._python_command(script, *args, **options))
+
+    async def aoptimization(self, task: str, job: str, **options) -> CommandResult:
+        """Awaitable counterpart of :meth:`optimization`, run by :meth:`arun`, see :meth:`optimization` for details."""
+        return await self.arun(self._optimization_command(task, job, **options))
+
+    def batch(
+        self,
+        *files: str,
+        mode: str = "cae",
+        cpus: int = 1,
+        workers: int | None = None,
+        tokens: int | None = None,
+        directory: str = "batch",
+        timeout: float | None = None,
+    ) -> list[CommandResult | BaseException | None]:
+        """Run Python scripts or input files through a pool of workers, each one in its own working directory, and
+        print a summary of their status and timings.
+
+        The number of cases run at the same time is limited by the number of CPUs and by the license token budget.
+        The output of each case is written to ``abqpy.log`` in its working directory. Press Ctrl-C to terminate the
+        running cases and cancel the pending ones.
+
+        Parameters
+        ----------
+        files : str
+            The files or glob patterns of the Python scripts or input files (``.inp``) to run.
+        mode : str, optional
+            Run the scripts with ``abaqus cae noGUI`` (``cae``) or ``abaqus python`` (``python``), by default ``cae``.
+        cpus : int, optional
+            The number of CPUs used by each case, passed to the input files, by default 1.
+        workers : int, optional
+            The maximum number of cases to run at the same time, by default the number of CPUs divided by ``cpus``.
+        tokens : int, optional
+            The license token budget of the batch, by default :envvar:`ABQPY_LICENSE_TOKENS` or not limited.
+        directory : str, optional
+            The directory of the working directories of the cases, by default ``batch``.
+        timeout : float, optional
+            The maximum wall time of each case in seconds, by default None.
+
+        Returns
+        -------
+        list[CommandResult | BaseException | None]
+            The results of the cases, the errors raised by the cases, or None for the cases cancelled before they
+            started.
+        """
+        from .batch import run_batch
+
+        _, results = run_batch(
+            files, mode=mode, cpus=cpus, workers=workers, tokens=tokens, directory=directory, timeout=timeout
+        )
+        return results
+
+    def serve(
+        self,
+        *,
+        cae: bool = False,
+        connection: str | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        preload: str | None = None,
+        stop: bool = False,
+    ):
+        """Start a kernel server, a long-lived ``abaqus python`` (or ``abaqus cae noGUI``) process that runs the
+        scripts submitted by :func:`abqpy.run` when :envvar:`ABQPY_SERVER` is set, or stop it.
+
+        Parameters
+        ----------
+        cae : bool, optional
+            Run the server with ``abaqus cae noGUI`` for the scripts importing ``abaqus`` instead of with
+            ``abaqus python`` for the scripts importing ``odbAccess``, by default False.
+        connection : str, optional
+            The connection file of the server, by default :envvar:`ABQPY_SERVER` or ``~/.abqpy/kernel.json``.
+        host : str, optional
+            The address the server listens on, by default ``127.0.0.1``.
+        port : int, optional
+            The port the server listens on, by default a free port.
+        preload : str, optional
+            The comma separated names of the modules imported when the server starts, e.g. ``odbAccess``, by default
+            None.
+        stop : bool, optional
+            Stop the running server instead of starting a new one, by default False.
+        """
+        from .config import config
+        from .server import BOOTSTRAP, CONNECTION, shutdown
+
+        connection = os.path.abspath(connection or config.server or CONNECTION)
+        if stop:
+            return shutdown(connection)
+        args = (connection, "cae" if cae else "python", host, str(port)) + ((preload,) if preload else ())
+        return self.cae(BOOTSTRAP, *args) if cae else self.python(BOOTSTRAP, *args)
+
+    def bench(self, *modules: str, repeat: int = 5, output: str | None = None):
+        """Benchmark the import time, peak memory and imported modules of the abqpy entry points, Abaqus is not
+        called during the benchmark.
+
+        Parameters
+        ----------
+        modules : str
+            The names of the modules to benchmark, by default ``abaqus``, ``abaqusConstants``, ``odbAccess``,
+            ``caeModules``, ``visualization`` and ``abqpy.cli``.
+        repeat : int, optional
+            The number of warm imports of each module, the best one is reported, by default 5.
+        output : str, optional
+            The name of the JSON file to write the report to, by default None.
+        """
+        from .benchmark import MODULES, benchmark_imports, format_report
+
+        report = benchmark_imports(modules or MODULES, repeat=repeat)
+        print(format_report(report))
+        if output:
+            with open(output, "w") as file:
+                json.dump(report, file, indent=2)
+
+    def profile_report(self, profile: str, *, limit: int = 20):
+        """Summarize the hottest Abaqus Scripting Interface calls of a script profiled with ABQPY_PROFILE.
+
+        Parameters
+        ----------
+        profile : str
+            The profile written next to the script, ``script.prof`` (``cprofile``) or ``script.snapshot``
+            (``tracemalloc``), or the script itself.
+        limit : int, optional
+            The number of calls, functions or lines to show, by default 20.
+        """
+        from .profiling import PROFILERS, profile_report
+
+        if profile.endswith(".py"):
+            profiles = [os.path.splitext(profile)[0] + suffix for suffix in PROFILERS.values()]
+            profile = max((path for path in profiles if os.path.exists(path)), key=os.path.getmtime, default=profile)
+        print(profile_report(profile, limit))
+
+    def export_odb(
+        self,
+        odb: str,
+        output: str | None = None,
+        *,
+        steps: str | tuple[str, ...] | None = None,
+        variables: str | tuple[str, ...] | None = None,
+        frames: int | str | tuple[int, ...] | None = None,
+        history: bool = True,
+    ):
+        """Export the field and history output of an output database to ``.npy`` files with Abaqus/Python.
+
+        The field outputs are read block by block with ``FieldOutput.bulkDataBlocks`` and every column of a block,
+        i.e. the data, the node labels, the element labels and the integration points, is saved to its own ``.npy``
+        file as soon as its frame is read, with a ``manifest.json`` describing the steps, frames and outputs, see
+        :mod:`abqpy.odbexport`. The files can be loaded as memory maps by NumPy outside Abaqus.
+
+        Parameters
+        ----------
+        odb : str
+            The path of the output database.
+        output : str, optional
+            The directory the files are written to, by default the path of the output database without ``.odb``
+            followed by ``-export``.
+        steps, variables : str, optional
+            The comma separated names of the steps and of the field output variables to export, e.g. ``U,S``, by
+            default all of them.
+        frames : str, optional
+            The comma separated indices of the frames of every step to export, negative indices count from the last
+            frame, e.g. ``-1``, by default all of them.
+        history : bool, optional
+            Whether to export the history output, by default True.
+        """
+        script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "odbexport.py")
+        # The command line interface parses the comma separated values as tuples
+        selections = {"steps": steps, "variables": variables, "frames": frames}
+        options = [
+            f"--{name}={','.join(map(str, value)) if isinstance(value, tuple) else value}"
+            for name, value in selections.items()
+            if value is not None and value != ""
+        ]
+        options += [] if history else ["--no-history"]
+        return self.python(script, odb, *([output] if output else []), *options)
+
+    def inpdiff(self, old: str, new: str, *, rows: int = 10):
+        """Compare the keyword blocks of two input files and report the blocks added, removed and changed.
+
+        The blocks are compared by the hashes of their data lines, the deltas of the rows of the changed blocks are
+        reported, see :meth:`abaqus.InputFileParser.InputFile.InputFile.diff`.
+
+        Parameters
+        ----------
+        old, new : str
+            The paths of the input files, the included files are compared as part of them.
+        rows : int, optional
+            The number of rows reported for each changed block, 0 to compare the hashes only, by default 10.
+        """
+        _diff = _import_input_file_parser("_diff")
+        print(_diff.format_diff(_diff.diff_files(old, new, rows=rows > 0), rows))
+
+    def inpstat(self, model: str, *, output: str | None = None):
+        """Count the nodes, elements, sets, surfaces, materials, steps and output requests of an input file.
+
+        The input file and its included files are scanned once without being parsed, the number of degrees of freedom
+        is estimated from the nodes and the element types, see :meth:`abaqus.InputFileParser.InputFile.InputFile.stats`.
+
+        Parameters
+        ----------
+        model : str
+            The path of the input file.
+        output : str, optional
+            The name of the JSON file to write the statistics to, by default None.
+        """
+        _stats = _import_input_file_parser("_stats")
+        stats = _stats.deck_stats(model)
+        print(_stats.format_stats(stats))
+        if output:
+            with open(output, "w") as file:
+                json.dump(stats._asdict(), file, indent=2)
 
     def help(self, *args, **options):
-        self.abaqus("help", *args, **options)
+        return self.abaqus("help", *args, **options)
 
     def information(self, *args, **options):
-        self.abaqus("information", *args, **options)
+        return self.abaqus("information", *args, **options)
 
     def whereami(self, *args, **options):
-        self.abaqus("whereami", *args, **options)
+        return self.abaqus("whereami", *args, **options)
 
     def cse(self, *args, **options):
-        self.abaqus("cse", *args, **options)
+        return self.abaqus("cse", *args, **options)
 
     def cosimulation(self, *args, **options):
-        self.abaqus("cosimulation", *args, **options)
+        return self.abaqus("cosimulation", *args, **options)
 
     def fmu(self, *args, **options):
-        self.abaqus("fmu", *args, **options)
+        return self.abaqus("fmu", *args, **options)
 
     def script(self, *args, **options):
-        self.abaqus("script", *args, **options)
+        return self.abaqus("script", *args, **options)
 
     def doc(self, *args, **options):
-        self.abaqus("doc", *args, **options)
+        return self.abaqus("doc", *args, **options)
 
     def licensing(self, *args, **options):
-        self.abaqus("licensing", *args, **options)
+        return self.abaqus("licensing", *args, **options)
 
     def ascfil(self, *args, **options):
-        self.abaqus("ascfil", *args, **options)
+        return self.abaqus("ascfil", *args, **options)
 
     def append(self, *args, **options):
-        self.abaqus("append", *args, **options)
+        return self.abaqus("append", *args, **options)
 
     def findkeyword(self, *args, **options):
-        self.abaqus("findkeyword", *args, **options)
+        return self.abaqus("findkeyword", *args, **options)
 
     def fetch(self, *args, **options):
-        self.abaqus("fetch", *args, **options)
+        return self.abaqus("fetch", *args, **options)
 
     def make(self, *args, **options):
-        self.abaqus("make", *args, **options)
+        return self.abaqus("make", *args, **options)
 
     def upgrade(self, *args, **options):
-        self.abaqus("upgrade", *args, **options)
+        return self.abaqus("upgrade", *args, **options)
 
     def sim_version(self, *args, **options):
-        self.abaqus("sim_version", *args, **options)
+        return self.abaqus("sim_version", *args, **options)
 
     def odb2sim(self, *args, **options):
-        self.abaqus("odb2sim", *args, **options)
+        return self.abaqus("odb2sim", *args, **options)
 
     def odbreport(self, *args, **options):
-        self.abaqus("odbReport", *args, **options)
+        return self.abaqus("odbReport", *args, **options)
 
     def restartjoin(self, *args, **options):
-        self.abaqus("restartjoin", *args, **options)
+        return self.abaqus("restartjoin", *args, **options)
 
     def substructurecombine(self, *args, **options):
-        self.abaqus("substructurecombine", *args, **options)
+        return self.abaqus("substructurecombine", *args, **options)
 
     def substructurerecover(self, *args, **options):
-        self.abaqus("substructurerecover", *args, **options)
+        return self.abaqus("substructurerecover", *args, **options)
 
     def odbcombine(self, *args, **options):
-        self.abaqus("odbcombine", *args, **options)
+        return self.abaqus("odbcombine", *args, **options)
 
     def networkDBConnector(self, *args, **options):
-        self.abaqus("networkDBConnector", *args, **options)
+        return self.abaqus("networkDBConnector", *args, **options)
 
     def emloads(self, *args, **options):
-        self.abaqus("emloads", *args, **options)
+        return self.abaqus("emloads", *args, **options)
 
     def mtxasm(self, *args, **options):
-        self.abaqus("mtxasm", *args, **options)
+        return self.abaqus("mtxasm", *args, **options)
 
     def fromnastran(self, *args, **options):
-        self.abaqus("fromnastran", *args, **options)
+        return self.abaqus("fromnastran", *args, **options)
 
     def tonastran(self, *args, **options):
-        self.abaqus("tonastran", *args, **options)
+        return self.abaqus("tonastran", *args, **options)
 
     def fromansys(self, *args, **options):
-        self.abaqus("fromansys", *args, **options)
+        return self.abaqus("fromansys", *args, **options)
 
     def frompamcrash(self, *args, **options):
-        self.abaqus("frompamcrash", *args, **options)
+        return self.abaqus("frompamcrash", *args, **options)
 
     def fromradioss(self, *args, **options):
-        self.abaqus("fromradioss", *args, **options)
+        return self.abaqus("fromradioss", *args, **options)
 
     def toOutput2(self, *args, **options):
-        self.abaqus("toOutput2", *args, **options)
+        return self.abaqus("toOutput2", *args, **options)
 
     def fromdyna(self, *args, **options):
-        self.abaqus("fromdyna", *args, **options)
+        return self.abaqus("fromdyna", *args, **options)
 
     def tozaero(self, *args, **options):
-        self.abaqus("tozaero", *args, **options)
+        return self.abaqus("tozaero", *args, **options)
 
     def adams(self, *args, **options):
-        self.abaqus("adams", *args, **options)
+        return self.abaqus("adams", *args, **options)
 
     def tosimpack(self, *args, **options):
-        self.abaqus("tosimpack", *args, **options)
+        return self.abaqus("tosimpack", *args, **options)
 
     def fromsimpack(self, *args, **options):
-        self.abaqus("fromsimpack", *args, **options)
+        return self.abaqus("fromsimpack", *args, **options)
 
     def toexcite(self, *args, **options):
-        self.abaqus("toexcite", *args, **options)
+        return self.abaqus("toexcite", *args, **options)
 
     def moldflow(self, *args, **options):
-        self.abaqus("moldflow", *args, **options)
+        return self.abaqus("moldflow", *args, **options)
 
     def encrypt(self, *args, **options):
-        self.abaqus("encrypt", *args, **options)
+        return self.abaqus("encrypt", *args, **options)
 
     def decrypt(self, *args, **options):
-        self.abaqus("decrypt", *args, **options)
+        return self.abaqus("decrypt", *args, **options)
 
     def suspend(self, *args, **options):
-        self.abaqus("suspend", *args, **options)
+        return self.abaqus("suspend", *args, **options)
 
     def resume(self, *args, **options):
-        self.abaqus("resume", *args, **options)
+        return self.abaqus("resume", *args, **options)
 
     def terminate(self, *args, **options):
-        self.abaqus("terminate", *args, **options)
+        return self.abaqus("terminate", *args, **options)
 
     def sysVerify(self, *args, **options):
-        self.abaqus("sysVerify", *args, **options)
+        return self.abaqus("sysVerify", *args, **options)
 
 
 #: The abqpy command line interface, use this object to run abqpy commands from the python scripts
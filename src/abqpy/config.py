@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import ast
 import os
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 from pydantic import BaseModel
 
+from .cache import parse_size
+
 
 class CompatibleBaseModel(BaseModel):
     def model_dump(self, **kwargs) -> dict[str, Any]:
@@ -43,6 +45,16 @@ class AbaqusConfig(CompatibleBaseModel):
     skip_abaqus: bool = False
     make_docs: bool = False
     cli_traceback_limit: int = 0
+    license_tokens: Optional[int] = None
+    server: Optional[str] = None
+    cache_dir: Optional[str] = None
+    cache_size: int = 10 << 30
+    cache_inputs: List[str] = []
+    cache_outputs: List[str] = []
+    typecheck: str = "full"
+    typecheck_rate: float = 0.1
+    profile: Optional[str] = None
+    odb_backend: str = "abaqus"
 
 
 class AbaqusCommandOptions(AbaqusCAEConfig, AbaqusPythonConfig): ...
@@ -54,6 +66,7 @@ options = AbaqusCommandOptions(**defaults)
 
 
 trues = ["true", "1", "on", "yes"]
+falses = ["false", "0", "off", "no", ""]
 config = AbaqusConfig(
     cae=AbaqusCAEConfig(
         database=os.environ["ABAQUS_CAE_DATABASE"] if "ABAQUS_CAE_DATABASE" in os.environ else options.database,
@@ -97,4 +110,30 @@ config = AbaqusConfig(
     skip_abaqus=os.environ.get("ABQPY_SKIP_ABAQUS", "false").lower() in trues,
     make_docs=os.environ.get("ABQPY_MAKE_DOCS", "false").lower() in trues,
     cli_traceback_limit=int(os.environ.get("ABQPY_CLI_TRACEBACK_LIMIT", 0)),
+    license_tokens=int(os.environ["ABQPY_LICENSE_TOKENS"]) if "ABQPY_LICENSE_TOKENS" in os.environ else None,
+    server=(
+        os.path.join(os.path.expanduser("~"), ".abqpy", "kernel.json")
+        if os.environ.get("ABQPY_SERVER", "").lower() in trues
+        else None if os.environ.get("ABQPY_SERVER", "").lower() in falses else os.environ["ABQPY_SERVER"]
+    ),
+    cache_dir=os.environ.get("ABQPY_CACHE_DIR") or None,
+    cache_size=parse_size(os.environ.get("ABQPY_CACHE_SIZE", "").strip() or "10G"),
+    cache_inputs=[
+        pattern.strip() for pattern in os.environ.get("ABQPY_CACHE_INPUTS", "").split(",") if pattern.strip()
+    ],
+    cache_outputs=[
+        pattern.strip() for pattern in os.environ.get("ABQPY_CACHE_OUTPUTS", "").split(",") if pattern.strip()
+    ],
+    typecheck=(
+        "full"
+        if os.environ.get("ABQPY_TYPECHECK", "full").lower() in trues
+        else (
+            "off"
+            if os.environ.get("ABQPY_TYPECHECK", "full").lower() in falses
+            else os.environ.get("ABQPY_TYPECHECK", "full").lower()
+        )
+    ),
+    typecheck_rate=float(os.environ.get("ABQPY_TYPECHECK_RATE", 0.1)),
+    profile=None if os.environ.get("ABQPY_PROFILE", "").lower() in falses else os.environ["ABQPY_PROFILE"].lower(),
+    odb_backend=os.environ.get("ABQPY_ODB_BACKEND", "abaqus").lower() or "abaqus",
 )
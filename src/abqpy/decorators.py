@@ -1,8 +1,9 @@
 import re
 from functools import partial
-from typing import Tuple
+from typing import Callable, Optional, Tuple
 
 from . import __version__ as version
+from .config import config
 
 
 def class_or_module_link(
@@ -193,8 +194,34 @@ add_link_in_method_docstring = partial(add_link_in_method_or_function_docstring,
 add_link_in_function_docstring = partial(add_link_in_method_or_function_docstring, "function")
 
 
+class LazyDocstring:
+    """A descriptor for the ``__doc__`` attribute of a class, the docstring is only made when it is read for the first
+    time, e.g., by :func:`help` or Sphinx.
+
+    Parameters
+    ----------
+    make_docstring : Callable[[], Optional[str]]
+        The function to make the docstring.
+    """
+
+    def __init__(self, make_docstring: Callable[[], Optional[str]]):
+        self.make_docstring: Optional[Callable[[], Optional[str]]] = make_docstring
+        self.docstring: Optional[str] = None
+
+    def __get__(self, instance, owner=None) -> Optional[str]:
+        if self.make_docstring is not None:
+            self.docstring, self.make_docstring = self.make_docstring(), None
+        return self.docstring
+
+
 def abaqus_function_doc(func):
-    """Add a link to the Abaqus documentation to the docstring of the function."""
+    """Add a link to the Abaqus documentation to the docstring of the function.
+
+    The docstrings of functions can not be made lazily, so the link is only added when making the documentation
+    (``config.make_docs`` is set).
+    """
+    if not config.make_docs:
+        return func
     module_name = func.__module__.split(".")[-1]
     func.__doc__ = add_link_in_function_docstring(
         class_or_module_name=module_name,
@@ -243,8 +270,12 @@ class_suffix = {
 
 
 def abaqus_method_doc(method):
-    """Add a link to the Abaqus documentation to the docstring of the method."""
-    if method.__name__ == "__init__":
+    """Add a link to the Abaqus documentation to the docstring of the method.
+
+    The docstrings of methods can not be made lazily, so the link is only added when making the documentation
+    (``config.make_docs`` is set).
+    """
+    if not config.make_docs or method.__name__ == "__init__":
         return method
     class_name = method.__qualname__.split(".")[0]
     method.__doc__ = add_link_in_method_docstring(
@@ -259,14 +290,21 @@ def abaqus_method_doc(method):
 
 
 def abaqus_class_doc(cls):
-    """Add a link to the Abaqus documentation to the docstring of the class."""
+    """Add a link to the Abaqus documentation to the docstring of the class.
+
+    The link is added when the docstring is read for the first time (see :class:`LazyDocstring`), or immediately when
+    making the documentation.
+    """
+    if not cls.__doc__:
+        return cls
     class_name = cls.__name__
-    processed_class_name = _process_class_name(class_name)
-    cls.__doc__ = add_link_in_class_docstring(
-        class_or_module_name=processed_class_name,
+    make_docstring = partial(
+        add_link_in_class_docstring,
+        class_or_module_name=_process_class_name(class_name),
         docstring=cls.__doc__,
         prefix="gpr" if class_name.lower().startswith("cae") else "",
         suffix=class_suffix.get(class_name, ""),
         label=class_name,
     )
+    cls.__doc__ = make_docstring() if config.make_docs else LazyDocstring(make_docstring)
     return cls
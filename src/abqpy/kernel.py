@@ -0,0 +1,128 @@
+"""Bootstrap of the abqpy kernel server, a long-lived Abaqus Python process that runs scripts sent by
+:func:`abqpy.server.submit` and streams their output back, see :meth:`abqpy.cli.AbqpyCLI.serve`.
+
+It is run by ``abaqus python`` (or ``abaqus cae noGUI``) with the arguments::
+
+    kernel.py CONNECTION-FILE MODE HOST PORT [PRELOAD-MODULES]
+
+This file only depends on the standard library and is compatible with Python 2.7, the interpreter of older Abaqus
+releases. The protocol is one JSON object per line over a local TCP socket, authenticated by the token written to the
+connection file, which is only readable by the current user.
+"""
+
+from __future__ import print_function
+
+import binascii
+import json
+import os
+import runpy
+import socket
+import sys
+import traceback
+
+# The scripts run by the kernel must not submit themselves to Abaqus again when abqpy is installed
+os.environ["ABQPY_SKIP_ABAQUS"] = "true"
+
+
+def send(connection, **message):
+    connection.sendall((json.dumps(message) + "\n").encode("utf-8"))
+
+
+class Stream(object):
+    """A file-like object sending the text written to it to the client."""
+
+    def __init__(self, connection, name):
+        self.connection, self.name = connection, name
+
+    def write(self, text):
+        if text:
+            send(self.connection, **{self.name: text})
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return False
+
+
+def execute(connection, request):
+    """Run a script as ``__main__`` with its arguments in its working directory and return its exit status."""
+    script = os.path.abspath(os.path.join(request["cwd"], request["script"]))
+    saved = sys.argv, sys.stdout, sys.stderr, os.getcwd(), list(sys.path), set(sys.modules)
+    sys.argv = [request["script"]] + list(request["argv"])
+    sys.stdout, sys.stderr = Stream(connection, "stdout"), Stream(connection, "stderr")
+    sys.path.insert(0, os.path.dirname(script))
+    os.chdir(request["cwd"])
+    status = 0
+    try:
+        runpy.run_path(script, run_name="__main__")
+    except SystemExit as exit:
+        if exit.code is not None and not isinstance(exit.code, int):
+            print(exit.code, file=sys.stderr)
+        status = 1 if exit.code is not None and not isinstance(exit.code, int) else exit.code or 0
+    except BaseException:
+        traceback.print_exc()
+        status = 1
+    finally:
+        sys.argv, sys.stdout, sys.stderr = saved[:3]
+        os.chdir(saved[3])
+        sys.path[:] = saved[4]
+        # The modules next to the script are imported again by the next script, in case they were modified
+        directory = os.path.dirname(script)
+        for name in set(sys.modules) - saved[5]:
+            path = getattr(sys.modules[name], "__file__", None) or ""
+            if os.path.abspath(path).startswith(directory + os.sep):
+                del sys.modules[name]
+    return status
+
+
+def serve(path, mode, host="127.0.0.1", port=0, preload=()):
+    """Listen for scripts to run until a shutdown request is received."""
+    for module in preload:
+        __import__(module)
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind((host, int(port)))
+    server.listen(16)
+    token = binascii.hexlify(os.urandom(16)).decode("ascii")
+    host, port = server.getsockname()[:2]
+    if os.path.dirname(path) and not os.path.isdir(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path))
+    descriptor = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(descriptor, "w") as file:
+        json.dump({"host": host, "port": port, "token": token, "mode": mode, "pid": os.getpid()}, file)
+    print("abqpy kernel server (%s mode) listening on %s:%s" % (mode, host, port))
+    sys.stdout.flush()
+    try:
+        running = True
+        while running:
+            connection = server.accept()[0]
+            try:
+                request = json.loads(connection.makefile("rb").readline().decode("utf-8") or "{}")
+                if request.get("token") != token:
+                    send(connection, error="invalid token")
+                elif request.get("command") == "shutdown":
+                    send(connection, exit=0)
+                    running = False
+                elif request.get("command") == "ping":
+                    send(connection, mode=mode, pid=os.getpid())
+                else:
+                    send(connection, exit=execute(connection, request))
+            except Exception:
+                traceback.print_exc()
+            finally:
+                connection.close()
+    finally:
+        server.close()
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def main(argv):
+    # ``abaqus cae noGUI`` passes its own arguments first, the arguments of the script follow ``--``
+    argv = argv[argv.index("--") + 1 :] if "--" in argv else argv[1:]
+    path, mode, host, port = argv[:4]
+    serve(path, mode, host, port, [module for module in "".join(argv[4:5]).split(",") if module])
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import sys
+from importlib import import_module
+from types import ModuleType
+from typing import Any, Callable
+
+
+def lazy_attributes(
+    module_name: str,
+    attributes: dict[str, str],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Create the module level ``__getattr__`` and ``__dir__`` functions (:pep:`562`) to import the attributes of a
+    module only when they are accessed for the first time.
+
+    Parameters
+    ----------
+    module_name : str
+        The name of the module to add the lazy attributes to, usually ``__name__``.
+    attributes : dict[str, str]
+        A mapping from the attribute names to their targets. A target can be the import path of a module
+        (``"abaqus.Mesh.ElemType"``) or of an object inside a module (``"abaqus.Mesh.ElemType:ElemType"``), which
+        may be a dotted path (``"abaqus.UtilityAndView.SymbolicConstant:abaqusConstants.YES"``). An
+        object path ending with ``()`` is called without arguments, e.g. ``"abaqus.Mdb.Mdb:Mdb()"``. Relative import
+        paths are resolved against the package of the module. The value is cached in the module namespace once it is
+        resolved.
+
+        If the module defines ``__all__``, the missing attribute names are appended to it, so that they are still
+        exported by ``from module import *``.
+
+    Returns
+    -------
+    Callable[[str], Any]
+        The module level ``__getattr__`` function.
+    Callable[[], list[str]]
+        The module level ``__dir__`` function.
+    """
+    module = sys.modules[module_name]
+    modules: dict[str, ModuleType] = {}
+
+    def __getattr__(name: str) -> Any:
+        if name not in attributes:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        path, _, attribute = attributes[name].partition(":")
+        call = attribute.endswith("()")
+        if path not in modules:
+            modules[path] = import_module(path, module.__package__ or None)
+        value: Any = modules[path]
+        for part in attribute[: -2 if call else None].split(".") if attribute else ():
+            value = getattr(value, part)
+        if call:
+            value = value()
+        module.__dict__[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(module.__dict__) | set(attributes))
+
+    exports = getattr(module, "__all__", None)
+    if isinstance(exports, list):
+        exports += [name for name in attributes if name not in exports]
+
+    if hasattr(module, "__path__"):
+        # Importing a subpackage binds it on the parent package, e.g. ``abaqus.Mdb`` would become the subpackage
+        # instead of the ``Mdb`` class, so these bindings are dropped while the lazy attribute is not resolved yet
+        class LazyModule(ModuleType):
+            def __setattr__(self, name: str, value: Any) -> None:
+                if (
+                    name in attributes
+                    and name not in self.__dict__
+                    and isinstance(value, ModuleType)
+                    and value.__name__ == f"{module_name}.{name}"
+                ):
+                    return
+                super().__setattr__(name, value)
+
+        module.__class__ = LazyModule
+
+    return __getattr__, __dir__
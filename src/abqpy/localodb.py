@@ -0,0 +1,496 @@
+"""A local stand-in of the ``odbAccess`` object model, backed by the files exported by :mod:`abqpy.odbexport`.
+
+When :envvar:`ABQPY_ODB_BACKEND` is ``local``, the scripts importing ``odbAccess`` are run by the current Python
+interpreter instead of being submitted to Abaqus, and ``odbAccess.openOdb`` opens the export of the output database,
+e.g. ``Job-1-export`` for ``Job-1.odb``, written by ``abqpy export-odb``::
+
+    ABQPY_ODB_BACKEND=local python post.py
+
+The steps, frames, field outputs and history outputs are described by the manifest of the export, and the arrays are
+loaded as read-only memory maps the first time they are accessed, so that opening an output database is cheap and only
+the data used by the script is read. ``FieldOutput.bulkDataBlocks`` returns the arrays as they are, and
+``FieldOutput.values`` creates the :class:`FieldValue` objects one at a time from them.
+
+Only the output is exported, not the mesh, so that ``Odb.rootAssembly`` and the subsets of a field output by region are
+not available. The symbolic constants are plain strings, which compare equal to those of ``abaqusConstants``.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import os
+from typing import Any, Iterator, Sequence
+
+try:
+    import numpy as np
+except ImportError as error:
+    raise ImportError("The local output databases need NumPy, install it with `pip install abqpy[odb]`") from error
+
+from .odbexport import VERSION
+
+#: The invariants computed by :meth:`FieldOutput.getScalarField`
+INVARIANTS = ("MAGNITUDE", "MISES")
+
+
+def export_path(path: str) -> str:
+    """The directory of the export of an output database, ``Job-1-export`` for ``Job-1.odb``, or the directory itself
+    if it is an export."""
+    if os.path.basename(path) == "manifest.json":
+        return os.path.dirname(os.path.abspath(path))
+    if os.path.isfile(os.path.join(path, "manifest.json")):
+        return os.path.abspath(path)
+    return os.path.abspath(os.path.splitext(path)[0] + "-export")
+
+
+class _Column:
+    """An array of a block of values, loaded when it is accessed for the first time."""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: FieldBulkData | None, owner: type) -> Any:
+        return self if instance is None else instance._column(self.name)
+
+
+class OdbInstance:
+    """The part instance of a block of values, only its name is exported."""
+
+    def __init__(self, name: str):
+        #: A String specifying the instance name.
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"OdbInstance({self.name!r})"
+
+
+class SectionPoint:
+    """A section point of a block of values of a shell or beam."""
+
+    def __init__(self, number: int, description: str = ""):
+        #: An Int specifying the number of the section point.
+        self.number = number
+
+        #: A String specifying the description of the section point.
+        self.description = description
+
+
+class FieldBulkData:
+    """A block of values of a field output, with the same position, instance, element type and section point."""
+
+    #: A Float array of shape (values, components) specifying the data.
+    data = _Column()
+
+    #: A Float array specifying the imaginary part of the data of a complex field, or None.
+    conjugateData = _Column()
+
+    #: A Float array specifying the von Mises stress of the values, or None.
+    mises = _Column()
+
+    #: An Int array specifying the node labels, or None.
+    nodeLabels = _Column()
+
+    #: An Int array specifying the element labels, or None.
+    elementLabels = _Column()
+
+    #: An Int array specifying the integration points, or None.
+    integrationPoints = _Column()
+
+    def __init__(self, odb: Odb, block: dict[str, Any], **arrays: Any):
+        self._odb, self._block, self._arrays = odb, block, arrays
+
+        #: A SymbolicConstant specifying the position of the values, e.g. ``NODAL`` or ``INTEGRATION_POINT``.
+        self.position: str | None = block.get("position")
+
+        #: A SymbolicConstant specifying the type of the values, e.g. ``SCALAR``, ``VECTOR`` or ``TENSOR_3D_FULL``.
+        self.type: str | None = block.get("type")
+
+        #: An OdbInstance object specifying the part instance of the values.
+        self.instance = OdbInstance(block.get("instance") or "")
+
+        #: A String specifying the element type of the values, or None for nodal values.
+        self.elementType: str | None = block.get("elementType")
+
+        #: A tuple of Strings specifying the labels of the components of the data.
+        self.componentLabels: tuple[str, ...] = tuple(block.get("componentLabels") or ())
+
+        #: A SectionPoint object specifying the section point of the values, or None.
+        self.sectionPoint = SectionPoint(**block["sectionPoint"]) if block.get("sectionPoint") else None
+
+    def __len__(self) -> int:
+        return self._block["length"]
+
+    def _column(self, name: str) -> Any:
+        if name in self._arrays:
+            return self._arrays[name]
+        path = self._block.get(name)
+        return None if path is None else self._odb._load(path)
+
+    def _derive(self, **arrays: Any) -> FieldBulkData:
+        """A block with the same labels and other arrays."""
+        block = {key: value for key, value in self._block.items() if key not in arrays}
+        return FieldBulkData(self._odb, block, **{**self._arrays, **arrays})
+
+
+class FieldValue:
+    """A value of a field output at a node, an element or an integration point."""
+
+    def __init__(self, block: FieldBulkData, index: int):
+        self._block, self._index = block, index
+        labels = block.nodeLabels, block.elementLabels, block.integrationPoints
+        node, element, point = (None if array is None else int(array[index]) for array in labels)
+
+        #: A SymbolicConstant specifying the position of the value.
+        self.position = block.position
+
+        #: A SymbolicConstant specifying the type of the value.
+        self.type = block.type
+
+        #: An OdbInstance object specifying the part instance of the value.
+        self.instance = block.instance
+
+        #: A SectionPoint object specifying the section point of the value, or None.
+        self.sectionPoint = block.sectionPoint
+
+        #: An Int specifying the node label, or None.
+        self.nodeLabel = node
+
+        #: An Int specifying the element label, or None.
+        self.elementLabel = element
+
+        #: An Int specifying the integration point, or None.
+        self.integrationPoint = point
+
+        #: A SymbolicConstant specifying the precision of the data, ``SINGLE_PRECISION`` or ``DOUBLE_PRECISION``.
+        self.precision = "DOUBLE_PRECISION" if block.data.dtype == np.float64 else "SINGLE_PRECISION"
+
+    def _value(self, array: Any) -> Any:
+        if array is None:
+            return None
+        row = np.array(array[self._index])
+        return float(row.reshape(-1)[0]) if self.type == "SCALAR" or row.size == 1 else row
+
+    @property
+    def data(self) -> Any:
+        """A Float for a scalar or a Float array specifying the data."""
+        return self._value(self._block.data)
+
+    @property
+    def dataDouble(self) -> Any:
+        """The data in double precision."""
+        data = self.data
+        return float(data) if isinstance(data, float) else data.astype(np.float64)
+
+    @property
+    def conjugateData(self) -> Any:
+        """The imaginary part of the data of a complex field, or None."""
+        return self._value(self._block.conjugateData)
+
+    @property
+    def magnitude(self) -> float | None:
+        """The magnitude of a vector, or None."""
+        return float(np.linalg.norm(self.data)) if self.type == "VECTOR" else None
+
+    @property
+    def mises(self) -> float | None:
+        """The von Mises stress, or None."""
+        mises = self._block.mises
+        return None if mises is None else float(mises[self._index])
+
+
+class FieldValueArray(Sequence):
+    """The values of a field output, created one at a time from its blocks."""
+
+    def __init__(self, blocks: Sequence[FieldBulkData]):
+        self._blocks = list(blocks)
+        self._starts = [0]
+        for block in self._blocks:
+            self._starts.append(self._starts[-1] + len(block))
+
+    def __len__(self) -> int:
+        return self._starts[-1]
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("FieldValueArray index out of range")
+        number = bisect.bisect_right(self._starts, index) - 1
+        return FieldValue(self._blocks[number], index - self._starts[number])
+
+    def __iter__(self) -> Iterator[FieldValue]:
+        for block in self._blocks:
+            for index in range(len(block)):
+                yield FieldValue(block, index)
+
+
+class FieldOutput:
+    """A field output of a frame, e.g. ``U`` or ``S``."""
+
+    def __init__(self, odb: Odb, description: dict[str, Any], blocks: list[FieldBulkData] | None = None):
+        self._odb, self._description = odb, description
+
+        #: A String specifying the output variable name.
+        self.name: str = description["name"]
+
+        #: A String specifying the output variable description.
+        self.description: str = description.get("description", "")
+
+        #: A SymbolicConstant specifying the output type.
+        self.type: str | None = description.get("type")
+
+        #: A tuple of Strings specifying the labels of the components.
+        self.componentLabels: tuple[str, ...] = tuple(description.get("componentLabels") or ())
+
+        #: A tuple of SymbolicConstants specifying the valid invariants.
+        self.validInvariants: tuple[str, ...] = tuple(description.get("validInvariants") or ())
+
+        #: A Boolean specifying whether the data are complex.
+        self.isComplex: bool = bool(description.get("isComplex"))
+
+        #: A tuple of FieldBulkData objects specifying the blocks of values.
+        self.bulkDataBlocks: tuple[FieldBulkData, ...] = tuple(
+            [FieldBulkData(odb, block) for block in description.get("blocks", ())] if blocks is None else blocks
+        )
+
+    @property
+    def values(self) -> FieldValueArray:
+        """A FieldValueArray object specifying the values."""
+        return FieldValueArray(self.bulkDataBlocks)
+
+    def _subset(self, blocks: list[FieldBulkData], **description: Any) -> FieldOutput:
+        return FieldOutput(self._odb, {**self._description, **description}, blocks)
+
+    def getSubset(
+        self,
+        position: str | None = None,
+        elementType: str | None = None,
+        sectionPoint: SectionPoint | None = None,
+        region: Any = None,
+        readOnly: bool = False,
+    ) -> FieldOutput:
+        """Select the values at a position, of an element type or at a section point.
+
+        The values are selected among the exported values only, the values at another position are not extrapolated
+        or averaged as they are by Abaqus. The regions are not supported since the mesh is not exported.
+        """
+        if region is not None:
+            raise NotImplementedError("The regions are not supported by the local output database, see abqpy.localodb")
+        blocks = [
+            block
+            for block in self.bulkDataBlocks
+            if (position is None or block.position == position)
+            and (elementType is None or block.elementType == elementType)
+            and (
+                sectionPoint is None
+                or (block.sectionPoint is not None and block.sectionPoint.number == sectionPoint.number)
+            )
+        ]
+        return self._subset(blocks)
+
+    def getScalarField(self, invariant: str | None = None, componentLabel: str | None = None) -> FieldOutput:
+        """Create a scalar field from a component, e.g. ``componentLabel="S11"``, or from an invariant, ``MAGNITUDE``
+        or ``MISES``."""
+        if componentLabel is not None:
+            index = self.componentLabels.index(componentLabel)
+            blocks = [block._derive(data=block.data[:, index : index + 1], mises=None) for block in self.bulkDataBlocks]
+        elif invariant == "MAGNITUDE":
+            blocks = [
+                block._derive(data=np.linalg.norm(block.data, axis=1)[:, None], mises=None)
+                for block in self.bulkDataBlocks
+            ]
+        elif invariant == "MISES" and all(block.mises is not None for block in self.bulkDataBlocks):
+            blocks = [block._derive(data=np.asarray(block.mises)[:, None]) for block in self.bulkDataBlocks]
+        else:
+            raise ValueError(f"The invariant {invariant} of {self.name} is not available, only {', '.join(INVARIANTS)}")
+        for block in blocks:
+            block.type, block.componentLabels = "SCALAR", ()
+        return self._subset(blocks, type="SCALAR", componentLabels=(), validInvariants=())
+
+
+class OdbFrame:
+    """A frame of a step."""
+
+    def __init__(self, odb: Odb, description: dict[str, Any]):
+        #: An Int specifying the frame number.
+        self.frameId: int = description.get("frameId", description["index"])
+
+        #: An Int specifying the increment number.
+        self.incrementNumber: int | None = description.get("incrementNumber")
+
+        #: A Float specifying the value of the frame, e.g. the step time.
+        self.frameValue: float | None = description.get("frameValue")
+
+        #: A String specifying the description of the frame.
+        self.description: str = description.get("description", "")
+
+        #: A SymbolicConstant specifying the domain of the frame.
+        self.domain: str | None = description.get("domain")
+
+        #: An Int specifying the eigenmode, or None.
+        self.mode: int | None = description.get("mode")
+
+        #: A Float specifying the frequency, or None.
+        self.frequency: float | None = description.get("frequency")
+
+        #: An Int specifying the cyclic mode number, or None.
+        self.cyclicModeNumber: int | None = description.get("cyclicModeNumber")
+
+        #: A repository of FieldOutput objects.
+        self.fieldOutputs: dict[str, FieldOutput] = {
+            name: FieldOutput(odb, field) for name, field in description.get("fieldOutputs", {}).items()
+        }
+
+
+class HistoryOutput:
+    """A history output of a history region, its data are pairs of the frame value and of the value."""
+
+    def __init__(self, odb: Odb, description: dict[str, Any]):
+        self._odb, self._description = odb, description
+
+        #: A String specifying the output variable name.
+        self.name: str = description["name"]
+
+        #: A String specifying the output variable description.
+        self.description: str = description.get("description", "")
+
+        #: A SymbolicConstant specifying the output type.
+        self.type: str | None = description.get("type")
+
+    def _pairs(self, name: str) -> tuple[tuple[float, float], ...] | None:
+        path = self._description.get(name)
+        return None if path is None else tuple(map(tuple, self._odb._load(path).tolist()))
+
+    @property
+    def data(self) -> tuple[tuple[float, float], ...]:
+        """A tuple of pairs of Floats specifying the frame values and the values."""
+        return self._pairs("data") or ()
+
+    @property
+    def conjugateData(self) -> tuple[tuple[float, float], ...] | None:
+        """The imaginary part of the data of a complex output, or None."""
+        return self._pairs("conjugateData")
+
+
+class HistoryRegion:
+    """A history region of a step, e.g. a node."""
+
+    def __init__(self, odb: Odb, description: dict[str, Any]):
+        #: A String specifying the name of the region.
+        self.name: str = description["name"]
+
+        #: A String specifying the description of the region.
+        self.description: str = description.get("description", "")
+
+        #: A SymbolicConstant specifying the position of the region.
+        self.position: str | None = description.get("position")
+
+        #: A repository of HistoryOutput objects.
+        self.historyOutputs: dict[str, HistoryOutput] = {
+            name: HistoryOutput(odb, output) for name, output in description.get("historyOutputs", {}).items()
+        }
+
+
+class OdbStep:
+    """A step of an output database."""
+
+    def __init__(self, odb: Odb, description: dict[str, Any]):
+        #: A String specifying the step name.
+        self.name: str = description["name"]
+
+        #: An Int specifying the step number.
+        self.number: int | None = description.get("number")
+
+        #: A String specifying the step description.
+        self.description: str = description.get("description", "")
+
+        #: A String specifying the step procedure.
+        self.procedure: str = description.get("procedure", "")
+
+        #: A SymbolicConstant specifying the domain of the step.
+        self.domain: str | None = description.get("domain")
+
+        #: A Float specifying the step period.
+        self.timePeriod: float | None = description.get("timePeriod")
+
+        #: A Float specifying the analysis time spent in all the previous steps.
+        self.totalTime: float | None = description.get("totalTime")
+
+        #: A sequence of the exported OdbFrame objects.
+        self.frames: list[OdbFrame] = [OdbFrame(odb, frame) for frame in description.get("frames", ())]
+
+        #: A repository of HistoryRegion objects.
+        self.historyRegions: dict[str, HistoryRegion] = {
+            name: HistoryRegion(odb, region) for name, region in description.get("historyRegions", {}).items()
+        }
+
+    def getFrame(self, frameValue: float, match: str = "CLOSEST") -> OdbFrame:
+        """The frame at a frame value, ``CLOSEST``, ``BEFORE``, ``AFTER`` or ``EXACT``."""
+        frames = [frame for frame in self.frames if frame.frameValue is not None]
+        if match == "BEFORE":
+            frames = [frame for frame in frames if frame.frameValue <= frameValue]  # type: ignore[operator]
+        elif match == "AFTER":
+            frames = [frame for frame in frames if frame.frameValue >= frameValue]  # type: ignore[operator]
+        elif match == "EXACT":
+            frames = [frame for frame in frames if frame.frameValue == frameValue]
+        if not frames:
+            raise ValueError(f"No frame of the step {self.name} matches the frame value {frameValue} ({match})")
+        return min(frames, key=lambda frame: abs(frame.frameValue - frameValue))  # type: ignore[operator]
+
+
+class Odb:
+    """An output database opened from its export, see :func:`openOdb`."""
+
+    def __init__(self, path: str):
+        directory = export_path(path)
+        manifest = os.path.join(directory, "manifest.json")
+        if not os.path.isfile(manifest):
+            raise FileNotFoundError(f"{path} is not exported to {directory}, run `abqpy export-odb {path}` first")
+        with open(manifest) as file:
+            description = json.load(file)
+        if description.get("version") != VERSION:
+            raise ValueError(f"The export {directory} has the version {description.get('version')}, not {VERSION}")
+        self._directory = directory
+        self._arrays: dict[str, Any] = {}  # The loaded arrays, the labels are shared by the blocks
+
+        #: A String specifying the name of the output database.
+        self.name: str = description.get("name", "")
+
+        #: A String specifying the path of the output database.
+        self.path: str = description.get("path") or path
+
+        #: A Boolean specifying whether the output database is read-only, it always is.
+        self.isReadOnly = True
+
+        #: A repository of OdbStep objects.
+        self.steps: dict[str, OdbStep] = {step["name"]: OdbStep(self, step) for step in description["steps"]}
+
+    def _load(self, path: str) -> Any:
+        if path not in self._arrays:
+            self._arrays[path] = np.load(os.path.join(self._directory, path), mmap_mode="r")
+        return self._arrays[path]
+
+    def close(self) -> None:
+        """Release the memory maps of the arrays."""
+        self._arrays.clear()
+
+
+def openOdb(path: str, readOnly: bool = True, readInternalSets: bool = False) -> Odb:
+    """Open the export of an output database, written by ``abqpy export-odb``, as a read-only Odb object.
+
+    Parameters
+    ----------
+    path
+        A String specifying the path to the output database, ``Job-1.odb`` opens ``Job-1-export``, or to the directory
+        of the export.
+    readOnly, readInternalSets
+        Ignored, the output database is read-only and the sets are not exported.
+
+    Returns
+    -------
+    Odb
+        An Odb object.
+    """
+    return Odb(path)
@@ -0,0 +1,91 @@
+"""Convert a Jupyter notebook to the Python script submitted to Abaqus by :func:`abqpy.run`, without starting
+``jupyter nbconvert``.
+
+The script is keyed on the SHA-256 hash of the notebook, written in its header, so that it is only rewritten when the
+notebook has changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from typing import Any
+
+#: The header line of the converted scripts recording the hash of their notebook
+HEADER = "# Converted from {name} by abqpy, sha256: {digest}"
+
+
+def _source(cell: dict[str, Any]) -> str:
+    source = cell.get("source", cell.get("input", ""))  # ``input`` in the notebook format 3
+    return "".join(source) if isinstance(source, list) else source
+
+
+def _code(source: str) -> str:
+    """Comment out the IPython magics and shell commands, they are not available in the Abaqus Python interpreter."""
+    if source.lstrip().startswith("%%"):
+        return "\n".join(f"# {line}" for line in source.splitlines())
+    return "\n".join(f"# {line}" if line.lstrip()[:1] in ("%", "!") else line for line in source.splitlines())
+
+
+def notebook_script(notebook: dict[str, Any], name: str = "", digest: str = "") -> str:
+    """The Python script of a notebook: its code cells, and its markdown cells as comments.
+
+    Parameters
+    ----------
+    notebook : dict[str, Any]
+        The JSON content of the notebook.
+    name : str, optional
+        The file name of the notebook written in the header of the script.
+    digest : str, optional
+        The hash of the notebook written in the header of the script.
+
+    Returns
+    -------
+    str
+        The content of the script.
+    """
+    cells = notebook.get("cells")
+    if cells is None:
+        cells = [cell for worksheet in notebook.get("worksheets", []) for cell in worksheet.get("cells", [])]
+    blocks = ["#!/usr/bin/env python\n# coding: utf-8\n" + HEADER.format(name=name, digest=digest)]
+    for cell in cells:
+        source = _source(cell)
+        if cell.get("cell_type") == "code":
+            count = cell.get("execution_count", cell.get("prompt_number"))
+            blocks.append(f"# In[{count if count is not None else ' '}]:\n\n\n{_code(source)}")
+        elif cell.get("cell_type") in ("markdown", "raw") and source.strip():
+            blocks.append("\n".join(f"# {line}".rstrip() for line in source.splitlines()))
+    return "\n\n\n".join(blocks) + "\n"
+
+
+def convert_notebook(path: str | os.PathLike, output: str | os.PathLike | None = None) -> str:
+    """Convert a notebook to a Python script unless the script was already converted from the same notebook.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        The path of the notebook.
+    output : str | os.PathLike, optional
+        The path of the script, by default the path of the notebook with the ``.py`` suffix.
+
+    Returns
+    -------
+    str
+        The path of the script.
+    """
+    path = os.fspath(path)
+    output = os.fspath(output) if output is not None else os.path.splitext(path)[0] + ".py"
+    with open(path, "rb") as file:
+        content = file.read()
+    name, digest = os.path.basename(path), hashlib.sha256(content).hexdigest()
+    try:
+        with open(output, encoding="utf-8") as file:
+            if HEADER.format(name=name, digest=digest) in [file.readline().rstrip("\n") for _ in range(3)]:
+                return output
+    except (OSError, UnicodeDecodeError):
+        pass
+    script = notebook_script(json.loads(content), name, digest)
+    with open(output, "w", encoding="utf-8") as file:
+        file.write(script)
+    return output
@@ -0,0 +1,256 @@
+"""Export of the field and history output of an output database to ``.npy`` files, see
+:meth:`abqpy.cli.AbqpyCLI.export_odb`.
+
+It is run by ``abaqus python`` with the arguments::
+
+    odbexport.py ODB [OUTPUT] [--steps=STEPS] [--variables=VARIABLES] [--frames=FRAMES] [--no-history]
+
+The field outputs are read with ``FieldOutput.bulkDataBlocks``, the data of a whole block of values at once, instead of
+with ``FieldOutput.values``, and every column of a block, i.e. the data, the node labels, the element labels and the
+integration points, is saved to its own ``.npy`` file as soon as its frame is read, so that only one frame is held in
+memory. The files of a field output are grouped by variable, one chunk per frame and block::
+
+    OUTPUT/manifest.json
+    OUTPUT/STEP-INDEX/VARIABLE/FRAME-INDEX-BLOCK-INDEX-COLUMN.npy
+    OUTPUT/STEP-INDEX/history/REGION-INDEX-OUTPUT.npy
+
+The labels and integration points of a block are saved once and shared by the following frames and variables as long
+as they do not change. The manifest describes the steps, frames, field outputs, blocks and history outputs, with the
+paths of their files relative to the output directory, and is written again after every step. The arrays can then be
+loaded as memory maps with ``numpy.load(path, mmap_mode="r")``.
+
+This file only depends on the standard library and NumPy, and is compatible with Python 2.7, the interpreter of older
+Abaqus releases.
+"""
+
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import re
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # Abaqus ships NumPy, another interpreter needs the odb extra
+    raise ImportError("The export of output databases needs NumPy, install it with `pip install abqpy[odb]`")
+
+#: The version of the layout of the exported files
+VERSION = 1
+
+#: The columns of a block of field output values saved to files, the labels and integration points are shared
+COLUMNS = ("data", "conjugateData", "mises", "nodeLabels", "elementLabels", "integrationPoints")
+SHARED = ("nodeLabels", "elementLabels", "integrationPoints")
+
+
+def safe_name(name):
+    """A file name for the name of a variable or of a history output, e.g. ``S`` or ``U:U1 PI: PART-1 N: 1``."""
+    return re.sub(r"[^A-Za-z0-9_.+-]+", "_", name).strip("_") or "_"
+
+
+def symbol(value):
+    """The name of a symbolic constant, or None."""
+    return None if value is None else str(value)
+
+
+class Exporter(object):
+    """Save the columns of the blocks of values to ``.npy`` files, sharing the labels between frames and variables."""
+
+    def __init__(self, output):
+        self.output = output
+        self.shared = {}  # The last array saved for each column and block, by key, with its path
+
+    def save(self, path, array):
+        directory = os.path.dirname(os.path.join(self.output, path))
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        np.save(os.path.join(self.output, path), array)
+        return path
+
+    def block(self, prefix, block):
+        section = getattr(block, "sectionPoint", None)
+        description = {
+            "instance": getattr(getattr(block, "instance", None), "name", None),
+            "elementType": getattr(block, "elementType", None),
+            "position": symbol(getattr(block, "position", None)),
+            "type": symbol(getattr(block, "type", None)),
+            "componentLabels": list(getattr(block, "componentLabels", None) or ()),
+            "sectionPoint": None if section is None else {"number": section.number, "description": section.description},
+        }
+        key = (description["instance"], description["elementType"], description["position"])
+        key += (None,) if section is None else (section.number,)
+        for column in COLUMNS:
+            values = getattr(block, column, None)
+            if values is None or not len(values):
+                continue
+            array = np.asarray(values)
+            if column in SHARED:
+                last = self.shared.get((column,) + key)
+                if last is not None and last[0].shape == array.shape and np.array_equal(last[0], array):
+                    description[column] = last[1]
+                    continue
+            description[column] = self.save("%s-%s.npy" % (prefix, column), array)
+            if column in SHARED:
+                self.shared[(column,) + key] = (array, description[column])
+        description["length"] = len(np.asarray(block.data))
+        return description
+
+    def frame(self, step, index, frame, variables):
+        description = {
+            "index": index,
+            "frameId": getattr(frame, "frameId", index),
+            "incrementNumber": getattr(frame, "incrementNumber", None),
+            "frameValue": getattr(frame, "frameValue", None),
+            "description": getattr(frame, "description", ""),
+            "domain": symbol(getattr(frame, "domain", None)),
+            "mode": getattr(frame, "mode", None),
+            "frequency": getattr(frame, "frequency", None),
+            "cyclicModeNumber": getattr(frame, "cyclicModeNumber", None),
+            "fieldOutputs": {},
+        }
+        for name in frame.fieldOutputs.keys():
+            if variables and name not in variables:
+                continue
+            field = frame.fieldOutputs[name]
+            directory = "%d/%s" % (step, safe_name(name))
+            blocks = [
+                self.block("%s/%d-%d" % (directory, index, number), block)
+                for number, block in enumerate(field.bulkDataBlocks)
+            ]
+            description["fieldOutputs"][name] = {
+                "name": name,
+                "description": field.description,
+                "type": symbol(field.type),
+                "componentLabels": list(field.componentLabels),
+                "validInvariants": [symbol(invariant) for invariant in field.validInvariants],
+                "isComplex": bool(getattr(field, "isComplex", False)),
+                "blocks": blocks,
+            }
+        return description
+
+    def history(self, step, historyRegions):
+        regions = {}
+        for number, name in enumerate(historyRegions.keys()):
+            region = historyRegions[name]
+            outputs = {}
+            for output in region.historyOutputs.keys():
+                history = region.historyOutputs[output]
+                path = "%d/history/%d-%s.npy" % (step, number, safe_name(output))
+                outputs[output] = {
+                    "name": output,
+                    "description": history.description,
+                    "type": symbol(history.type),
+                    "data": self.save(path, np.asarray(history.data, dtype=float).reshape(-1, 2)),
+                }
+                if getattr(history, "conjugateData", None):
+                    conjugate = np.asarray(history.conjugateData, dtype=float).reshape(-1, 2)
+                    outputs[output]["conjugateData"] = self.save(path[:-4] + "-conjugateData.npy", conjugate)
+            regions[name] = {
+                "name": name,
+                "description": region.description,
+                "position": symbol(region.position),
+                "historyOutputs": outputs,
+            }
+        return regions
+
+
+def select(count, frames):
+    """The indices of the frames to export among ``count`` frames, negative indices count from the last frame."""
+    if not frames:
+        return list(range(count))
+    return sorted(set(index % count for index in frames if -count <= index < count))
+
+
+def export(odb, output, steps=None, variables=None, frames=None, history=True, verbose=True):
+    """Export the field and history output of an open output database to a directory.
+
+    Parameters
+    ----------
+    odb : Odb
+        The output database.
+    output : str
+        The directory the files are written to.
+    steps, variables : list of str, optional
+        The names of the steps and of the field output variables to export, by default all of them.
+    frames : list of int, optional
+        The indices of the frames of every step to export, e.g. ``[-1]`` for the last one, by default all of them.
+    history : bool, optional
+        Whether to export the history output, by default True.
+    verbose : bool, optional
+        Whether to print the progress, by default True.
+
+    Returns
+    -------
+    dict
+        The manifest written to ``manifest.json``.
+    """
+    exporter = Exporter(output)
+    manifest = {"version": VERSION, "name": getattr(odb, "name", ""), "path": getattr(odb, "path", ""), "steps": []}
+    if not os.path.isdir(output):
+        os.makedirs(output)
+    for number, name in enumerate(odb.steps.keys()):
+        if steps and name not in steps:
+            continue
+        step = odb.steps[name]
+        description = {
+            "index": number,
+            "name": name,
+            "number": getattr(step, "number", number + 1),
+            "description": getattr(step, "description", ""),
+            "procedure": getattr(step, "procedure", ""),
+            "domain": symbol(getattr(step, "domain", None)),
+            "timePeriod": getattr(step, "timePeriod", None),
+            "totalTime": getattr(step, "totalTime", None),
+            "frames": [],
+            "historyRegions": {},
+        }
+        for index in select(len(step.frames), frames):
+            description["frames"].append(exporter.frame(number, index, step.frames[index], variables))
+            if verbose:
+                print("%s: frame %d of %d" % (name, index + 1, len(step.frames)))
+                sys.stdout.flush()
+        if history:
+            description["historyRegions"] = exporter.history(number, step.historyRegions)
+        manifest["steps"].append(description)
+        with open(os.path.join(output, "manifest.json"), "w") as file:
+            json.dump(manifest, file, indent=1)
+    with open(os.path.join(output, "manifest.json"), "w") as file:
+        json.dump(manifest, file, indent=1)
+    return manifest
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(prog="odbexport.py", description="Export an output database to .npy files")
+    parser.add_argument("odb")
+    parser.add_argument("output", nargs="?")
+    parser.add_argument("--steps", default="")
+    parser.add_argument("--variables", default="")
+    parser.add_argument("--frames", default="")
+    parser.add_argument("--no-history", dest="history", action="store_false")
+    # ``abaqus python`` passes the arguments of the script as they are, ``abaqus cae noGUI`` after ``--``
+    arguments = parser.parse_args(argv[argv.index("--") + 1 :] if "--" in argv else argv[1:])
+
+    def split(text):
+        return [item.strip() for item in text.split(",") if item.strip()]
+
+    from odbAccess import openOdb
+
+    output = arguments.output or os.path.splitext(arguments.odb)[0] + "-export"
+    odb = openOdb(arguments.odb, readOnly=True)
+    try:
+        export(
+            odb,
+            output,
+            steps=split(arguments.steps),
+            variables=split(arguments.variables),
+            frames=[int(index) for index in split(arguments.frames)],
+            history=arguments.history,
+        )
+    finally:
+        odb.close()
+    print("Exported %s to %s" % (arguments.odb, output))
+
+
+if __name__ == "__main__":
+    main(sys.argv)
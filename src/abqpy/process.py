@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import shlex
+import shutil
+import signal
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import IO, Callable, Optional
+
+#: A callback receiving the output of a command line by line, without the line endings
+OutputCallback = Callable[[str], None]
+
+
+@dataclass(frozen=True)
+class CommandResult:
+    """The result of a command run by :func:`run_command`.
+
+    Attributes
+    ----------
+    command : str
+        The command that was run.
+    returncode : int
+        The exit status of the command, negative if it was killed by a signal (POSIX only).
+    wall_time : float
+        The wall time of the command in seconds.
+    peak_rss : int, optional
+        The peak resident set size of the command and its waited-for children in bytes, None if it is not available
+        on the platform or if the command is run by :func:`arun_command`.
+    timed_out : bool
+        Whether the command was terminated because it exceeded its timeout.
+    cancelled : bool
+        Whether the command was terminated because it was cancelled.
+    """
+
+    command: str
+    returncode: int
+    wall_time: float
+    peak_rss: Optional[int] = None
+    timed_out: bool = False
+    cancelled: bool = False
+
+    def check_returncode(self) -> None:
+        """Raise a :class:`subprocess.CalledProcessError` if the return code is non-zero."""
+        if self.returncode:
+            raise subprocess.CalledProcessError(self.returncode, self.command)
+
+
+def _stream(pipe: IO[str], callback: OutputCallback) -> None:
+    with pipe:
+        for line in pipe:
+            callback(line.rstrip("\r\n"))
+
+
+def _wait(process: subprocess.Popen) -> Optional[int]:
+    """Wait for the process to exit and return its peak RSS in bytes if it is available."""
+    if not hasattr(os, "wait4"):
+        process.wait()
+        return None
+    _, status, usage = os.wait4(process.pid, 0)
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    process.returncode = -os.WTERMSIG(status) if os.WIFSIGNALED(status) else os.WEXITSTATUS(status)
+    return usage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+
+
+def _kill(process: subprocess.Popen, grace: float) -> None:
+    """Terminate the process and all of its children, kill them if they are still alive after ``grace`` seconds."""
+    if sys.platform == "win32":
+        subprocess.run(["taskkill", "/F", "/T", "/PID", str(process.pid)], capture_output=True)
+        return
+    for sig, delay in ((signal.SIGTERM, grace), (signal.SIGKILL, 0)):
+        try:
+            os.killpg(process.pid, sig)
+        except ProcessLookupError:
+            return
+        deadline = time.monotonic() + delay
+        while process.returncode is None and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+
+def run_command(
+    cmd: str,
+    *,
+    stdout: OutputCallback | None = None,
+    stderr: OutputCallback | None = None,
+    timeout: float | None = None,
+    cancel: threading.Event | None = None,
+    cwd: str | None = None,
+    env: dict[str, str] | None = None,
+    grace: float = 5.0,
+) -> CommandResult:
+    """Run a shell command and wait for it to exit.
+
+    The command runs in its own process group (a new process group on Windows), so that all the processes spawned
+    by it can be terminated together when it times out, when it is cancelled or when the current process is
+    interrupted.
+
+    Parameters
+    ----------
+    cmd : str
+        The command to run in the system shell.
+    stdout, stderr : Callable[[str], None], optional
+        The callbacks receiving the standard output and error of the command line by line, from background threads.
+        If None, the stream is inherited from the current process, by default None.
+    timeout : float, optional
+        The maximum wall time of the command in seconds, by default None.
+    cancel : threading.Event, optional
+        An event that terminates the command when it is set, by default None.
+    cwd : str, optional
+        The working directory of the command, by default the current working directory.
+    env : dict[str, str], optional
+        The environment variables of the command, by default the environment of the current process.
+    grace : float, optional
+        The number of seconds to wait after terminating the command before killing it, by default 5.
+
+    Returns
+    -------
+    CommandResult
+        The result of the command.
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        cmd,
+        shell=True,
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.PIPE if stdout else None,
+        stderr=subprocess.PIPE if stderr else None,
+        text=True,
+        errors="replace",
+        bufsize=1,
+        start_new_session=sys.platform != "win32",
+        creationflags=getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0),
+    )
+    readers = [
+        threading.Thread(target=_stream, args=(pipe, callback), daemon=True)
+        for pipe, callback in ((process.stdout, stdout), (process.stderr, stderr))
+        if pipe is not None and callback is not None
+    ]
+    for reader in readers:
+        reader.start()
+
+    peak_rss: list[Optional[int]] = [None]
+    exited = threading.Event()
+
+    def wait() -> None:
+        peak_rss[0] = _wait(process)
+        exited.set()
+
+    threading.Thread(target=wait, daemon=True).start()
+
+    timed_out = cancelled = False
+    deadline = None if timeout is None else time.monotonic() + timeout
+    try:
+        while not exited.wait(0.1):
+            if cancel is not None and cancel.is_set():
+                cancelled = True
+            elif deadline is not None and time.monotonic() >= deadline:
+                timed_out = True
+            else:
+                continue
+            _kill(process, grace)
+            exited.wait()
+            break
+    except BaseException:
+        _kill(process, grace)
+        raise
+    for reader in readers:
+        reader.join(grace)
+    return CommandResult(
+        command=cmd,
+        returncode=process.returncode,
+        wall_time=time.perf_counter() - start,
+        peak_rss=peak_rss[0],
+        timed_out=timed_out,
+        cancelled=cancelled,
+    )
+
+
+def split_command(cmd: str) -> list[str]:
+    """Split a shell command into the arguments of an executable, the executable is looked up in ``PATH``."""
+    args = shlex.split(cmd, posix=sys.platform != "win32")
+    if sys.platform == "win32":
+        args = [arg[1:-1] if len(arg) > 1 and arg[0] == arg[-1] == '"' else arg for arg in args]
+    return [shutil.which(args[0]) or args[0], *args[1:]] if args else args
+
+
+async def _astream(reader: asyncio.StreamReader, callback: OutputCallback) -> None:
+    async for line in reader:
+        callback(line.decode(errors="replace").rstrip("\r\n"))
+
+
+async def _akill(process: asyncio.subprocess.Process, grace: float) -> None:
+    """Terminate the process and all of its children, kill them if they are still alive after ``grace`` seconds."""
+    if sys.platform == "win32":
+        kill = await asyncio.create_subprocess_exec("taskkill", "/F", "/T", "/PID", str(process.pid))
+        await kill.wait()
+    else:
+        for sig in (signal.SIGTERM, signal.SIGKILL):
+            try:
+                os.killpg(process.pid, sig)
+            except ProcessLookupError:
+                break
+            try:
+                await asyncio.wait_for(process.wait(), grace)
+                break
+            except asyncio.TimeoutError:
+                pass
+    await process.wait()
+
+
+async def arun_command(
+    cmd: str,
+    *,
+    stdout: OutputCallback | None = None,
+    stderr: OutputCallback | None = None,
+    timeout: float | None = None,
+    cwd: str | None = None,
+    env: dict[str, str] | None = None,
+    grace: float = 5.0,
+) -> CommandResult:
+    """Run a command without a shell with :func:`asyncio.create_subprocess_exec` and wait for it to exit.
+
+    The command is split into arguments by :func:`split_command`. Like :func:`run_command`, it runs in its own process
+    group, which is terminated when the command times out or when the awaiting task is cancelled.
+
+    Parameters
+    ----------
+    cmd : str
+        The command to run.
+    stdout, stderr : Callable[[str], None], optional
+        The callbacks receiving the standard output and error of the command line by line, from the event loop.
+        If None, the stream is inherited from the current process, by default None.
+    timeout : float, optional
+        The maximum wall time of the command in seconds, by default None.
+    cwd : str, optional
+        The working directory of the command, by default the current working directory.
+    env : dict[str, str], optional
+        The environment variables of the command, by default the environment of the current process.
+    grace : float, optional
+        The number of seconds to wait after terminating the command before killing it, by default 5.
+
+    Returns
+    -------
+    CommandResult
+        The result of the command, its ``peak_rss`` is not measured.
+    """
+    start = time.perf_counter()
+    process = await asyncio.create_subprocess_exec(
+        *split_command(cmd),
+        cwd=cwd,
+        env=env,
+        stdout=asyncio.subprocess.PIPE if stdout else None,
+        stderr=asyncio.subprocess.PIPE if stderr else None,
+        start_new_session=sys.platform != "win32",
+        creationflags=getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0),
+    )
+    readers = [
+        asyncio.ensure_future(_astream(pipe, callback))
+        for pipe, callback in ((process.stdout, stdout), (process.stderr, stderr))
+        if pipe is not None and callback is not None
+    ]
+    timed_out = False
+    try:
+        try:
+            await asyncio.wait_for(process.wait(), timeout)
+        except asyncio.TimeoutError:
+            timed_out = True
+            await _akill(process, grace)
+        if readers:
+            await asyncio.wait(readers, timeout=grace)
+    except BaseException:
+        if process.returncode is None:
+            await _akill(process, grace)
+        raise
+    finally:
+        for reader in readers:
+            reader.cancel()
+    assert process.returncode is not None
+    return CommandResult(
+        command=cmd,
+        returncode=process.returncode,
+        wall_time=time.perf_counter() - start,
+        timed_out=timed_out,
+    )
@@ -0,0 +1,65 @@
+"""Bootstrap profiling a script inside the Abaqus interpreter, submitted by :func:`abqpy.run` when
+:envvar:`ABQPY_PROFILE` is set, see :mod:`abqpy.profiling`.
+
+It is run by ``abaqus cae noGUI`` (or ``abaqus python``) with the arguments::
+
+    profiler.py PROFILER OUTPUT SCRIPT [ARGS ...]
+
+where ``PROFILER`` is ``cprofile`` or ``tracemalloc``. The script is run as ``__main__`` with its arguments, and the
+profile (:mod:`pstats` format) or the memory snapshot (:class:`tracemalloc.Snapshot`) is written to ``OUTPUT``, even
+if the script fails.
+
+This file only depends on the standard library and is compatible with Python 2.7, the interpreter of older Abaqus
+releases, which has no :mod:`tracemalloc`.
+"""
+
+from __future__ import print_function
+
+import os
+import runpy
+import sys
+
+# The profiled script must not submit itself to Abaqus again when abqpy is installed
+os.environ["ABQPY_SKIP_ABAQUS"] = "true"
+
+
+def run(script, argv):
+    sys.argv = [script] + list(argv)
+    sys.path.insert(0, os.path.dirname(os.path.abspath(script)))
+    runpy.run_path(script, run_name="__main__")
+
+
+def profile(profiler, output, script, argv):
+    """Run a script under a profiler and write the profile to the output file."""
+    if profiler == "cprofile":
+        import cProfile
+
+        profile = cProfile.Profile()
+        try:
+            profile.runcall(run, script, argv)
+        finally:
+            profile.dump_stats(output)
+            print("abqpy: the profile of %s is written to %s" % (script, output), file=sys.stderr)
+    elif profiler == "tracemalloc":
+        import tracemalloc
+
+        tracemalloc.start(int(os.environ.get("PYTHONTRACEMALLOC", 0)) or 25)
+        try:
+            run(script, argv)
+        finally:
+            tracemalloc.take_snapshot().dump(output)
+            tracemalloc.stop()
+            print("abqpy: the memory snapshot of %s is written to %s" % (script, output), file=sys.stderr)
+    else:
+        raise ValueError("Unknown profiler %r, it must be cprofile or tracemalloc" % profiler)
+
+
+def main(argv):
+    # ``abaqus cae noGUI`` passes its own arguments first, the arguments of the script follow ``--``
+    argv = argv[argv.index("--") + 1 :] if "--" in argv else argv[1:]
+    profiler, output, script = argv[:3]
+    profile(profiler, output, script, argv[3:])
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,149 @@
+"""Profile the scripts submitted by :func:`abqpy.run` inside Abaqus, enabled by :envvar:`ABQPY_PROFILE`, and summarize
+the profiles with ``abqpy profile-report``.
+
+The script is run by the :mod:`abqpy.profiler` bootstrap under :mod:`cProfile` or :mod:`tracemalloc`, which writes the
+profile next to the script, ``script.prof`` or ``script.snapshot``.
+"""
+
+from __future__ import annotations
+
+import builtins
+import os
+import pstats
+import re
+import sys
+import types
+from typing import Any
+
+#: The bootstrap profiling the scripts, run by ``abaqus cae noGUI`` or ``abaqus python``
+PROFILER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "profiler.py")
+
+# The functions of the bootstrap running the script, they are not part of the profile of the script
+BOOTSTRAP = ("profiler.py", "runpy.py", "<frozen runpy>")
+
+#: The profilers and the suffixes of their output files
+PROFILERS = {"cprofile": ".prof", "tracemalloc": ".snapshot"}
+
+# The C functions as they are named by cProfile, ``<method 'name' of 'type' objects>`` or
+# ``<built-in method module.name>``, with braces in Python 2
+METHOD = re.compile(r"^[<{]method '(?P<name>\w+)' of '(?P<type>[\w.]+)' objects[>}]$")
+BUILTIN = re.compile(r"^[<{]built-in method (?P<name>[\w.]+)[>}]$")
+
+STDLIB = set(getattr(sys, "stdlib_module_names", sys.builtin_module_names)) | {"builtins", "__builtin__"}
+TYPES = [value for value in (*vars(builtins).values(), *vars(types).values()) if isinstance(value, type)]
+# The builtin types and their methods, the class methods of the builtin types are named without their type by cProfile
+BUILTIN_TYPES = {cls.__name__ for cls in TYPES}
+BUILTIN_METHODS = {name for cls in TYPES for name in dir(cls)}
+
+
+def profile_command(profiler: str, script: str, argv: list[str]) -> tuple[str, list[str]]:
+    """The bootstrap script and its arguments profiling a script.
+
+    Parameters
+    ----------
+    profiler : str
+        The profiler, ``cprofile`` or ``tracemalloc``.
+    script : str
+        The path of the script.
+    argv : list[str]
+        The arguments of the script.
+
+    Returns
+    -------
+    tuple[str, list[str]]
+        The path of the bootstrap script and its arguments.
+    """
+    if profiler not in PROFILERS:
+        raise ValueError(f"The profiler must be one of {', '.join(PROFILERS)}, got {profiler!r}")
+    output = os.path.splitext(os.path.abspath(script))[0] + PROFILERS[profiler]
+    return PROFILER, [profiler, output, os.path.abspath(script), *argv]
+
+
+def is_abaqus_call(name: str) -> bool:
+    """Whether a function of a profile is a call of the Abaqus Scripting Interface.
+
+    The Abaqus Scripting Interface is implemented in C, so its calls are the C functions of the profile that are
+    neither methods of builtin types nor functions of the standard library.
+    """
+    method, builtin = METHOD.match(name), BUILTIN.match(name)
+    if method:
+        owner = method.group("type")
+        return owner not in BUILTIN_TYPES and owner.split(".")[0] not in STDLIB
+    if builtin:
+        name = builtin.group("name")
+        return name.split(".")[0] not in STDLIB if "." in name else name not in BUILTIN_METHODS
+    return False
+
+
+def _name(function: tuple[str, int, str]) -> str:
+    filename, line, name = function
+    if filename == "~":
+        match = METHOD.match(name) or BUILTIN.match(name)
+        if match and "type" in match.groupdict():
+            return f"{match.group('type')}.{match.group('name')}"
+        return match.group("name") if match else name
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+def stats_table(path: str, limit: int = 20) -> dict[str, Any]:
+    """The hottest Abaqus Scripting Interface calls and Python functions of a :mod:`cProfile` profile.
+
+    Returns
+    -------
+    dict[str, Any]
+        The ``total_time`` of the profile, and the ``abaqus`` calls sorted by their total time and the ``python``
+        functions sorted by their cumulative time, as lists of ``(name, calls, total_time, cumulative_time)``.
+    """
+    stats = pstats.Stats(path)
+    abaqus, python = [], []
+    for function, (_, calls, total, cumulative, _) in stats.stats.items():  # type: ignore
+        row = (_name(function), calls, total, cumulative)
+        if function[0] == "~":
+            if is_abaqus_call(function[2]):
+                abaqus.append(row)
+        elif os.path.basename(function[0]) not in BOOTSTRAP:
+            python.append(row)
+    return {
+        "total_time": stats.total_tt,  # type: ignore
+        "abaqus": sorted(abaqus, key=lambda row: row[2], reverse=True)[:limit],
+        "python": sorted(python, key=lambda row: row[3], reverse=True)[:limit],
+    }
+
+
+def format_stats(path: str, limit: int = 20) -> str:
+    """Summarize a :mod:`cProfile` profile, see :func:`stats_table`."""
+    table = stats_table(path, limit)
+    header = f"{'calls':>10} {'total [s]':>10} {'per call [ms]':>14} {'cumulative [s]':>15}  function"
+    lines = [f"Profile of {path}: {table['total_time']:.3f} s"]
+    for title, rows in (("Abaqus Scripting Interface calls", table["abaqus"]), ("Python functions", table["python"])):
+        lines += ["", f"{title}:", header]
+        lines += [
+            f"{calls:>10} {total:10.3f} {total / calls * 1e3 if calls else 0:14.3f} {cumulative:15.3f}  {name}"
+            for name, calls, total, cumulative in rows
+        ]
+    return "\n".join(lines)
+
+
+def format_snapshot(path: str, limit: int = 20) -> str:
+    """Summarize a :mod:`tracemalloc` snapshot: the lines allocating the most memory still allocated at the end."""
+    import tracemalloc
+
+    snapshot = tracemalloc.Snapshot.load(path)
+    statistics = snapshot.statistics("lineno")
+    lines = [
+        f"Memory snapshot of {path}: {sum(stat.size for stat in statistics) / 2**20:.1f} MiB in "
+        f"{sum(stat.count for stat in statistics)} blocks",
+        "",
+        f"{'size [KiB]':>12} {'blocks':>10}  line",
+    ]
+    for stat in statistics[:limit]:
+        frame = stat.traceback[0]
+        lines.append(f"{stat.size / 1024:12.1f} {stat.count:>10}  {frame.filename}:{frame.lineno}")
+    return "\n".join(lines)
+
+
+def profile_report(path: str, limit: int = 20) -> str:
+    """Summarize a profile written by the :mod:`abqpy.profiler` bootstrap, a ``.prof`` or a ``.snapshot`` file."""
+    if path.endswith(PROFILERS["tracemalloc"]):
+        return format_snapshot(path, limit)
+    return format_stats(path, limit)
@@ -1,8 +1,8 @@
 import os
 import sys
+import time
 import warnings
 
-from .cli import abaqus
 from .config import config
 
 
@@ -21,14 +21,16 @@ def run(cae: bool = True) -> None:
     if config.make_docs or config.skip_abaqus:
         return
 
+    # With the local backend, the scripts run in the current interpreter on the exported output databases, whether
+    # they import odbAccess or abaqus first, e.g. through the abaqusConstants imported by odbAccess
+    if config.odb_backend == "local":
+        return
+
     # If it is a jupyter notebook, convert it to python script
     try:  # If it is a jupyter notebook
         import ipynbname
 
-        filePath = ipynbname.path()
-        print("You are running a jupyter notebook, it will be converted to a pure python script.")
-        os.system(f"jupyter nbconvert --to python {filePath}")
-        filePath = os.path.relpath(filePath.with_suffix(".py"))
+        notebook = ipynbname.path()
     except (FileNotFoundError, ImportError, Exception):
         # Get the main script file
         main = sys.modules["__main__"]
@@ -39,17 +41,64 @@ def run(cae: bool = True) -> None:
             filePath = os.path.relpath(main.__file__)
         except ValueError:
             filePath = main.__file__
+    else:
+        from .notebook import convert_notebook
+
+        print("You are running a jupyter notebook, it will be converted to a pure python script.")
+        filePath = os.path.relpath(convert_notebook(notebook))
 
     # Alternative to use abaqus command line options at run time
     print("The script will be submitted to Abaqus next and the current Python session will be closed.")
     gettrace = getattr(sys, "gettrace", None)
-    if config.debug or (gettrace is not None and gettrace()):
-        warnings.warn(
-            "You are running the script in debug mode, the script will be opened in Abaqus PDE where you can debug it."
-        )
-        abaqus.pde(script=filePath)
-    elif cae:
-        abaqus.cae(filePath, *sys.argv[1:], **config.cae.model_dump())
-    else:
-        abaqus.python(filePath, *sys.argv[1:], **config.python.model_dump())
-    sys.exit(0)
+    debug = config.debug or (gettrace is not None and gettrace())
+    command = "cae" if cae else "python"
+    argv = sys.argv[1:]
+
+    # Run the script under a profiler inside Abaqus, the profile is written next to the script
+    if config.profile and not debug:
+        from .profiling import profile_command
+
+        filePath, argv = profile_command(config.profile, filePath, argv)
+        print(f"The script will be profiled with {config.profile}, the profile will be written to {argv[1]}")
+
+    # Restore the outputs of an identical submission from the cache
+    cache = key = None
+    if config.cache_dir and config.cache_outputs and not debug and not config.profile:
+        from .cache import ResultCache, submission_key
+
+        cache = ResultCache(config.cache_dir, config.cache_size)
+        options = getattr(config, command).model_dump()
+        key = submission_key(filePath, argv, command, options, config.cache_inputs, config.cache_outputs)
+        files = cache.restore(key)
+        if files is not None:
+            print(f"The outputs of an identical submission are restored from the cache: {', '.join(files)}")
+            sys.exit(0)
+
+    # The timestamps of the file system may be coarser than the clock
+    launched = time.time() - 1
+    status = None
+    if config.server and not debug:
+        from .server import submit
+
+        status = submit(filePath, argv, cae=cae, connection=config.server)
+        if status is None:
+            warnings.warn(f"No kernel server of the {command} mode is running, see `abqpy serve`.")
+
+    if status is None:
+        from .cli import abaqus
+
+        if debug:
+            warnings.warn(
+                "You are running the script in debug mode, the script will be opened in Abaqus PDE where you can "
+                "debug it."
+            )
+            result = abaqus.pde(script=filePath)
+        elif cae:
+            result = abaqus.cae(filePath, *argv, **config.cae.model_dump())
+        else:
+            result = abaqus.python(filePath, *argv, **config.python.model_dump())
+        status = result.returncode
+
+    if cache is not None and key is not None and status == 0:
+        cache.store(key, config.cache_outputs, script=os.path.abspath(filePath), since=launched)
+    sys.exit(status)
@@ -0,0 +1,98 @@
+"""Client of the abqpy kernel server, a long-lived Abaqus process started by ``abqpy serve`` that runs the scripts
+submitted by :func:`abqpy.run` without paying the startup cost of Abaqus every time.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+from typing import IO, Any
+
+#: The bootstrap script of the kernel server, run by ``abaqus python`` or ``abaqus cae noGUI``
+BOOTSTRAP = os.path.join(os.path.dirname(os.path.abspath(__file__)), "kernel.py")
+
+#: The default connection file of the kernel server
+CONNECTION = os.path.join(os.path.expanduser("~"), ".abqpy", "kernel.json")
+
+
+def _request(connection: str, timeout: float | None = None, **request: Any) -> tuple[socket.socket, IO[bytes]]:
+    with open(connection) as file:
+        info = json.load(file)
+    # The timeout applies to the connection and to the reads of the response, until it is cleared by the caller
+    sock = socket.create_connection((info["host"], info["port"]), timeout=timeout)
+    sock.sendall((json.dumps(dict(request, token=info["token"])) + "\n").encode("utf-8"))
+    return sock, sock.makefile("rb")
+
+
+def ping(connection: str = CONNECTION, timeout: float = 1.0) -> dict[str, Any] | None:
+    """Return the ``mode`` and ``pid`` of the kernel server, its ``error`` if it refuses the token of the connection
+    file, or None if it is not running."""
+    try:
+        sock, reader = _request(connection, timeout, command="ping")
+        with sock, reader:
+            return json.loads(reader.readline())
+    except (OSError, ValueError):
+        return None
+
+
+def shutdown(connection: str = CONNECTION) -> None:
+    """Stop the kernel server once it has finished the running script."""
+    sock, reader = _request(connection, command="shutdown")
+    with sock, reader:
+        reader.readline()
+
+
+def submit(
+    script: str,
+    argv: list[str],
+    *,
+    cae: bool = False,
+    connection: str = CONNECTION,
+    stdout: IO[str] | None = None,
+    stderr: IO[str] | None = None,
+    timeout: float = 1.0,
+) -> int | None:
+    """Run a script in the kernel server and stream its output.
+
+    Parameters
+    ----------
+    script : str
+        The path of the script, it is run as ``__main__`` in the current working directory.
+    argv : list[str]
+        The arguments of the script, ``sys.argv[1:]``.
+    cae : bool, optional
+        Whether the script needs an ``abaqus cae`` kernel rather than an ``abaqus python`` one, by default False.
+    connection : str, optional
+        The connection file written by the kernel server, by default ``~/.abqpy/kernel.json``.
+    stdout, stderr : IO[str], optional
+        The streams the output of the script is written to, by default ``sys.stdout`` and ``sys.stderr``.
+    timeout : float, optional
+        The number of seconds to wait for the kernel server to answer a ping, the script is not run if it is busy, by
+        default 1. The output of the script is then waited for without a timeout.
+
+    Returns
+    -------
+    int | None
+        The exit status of the script, or None if no kernel server of the right mode is running, in which case the
+        script was not run.
+    """
+    info = ping(connection, timeout)
+    # A server refusing the token of the connection file, e.g. a stale one, answers the ping with an error
+    if info is None or "error" in info or info.get("mode") != ("cae" if cae else "python"):
+        return None
+    streams = {"stdout": stdout or sys.stdout, "stderr": stderr or sys.stderr}
+    sock, reader = _request(connection, timeout, script=script, argv=argv, cwd=os.getcwd())
+    sock.settimeout(None)  # The script may run for a long time
+    with sock, reader:
+        for line in reader:
+            message = json.loads(line)
+            if "exit" in message:
+                return message["exit"]
+            if "error" in message:
+                raise RuntimeError(f"The kernel server refused the script: {message['error']}")
+            for name, text in message.items():
+                streams[name].write(text)
+                streams[name].flush()
+    raise ConnectionError("The kernel server closed the connection before the script exited")
@@ -0,0 +1,163 @@
+"""Run a script for every parameter set of a parametric study, each one in its own working directory."""
+
+from __future__ import annotations
+
+import csv
+import itertools
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Mapping, Sequence, Union
+
+from .batch import batch_workers, outcome, wait_cases
+from .process import CommandResult
+
+#: A grid of parameter values whose cartesian product is swept, or a sequence of parameter sets
+Params = Union[Mapping[str, Sequence[Any]], Sequence[Mapping[str, Any]]]
+
+
+def parameter_sets(params: Params) -> list[dict[str, Any]]:
+    """Expand a grid of parameter values into the list of its parameter sets, in the order of the grid.
+
+    Examples
+    --------
+    >>> parameter_sets({"E": [1e3, 1e4], "nu": [0.2]})
+    [{'E': 1000.0, 'nu': 0.2}, {'E': 10000.0, 'nu': 0.2}]
+    """
+    if isinstance(params, Mapping):
+        return [dict(zip(params, values)) for values in itertools.product(*params.values())]
+    return [dict(case) for case in params]
+
+
+def read_result(path: str) -> list[dict[str, Any]]:
+    """Read the rows of a result file, a CSV file with a header or a JSON file of an object or a list of objects."""
+    if path.lower().endswith(".json"):
+        with open(path) as file:
+            data = json.load(file)
+        return list(data) if isinstance(data, list) else [data]
+    with open(path, newline="") as file:
+        return [
+            {name.strip(): _number(value) for name, value in row.items() if name is not None}
+            for row in csv.DictReader(file)
+        ]
+
+
+def _number(value: str) -> Any:
+    try:
+        return int(value)
+    except ValueError:
+        try:
+            return float(value)
+        except ValueError:
+            return value
+
+
+def sweep(
+    script: str,
+    params: Params,
+    *,
+    workers: int | None = None,
+    result: str | None = None,
+    argv: Callable[[dict[str, Any]], Sequence[str]] | None = None,
+    env: bool = False,
+    mode: str = "cae",
+    directory: str = "sweep",
+    cpus: int = 1,
+    tokens: int | None = None,
+    timeout: float | None = None,
+) -> list[dict[str, Any]]:
+    """Run a script for every parameter set concurrently, each one in its own working directory, and collect the
+    result files of the cases into a single table.
+
+    The parameters are passed to the script as ``--name=value`` arguments, and as the ``ABQPY_SWEEP_PARAMS``
+    environment variable (a JSON object) if ``env`` is True. The parameters are also written to ``params.json`` and
+    the output of the script to ``abqpy.log`` in the working directory of each case, ``{directory}/case-{index}``.
+
+    If the sweep is interrupted, e.g. by Ctrl-C, the running cases are terminated, the pending ones are cancelled, and
+    the :class:`KeyboardInterrupt` is raised again after the rows of the finished cases are written to ``results.csv``.
+
+    Parameters
+    ----------
+    script : str
+        The Python script to run with ``abaqus cae noGUI`` or ``abaqus python``.
+    params : Mapping[str, Sequence[Any]] | Sequence[Mapping[str, Any]]
+        A grid of parameter values, e.g. ``{"E": [1e3, 1e4], "nu": [0.2, 0.3]}``, whose cartesian product is swept,
+        or the sequence of the parameter sets to run.
+    workers : int, optional
+        The maximum number of cases to run at the same time, by default the number of CPUs divided by ``cpus``.
+    result : str, optional
+        The result file written by the script in its working directory, a CSV file with a header or a JSON file,
+        whose rows are collected into the table, by default None.
+    argv : Callable[[dict[str, Any]], Sequence[str]], optional
+        A function returning the arguments of the script for a parameter set, by default the ``--name=value``
+        arguments.
+    env : bool, optional
+        Whether to pass the parameters as the ``ABQPY_SWEEP_PARAMS`` environment variable as well, by default False.
+    mode : str, optional
+        Run the script with ``abaqus cae noGUI`` (``"cae"``) or ``abaqus python`` (``"python"``), by default
+        ``"cae"``.
+    directory : str, optional
+        The directory of the working directories of the cases, by default ``"sweep"``.
+    cpus : int, optional
+        The number of CPUs used by each case, by default 1.
+    tokens : int, optional
+        The license token budget of the sweep, by default :envvar:`ABQPY_LICENSE_TOKENS` or not limited.
+    timeout : float, optional
+        The maximum wall time of each case in seconds, by default None.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        The rows of the table: the ``case`` index, the parameters, the ``returncode`` and ``wall_time`` of the case,
+        and the columns of the result file, one row per row of the result file.
+    """
+    from .cli import AbqpyCLI
+    from .config import config
+
+    if mode not in ("cae", "python"):
+        raise ValueError(f"mode must be 'cae' or 'python', got {mode!r}")
+    script = os.path.abspath(script)
+    cases = parameter_sets(params)
+    workers = batch_workers(len(cases), cpus, workers, tokens if tokens is not None else config.license_tokens)
+    cancel = threading.Event()
+
+    def run(index: int) -> list[dict[str, Any]]:
+        case = cases[index]
+        cwd = os.path.join(directory, f"case-{index:0{len(str(len(cases) - 1))}d}")
+        os.makedirs(cwd, exist_ok=True)
+        with open(os.path.join(cwd, "params.json"), "w") as file:
+            json.dump(case, file)
+        environ = dict(os.environ, ABQPY_SWEEP_PARAMS=json.dumps(case)) if env else None
+        # The arguments are quoted by the command line interface, the values may have spaces or shell characters
+        args = [str(arg) for arg in argv(case)] if argv else [f"--{name}={value}" for name, value in case.items()]
+        with open(os.path.join(cwd, "abqpy.log"), "w") as log:
+
+            def write(line: str) -> None:
+                print(line, file=log, flush=True)
+
+            cli = AbqpyCLI(stdout=write, stderr=write, timeout=timeout, cancel=cancel, cwd=cwd, env=environ)
+            status: CommandResult = cli.cae(script, *args) if mode == "cae" else cli.python(script, *args)
+        row = {"case": index, **case, "returncode": status.returncode, "wall_time": status.wall_time}
+        path = os.path.join(cwd, result) if result else None
+        if status.returncode or path is None or not os.path.exists(path):
+            return [row]
+        return [{**row, **values} for values in read_result(path)] or [row]
+
+    print(f"Running {len(cases)} cases of {os.path.basename(script)} with {workers} workers in {directory}")
+    with ThreadPoolExecutor(workers) as executor:
+        futures = [executor.submit(run, index) for index in range(len(cases))]
+        try:
+            wait_cases(futures, cancel)
+        finally:
+            # The rows of the finished cases are written even if the sweep is interrupted or a case raised
+            rows = [row for case in map(outcome, futures) if isinstance(case, list) for row in case]
+            if rows:
+                columns = list(dict.fromkeys(name for row in rows for name in row))
+                with open(os.path.join(directory, "results.csv"), "w", newline="") as file:
+                    writer = csv.DictWriter(file, columns)
+                    writer.writeheader()
+                    writer.writerows(rows)
+    for future in futures:  # Raise the error of the first case that raised
+        future.result()
+    return rows
@@ -0,0 +1,96 @@
+"""Run-time type checking of the command line interface, controlled by :envvar:`ABQPY_TYPECHECK`.
+
+- ``full``: every call is checked by :func:`typeguard.typechecked`;
+- ``sample``: a fraction (:envvar:`ABQPY_TYPECHECK_RATE`) of the calls, chosen at random, is checked;
+- ``off``: the calls are not checked, and :mod:`typeguard` is not imported.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import random
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+MODES = ("off", "sample", "full")
+
+
+def _sampled(func: Callable, checked: Callable, rate: float) -> Callable:
+    """A function calling the checked function for a fraction ``rate`` of the calls, and the original one otherwise."""
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def coroutine(*args, **kwargs):
+            return await (checked if random.random() < rate else func)(*args, **kwargs)
+
+        return coroutine
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return (checked if random.random() < rate else func)(*args, **kwargs)
+
+    return wrapper
+
+
+def _sample(original: Any, checked: Any, rate: float) -> Any:
+    if inspect.isfunction(original) and inspect.isfunction(checked):
+        return _sampled(original, checked, rate)
+    if isinstance(original, property) and isinstance(checked, property):
+
+        def accessor(func: Any, other: Any) -> Any:
+            return _sampled(func, other, rate) if func is not None and other is not func else func
+
+        return property(
+            accessor(original.fget, checked.fget),
+            accessor(original.fset, checked.fset),
+            accessor(original.fdel, checked.fdel),
+            original.__doc__,
+        )
+    if isinstance(original, (classmethod, staticmethod)) and isinstance(checked, type(original)):
+        return type(original)(_sampled(original.__func__, checked.__func__, rate))
+    return checked
+
+
+def typecheck(target: T, mode: str | None = None, rate: float | None = None) -> T:
+    """Instrument a function or the methods of a class with :func:`typeguard.typechecked` according to the type
+    checking mode.
+
+    Parameters
+    ----------
+    target : T
+        The function or class to instrument.
+    mode : str, optional
+        The type checking mode, ``off``, ``sample`` or ``full``, by default :envvar:`ABQPY_TYPECHECK`.
+    rate : float, optional
+        The fraction of the calls checked in the ``sample`` mode, by default :envvar:`ABQPY_TYPECHECK_RATE`.
+
+    Returns
+    -------
+    T
+        The instrumented function or class, the class is instrumented in place.
+    """
+    if mode is None or rate is None:
+        from .config import config
+
+        mode = config.typecheck if mode is None else mode
+        rate = config.typecheck_rate if rate is None else rate
+    if mode not in MODES:
+        raise ValueError(f"The type checking mode must be one of {', '.join(MODES)}, got {mode!r}")
+    if mode == "off" or (mode == "sample" and rate <= 0):
+        return target
+
+    from typeguard import typechecked
+
+    if mode == "full" or rate >= 1:
+        return typechecked(target)  # type: ignore
+    if not inspect.isclass(target):
+        return _sampled(target, typechecked(target), rate)  # type: ignore
+    originals = dict(vars(target))
+    typechecked(target)
+    for key, original in originals.items():
+        checked = vars(target)[key]
+        if checked is not original:
+            setattr(target, key, _sample(original, checked, rate))
+    return target
@@ -1,24 +1,29 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import abaqus
-import assembly
-import connector
-import connectorBehavior
-import displayGroupMdbToolset as dgm
-import displayGroupOdbToolset as dgo
-import interaction
-import job
-import load
-import material
-import mesh
-import optimization
-import part
-import regionToolset
-import section
-import sketch
-import step
-import visualization
-import xyPlot
+from abqpy.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    import assembly
+    import connector
+    import connectorBehavior
+    import displayGroupMdbToolset as dgm
+    import displayGroupOdbToolset as dgo
+    import interaction
+    import job
+    import load
+    import material
+    import mesh
+    import optimization
+    import part
+    import regionToolset
+    import section
+    import sketch
+    import step
+    import visualization
+    import xyPlot
 
 # if 'HKS_WITH_STUB' in _environ:
 #     import stub
@@ -44,3 +49,27 @@ __all__ = [
     "visualization",
     "xyPlot",
 ]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "assembly": "assembly",
+        "connector": "connector",
+        "connectorBehavior": "connectorBehavior",
+        "dgm": "displayGroupMdbToolset",
+        "dgo": "displayGroupOdbToolset",
+        "interaction": "interaction",
+        "job": "job",
+        "load": "load",
+        "material": "material",
+        "mesh": "mesh",
+        "optimization": "optimization",
+        "part": "part",
+        "regionToolset": "regionToolset",
+        "section": "section",
+        "sketch": "sketch",
+        "step": "step",
+        "visualization": "visualization",
+        "xyPlot": "xyPlot",
+    },
+)
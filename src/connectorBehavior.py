@@ -1,14 +1,20 @@
 from __future__ import annotations
 
-from abaqus.Connector.ConnectorDamage import ConnectorDamage
-from abaqus.Connector.ConnectorDamping import ConnectorDamping
-from abaqus.Connector.ConnectorElasticity import ConnectorElasticity
-from abaqus.Connector.ConnectorFailure import ConnectorFailure
-from abaqus.Connector.ConnectorFriction import ConnectorFriction
-from abaqus.Connector.ConnectorLock import ConnectorLock
-from abaqus.Connector.ConnectorPlasticity import ConnectorPlasticity
-from abaqus.Connector.ConnectorPotential import ConnectorPotential
-from abaqus.Connector.ConnectorStop import ConnectorStop
+from typing import TYPE_CHECKING
+
+import abaqus  # noqa
+from abqpy.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from abaqus.Connector.ConnectorDamage import ConnectorDamage
+    from abaqus.Connector.ConnectorDamping import ConnectorDamping
+    from abaqus.Connector.ConnectorElasticity import ConnectorElasticity
+    from abaqus.Connector.ConnectorFailure import ConnectorFailure
+    from abaqus.Connector.ConnectorFriction import ConnectorFriction
+    from abaqus.Connector.ConnectorLock import ConnectorLock
+    from abaqus.Connector.ConnectorPlasticity import ConnectorPlasticity
+    from abaqus.Connector.ConnectorPotential import ConnectorPotential
+    from abaqus.Connector.ConnectorStop import ConnectorStop
 
 __all__ = [
     "ConnectorDamage",
@@ -21,3 +27,18 @@ __all__ = [
     "ConnectorPotential",
     "ConnectorStop",
 ]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "ConnectorDamage": "abaqus.Connector.ConnectorDamage:ConnectorDamage",
+        "ConnectorDamping": "abaqus.Connector.ConnectorDamping:ConnectorDamping",
+        "ConnectorElasticity": "abaqus.Connector.ConnectorElasticity:ConnectorElasticity",
+        "ConnectorFailure": "abaqus.Connector.ConnectorFailure:ConnectorFailure",
+        "ConnectorFriction": "abaqus.Connector.ConnectorFriction:ConnectorFriction",
+        "ConnectorLock": "abaqus.Connector.ConnectorLock:ConnectorLock",
+        "ConnectorPlasticity": "abaqus.Connector.ConnectorPlasticity:ConnectorPlasticity",
+        "ConnectorPotential": "abaqus.Connector.ConnectorPotential:ConnectorPotential",
+        "ConnectorStop": "abaqus.Connector.ConnectorStop:ConnectorStop",
+    },
+)
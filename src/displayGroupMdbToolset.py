@@ -1,21 +1,7 @@
 from __future__ import annotations
 
-from abaqus.DisplayGroup.Leaf import Leaf
-from abaqus.DisplayGroup.LeafFromDatums import LeafFromDatums
-from abaqus.DisplayGroup.LeafFromDisplayGroup import LeafFromDisplayGroup
-from abaqus.DisplayGroup.LeafFromGeometry import LeafFromGeometry
-from abaqus.DisplayGroup.LeafFromInstance import LeafFromInstance
-from abaqus.DisplayGroup.LeafFromInstanceElementLabels import (
-    LeafFromInstanceElementLabels,
-)
-from abaqus.DisplayGroup.LeafFromInstanceNodeLabels import LeafFromInstanceNodeLabels
-from abaqus.DisplayGroup.LeafFromMeshElementLabels import LeafFromMeshElementLabels
-from abaqus.DisplayGroup.LeafFromMeshNodeLabels import LeafFromMeshNodeLabels
-from abaqus.DisplayGroup.LeafFromMeshSurfaceSets import LeafFromMeshSurfaceSets
-from abaqus.DisplayGroup.LeafFromPartElementLabels import LeafFromPartElementLabels
-from abaqus.DisplayGroup.LeafFromPartNodeLabels import LeafFromPartNodeLabels
-from abaqus.DisplayGroup.LeafFromReferencePoint import LeafFromReferencePoint
-from abaqus.DisplayGroup.LeafFromSets import LeafFromSets
+from typing import TYPE_CHECKING
+
 from abaqus.UtilityAndView.abaqusConstants import (
     ADD,
     ALL,
@@ -41,6 +27,27 @@ from abaqus.UtilityAndView.abaqusConstants import (
     REMOVE,
     REPLACE,
 )
+from abqpy.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from abaqus.DisplayGroup.Leaf import Leaf
+    from abaqus.DisplayGroup.LeafFromDatums import LeafFromDatums
+    from abaqus.DisplayGroup.LeafFromDisplayGroup import LeafFromDisplayGroup
+    from abaqus.DisplayGroup.LeafFromGeometry import LeafFromGeometry
+    from abaqus.DisplayGroup.LeafFromInstance import LeafFromInstance
+    from abaqus.DisplayGroup.LeafFromInstanceElementLabels import (
+        LeafFromInstanceElementLabels,
+    )
+    from abaqus.DisplayGroup.LeafFromInstanceNodeLabels import (
+        LeafFromInstanceNodeLabels,
+    )
+    from abaqus.DisplayGroup.LeafFromMeshElementLabels import LeafFromMeshElementLabels
+    from abaqus.DisplayGroup.LeafFromMeshNodeLabels import LeafFromMeshNodeLabels
+    from abaqus.DisplayGroup.LeafFromMeshSurfaceSets import LeafFromMeshSurfaceSets
+    from abaqus.DisplayGroup.LeafFromPartElementLabels import LeafFromPartElementLabels
+    from abaqus.DisplayGroup.LeafFromPartNodeLabels import LeafFromPartNodeLabels
+    from abaqus.DisplayGroup.LeafFromReferencePoint import LeafFromReferencePoint
+    from abaqus.DisplayGroup.LeafFromSets import LeafFromSets
 
 # Inspected from Abaqus 2021
 __all__ = [
@@ -103,3 +110,23 @@ __all__ = [
     "__name__",
     "__package__",
 ]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "Leaf": "abaqus.DisplayGroup.Leaf:Leaf",
+        "LeafFromDatums": "abaqus.DisplayGroup.LeafFromDatums:LeafFromDatums",
+        "LeafFromDisplayGroup": "abaqus.DisplayGroup.LeafFromDisplayGroup:LeafFromDisplayGroup",
+        "LeafFromGeometry": "abaqus.DisplayGroup.LeafFromGeometry:LeafFromGeometry",
+        "LeafFromInstance": "abaqus.DisplayGroup.LeafFromInstance:LeafFromInstance",
+        "LeafFromInstanceElementLabels": "abaqus.DisplayGroup.LeafFromInstanceElementLabels:LeafFromInstanceElementLabels",
+        "LeafFromInstanceNodeLabels": "abaqus.DisplayGroup.LeafFromInstanceNodeLabels:LeafFromInstanceNodeLabels",
+        "LeafFromMeshElementLabels": "abaqus.DisplayGroup.LeafFromMeshElementLabels:LeafFromMeshElementLabels",
+        "LeafFromMeshNodeLabels": "abaqus.DisplayGroup.LeafFromMeshNodeLabels:LeafFromMeshNodeLabels",
+        "LeafFromMeshSurfaceSets": "abaqus.DisplayGroup.LeafFromMeshSurfaceSets:LeafFromMeshSurfaceSets",
+        "LeafFromPartElementLabels": "abaqus.DisplayGroup.LeafFromPartElementLabels:LeafFromPartElementLabels",
+        "LeafFromPartNodeLabels": "abaqus.DisplayGroup.LeafFromPartNodeLabels:LeafFromPartNodeLabels",
+        "LeafFromReferencePoint": "abaqus.DisplayGroup.LeafFromReferencePoint:LeafFromReferencePoint",
+        "LeafFromSets": "abaqus.DisplayGroup.LeafFromSets:LeafFromSets",
+    },
+)
@@ -1,27 +1,7 @@
 from __future__ import annotations
 
-from abaqus.DisplayGroup.Leaf import Leaf
-from abaqus.DisplayGroup.LeafFromConstraintNames import LeafFromConstraintNames
-from abaqus.DisplayGroup.LeafFromDisplayGroup import LeafFromDisplayGroup
-from abaqus.DisplayGroup.LeafFromElementLabels import LeafFromElementLabels
-from abaqus.DisplayGroup.LeafFromElementSets import LeafFromElementSets
-from abaqus.DisplayGroup.LeafFromElementVarRange import LeafFromElementVarRange
-from abaqus.DisplayGroup.LeafFromModelElemLabels import LeafFromModelElemLabels
-from abaqus.DisplayGroup.LeafFromModelNodeLabels import LeafFromModelNodeLabels
-from abaqus.DisplayGroup.LeafFromNodeLabels import LeafFromNodeLabels
-from abaqus.DisplayGroup.LeafFromNodeSets import LeafFromNodeSets
-from abaqus.DisplayGroup.LeafFromNodeVarRange import LeafFromNodeVarRange
-from abaqus.DisplayGroup.LeafFromOdbEdgePick import LeafFromOdbEdgePick
-from abaqus.DisplayGroup.LeafFromOdbElementLayups import LeafFromOdbElementLayups
-from abaqus.DisplayGroup.LeafFromOdbElementMaterials import LeafFromOdbElementMaterials
-from abaqus.DisplayGroup.LeafFromOdbElementPick import LeafFromOdbElementPick
-from abaqus.DisplayGroup.LeafFromOdbElementPlies import LeafFromOdbElementPlies
-from abaqus.DisplayGroup.LeafFromOdbElementSections import LeafFromOdbElementSections
-from abaqus.DisplayGroup.LeafFromOdbElementTypes import LeafFromOdbElementTypes
-from abaqus.DisplayGroup.LeafFromOdbNodePick import LeafFromOdbNodePick
-from abaqus.DisplayGroup.LeafFromPartInstance import LeafFromPartInstance
-from abaqus.DisplayGroup.LeafFromSurfaceSets import LeafFromSurfaceSets
-from abaqus.DisplayGroup.LeafFromSurfaceVarRange import LeafFromSurfaceVarRange
+from typing import TYPE_CHECKING
+
 from abaqus.UtilityAndView.abaqusConstants import (
     ADD,
     ALL,
@@ -47,6 +27,35 @@ from abaqus.UtilityAndView.abaqusConstants import (
     REMOVE,
     REPLACE,
 )
+from abqpy.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from abaqus.DisplayGroup.Leaf import Leaf
+    from abaqus.DisplayGroup.LeafFromConstraintNames import LeafFromConstraintNames
+    from abaqus.DisplayGroup.LeafFromDisplayGroup import LeafFromDisplayGroup
+    from abaqus.DisplayGroup.LeafFromElementLabels import LeafFromElementLabels
+    from abaqus.DisplayGroup.LeafFromElementSets import LeafFromElementSets
+    from abaqus.DisplayGroup.LeafFromElementVarRange import LeafFromElementVarRange
+    from abaqus.DisplayGroup.LeafFromModelElemLabels import LeafFromModelElemLabels
+    from abaqus.DisplayGroup.LeafFromModelNodeLabels import LeafFromModelNodeLabels
+    from abaqus.DisplayGroup.LeafFromNodeLabels import LeafFromNodeLabels
+    from abaqus.DisplayGroup.LeafFromNodeSets import LeafFromNodeSets
+    from abaqus.DisplayGroup.LeafFromNodeVarRange import LeafFromNodeVarRange
+    from abaqus.DisplayGroup.LeafFromOdbEdgePick import LeafFromOdbEdgePick
+    from abaqus.DisplayGroup.LeafFromOdbElementLayups import LeafFromOdbElementLayups
+    from abaqus.DisplayGroup.LeafFromOdbElementMaterials import (
+        LeafFromOdbElementMaterials,
+    )
+    from abaqus.DisplayGroup.LeafFromOdbElementPick import LeafFromOdbElementPick
+    from abaqus.DisplayGroup.LeafFromOdbElementPlies import LeafFromOdbElementPlies
+    from abaqus.DisplayGroup.LeafFromOdbElementSections import (
+        LeafFromOdbElementSections,
+    )
+    from abaqus.DisplayGroup.LeafFromOdbElementTypes import LeafFromOdbElementTypes
+    from abaqus.DisplayGroup.LeafFromOdbNodePick import LeafFromOdbNodePick
+    from abaqus.DisplayGroup.LeafFromPartInstance import LeafFromPartInstance
+    from abaqus.DisplayGroup.LeafFromSurfaceSets import LeafFromSurfaceSets
+    from abaqus.DisplayGroup.LeafFromSurfaceVarRange import LeafFromSurfaceVarRange
 
 # Inspected from Abaqus 2021
 __all__ = [
@@ -144,3 +153,31 @@ __all__ = [
     "__name__",
     "__package__",
 ]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "Leaf": "abaqus.DisplayGroup.Leaf:Leaf",
+        "LeafFromConstraintNames": "abaqus.DisplayGroup.LeafFromConstraintNames:LeafFromConstraintNames",
+        "LeafFromDisplayGroup": "abaqus.DisplayGroup.LeafFromDisplayGroup:LeafFromDisplayGroup",
+        "LeafFromElementLabels": "abaqus.DisplayGroup.LeafFromElementLabels:LeafFromElementLabels",
+        "LeafFromElementSets": "abaqus.DisplayGroup.LeafFromElementSets:LeafFromElementSets",
+        "LeafFromElementVarRange": "abaqus.DisplayGroup.LeafFromElementVarRange:LeafFromElementVarRange",
+        "LeafFromModelElemLabels": "abaqus.DisplayGroup.LeafFromModelElemLabels:LeafFromModelElemLabels",
+        "LeafFromModelNodeLabels": "abaqus.DisplayGroup.LeafFromModelNodeLabels:LeafFromModelNodeLabels",
+        "LeafFromNodeLabels": "abaqus.DisplayGroup.LeafFromNodeLabels:LeafFromNodeLabels",
+        "LeafFromNodeSets": "abaqus.DisplayGroup.LeafFromNodeSets:LeafFromNodeSets",
+        "LeafFromNodeVarRange": "abaqus.DisplayGroup.LeafFromNodeVarRange:LeafFromNodeVarRange",
+        "LeafFromOdbEdgePick": "abaqus.DisplayGroup.LeafFromOdbEdgePick:LeafFromOdbEdgePick",
+        "LeafFromOdbElementLayups": "abaqus.DisplayGroup.LeafFromOdbElementLayups:LeafFromOdbElementLayups",
+        "LeafFromOdbElementMaterials": "abaqus.DisplayGroup.LeafFromOdbElementMaterials:LeafFromOdbElementMaterials",
+        "LeafFromOdbElementPick": "abaqus.DisplayGroup.LeafFromOdbElementPick:LeafFromOdbElementPick",
+        "LeafFromOdbElementPlies": "abaqus.DisplayGroup.LeafFromOdbElementPlies:LeafFromOdbElementPlies",
+        "LeafFromOdbElementSections": "abaqus.DisplayGroup.LeafFromOdbElementSections:LeafFromOdbElementSections",
+        "LeafFromOdbElementTypes": "abaqus.DisplayGroup.LeafFromOdbElementTypes:LeafFromOdbElementTypes",
+        "LeafFromOdbNodePick": "abaqus.DisplayGroup.LeafFromOdbNodePick:LeafFromOdbNodePick",
+        "LeafFromPartInstance": "abaqus.DisplayGroup.LeafFromPartInstance:LeafFromPartInstance",
+        "LeafFromSurfaceSets": "abaqus.DisplayGroup.LeafFromSurfaceSets:LeafFromSurfaceSets",
+        "LeafFromSurfaceVarRange": "abaqus.DisplayGroup.LeafFromSurfaceVarRange:LeafFromSurfaceVarRange",
+    },
+)
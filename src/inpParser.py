@@ -1,7 +1,12 @@
 from __future__ import annotations
 
-from abaqus.InputFileParser.InputFile import InputFile
+from abaqus.InputFileParser.InputFile import InputFile, iterKeywords
+from abaqus.InputFileParser.Keyword import Keyword
+from abaqus.InputFileParser.KeywordSequence import KeywordSequence
 
 __all__ = [
     "InputFile",
+    "Keyword",
+    "KeywordSequence",
+    "iterKeywords",
 ]
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
-from abaqus.Job.Job import Job
-from abaqus.Odb.AnalyticSurfaceSegment import AnalyticSurfaceSegment
-from abaqus.Odb.HistoryPoint import HistoryPoint
-from odbAccess import (
-    AnalyticSurfaceProfile,
-    Odb,
-    isUpgradeRequiredForOdb,
-    openOdb,
-    upgradeOdb,
-)
+from typing import TYPE_CHECKING
+
+import abaqus  # noqa
+from abqpy.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from abaqus.Job.Job import Job
+    from abaqus.Odb.AnalyticSurfaceSegment import AnalyticSurfaceSegment
+    from abaqus.Odb.HistoryPoint import HistoryPoint
+    from odbAccess import (
+        AnalyticSurfaceProfile,
+        Odb,
+        isUpgradeRequiredForOdb,
+        openOdb,
+        upgradeOdb,
+    )
 
 # from odbAccess import closeOdb
 # from odbAccess import truncateOdb
@@ -26,3 +32,17 @@ __all__ = [
     # "closeOdb",
     # "truncateOdb",
 ]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "Job": "abaqus.Job.Job:Job",
+        "AnalyticSurfaceSegment": "abaqus.Odb.AnalyticSurfaceSegment:AnalyticSurfaceSegment",
+        "HistoryPoint": "abaqus.Odb.HistoryPoint:HistoryPoint",
+        "AnalyticSurfaceProfile": "odbAccess:AnalyticSurfaceProfile",
+        "Odb": "odbAccess:Odb",
+        "isUpgradeRequiredForOdb": "odbAccess:isUpgradeRequiredForOdb",
+        "openOdb": "odbAccess:openOdb",
+        "upgradeOdb": "odbAccess:upgradeOdb",
+    },
+)
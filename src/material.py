@@ -1,7 +1,20 @@
 from __future__ import annotations
 
-from abaqus.Material.evaluateMaterial import evaluateMaterial
+from typing import TYPE_CHECKING
+
+import abaqus  # noqa
+from abqpy.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from abaqus.Material.evaluateMaterial import evaluateMaterial
 
 __all__ = [
     "evaluateMaterial",
 ]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "evaluateMaterial": "abaqus.Material.evaluateMaterial:evaluateMaterial",
+    },
+)
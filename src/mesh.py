@@ -1,8 +1,20 @@
 from __future__ import annotations
 
-from abaqus.Mesh.ElemType import ElemType
+from typing import TYPE_CHECKING
+
 from abaqusConstants import *
+from abqpy.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from abaqus.Mesh.ElemType import ElemType
 
 __all__ = [
     "ElemType",
 ]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "ElemType": "abaqus.Mesh.ElemType:ElemType",
+    },
+)
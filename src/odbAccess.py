@@ -1,26 +1,53 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import auto_all
 
 from abqpy import run
+from abqpy.config import config as _config
+from abqpy.lazy import lazy_attributes
 
 run(cae=False)
 auto_all.start_all()
 
 from math import *  # noqa
 
-from abaqus.Odb.Odb import Odb  # noqa
-from abaqus.Odb.OdbCommands import (  # noqa
-    AnalyticSurfaceProfile,
-    isUpgradeRequiredForOdb,
-    maxEnvelope,
-    minEnvelope,
-    openOdb,
-    upgradeOdb,
-)
-from abaqus.UtilityAndView.BackwardCompatibility import BackwardCompatibility  # noqa
 from abaqusConstants import *  # noqa
 
-backwardCompatibility = BackwardCompatibility()
-
 auto_all.end_all()
+
+if TYPE_CHECKING:
+    from abaqus.Odb.Odb import Odb  # noqa
+    from abaqus.Odb.OdbCommands import (  # noqa
+        AnalyticSurfaceProfile,
+        isUpgradeRequiredForOdb,
+        maxEnvelope,
+        minEnvelope,
+        openOdb,
+        upgradeOdb,
+    )
+    from abaqus.UtilityAndView.BackwardCompatibility import (  # noqa
+        BackwardCompatibility,
+    )
+
+    backwardCompatibility = BackwardCompatibility()
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "Odb": "abaqus.Odb.Odb:Odb",
+        "AnalyticSurfaceProfile": "abaqus.Odb.OdbCommands:AnalyticSurfaceProfile",
+        "isUpgradeRequiredForOdb": "abaqus.Odb.OdbCommands:isUpgradeRequiredForOdb",
+        "maxEnvelope": "abaqus.Odb.OdbCommands:maxEnvelope",
+        "minEnvelope": "abaqus.Odb.OdbCommands:minEnvelope",
+        "openOdb": "abaqus.Odb.OdbCommands:openOdb",
+        "upgradeOdb": "abaqus.Odb.OdbCommands:upgradeOdb",
+        "BackwardCompatibility": "abaqus.UtilityAndView.BackwardCompatibility:BackwardCompatibility",
+        "backwardCompatibility": "abaqus.UtilityAndView.BackwardCompatibility:BackwardCompatibility()",
+        # The local backend opens the output databases exported by ``abqpy export-odb`` instead, see abqpy.localodb
+        **(
+            {"Odb": "abqpy.localodb:Odb", "openOdb": "abqpy.localodb:openOdb"} if _config.odb_backend == "local" else {}
+        ),
+    },
+)
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
-from regionToolset import Region
-from sketch import Sketch, SketchTransform
-from xyPlot import (
-    XYDataFromFile,
-    XYDataFromFreeBody,
-    XYDataFromHistory,
-    XYDataFromPath,
-    XYDataFromShellThickness,
-    xyDataListFromField,
-)
+from typing import TYPE_CHECKING
+
+import abaqus  # noqa
+from abqpy.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from regionToolset import Region
+    from sketch import Sketch, SketchTransform
+    from xyPlot import (
+        XYDataFromFile,
+        XYDataFromFreeBody,
+        XYDataFromHistory,
+        XYDataFromPath,
+        XYDataFromShellThickness,
+        xyDataListFromField,
+    )
 
 # inspected from Abaqus cli
 
@@ -24,3 +30,18 @@ __all__ = [
     "XYDataFromShellThickness",
     "xyDataListFromField",
 ]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "Region": "regionToolset:Region",
+        "Sketch": "sketch:Sketch",
+        "SketchTransform": "sketch:SketchTransform",
+        "XYDataFromFile": "xyPlot:XYDataFromFile",
+        "XYDataFromFreeBody": "xyPlot:XYDataFromFreeBody",
+        "XYDataFromHistory": "xyPlot:XYDataFromHistory",
+        "XYDataFromPath": "xyPlot:XYDataFromPath",
+        "XYDataFromShellThickness": "xyPlot:XYDataFromShellThickness",
+        "xyDataListFromField": "xyPlot:xyDataListFromField",
+    },
+)
@@ -1,10 +1,23 @@
 from __future__ import annotations
 
-import displayGroupMdbToolset
-from abaqus import mdb
+from typing import TYPE_CHECKING
+
 from abaqusConstants import *
+from abqpy.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    import displayGroupMdbToolset
+    from abaqus import mdb
 
 __all__ = [
     "displayGroupMdbToolset",
     "mdb",
 ]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "displayGroupMdbToolset": "displayGroupMdbToolset",
+        "mdb": "abaqus:mdb",
+    },
+)
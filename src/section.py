@@ -1,7 +1,20 @@
 from __future__ import annotations
 
-from abaqus.Property.PlyStackPlot import MdbPlyStackPlot
+from typing import TYPE_CHECKING
+
+import abaqus  # noqa
+from abqpy.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from abaqus.Property.PlyStackPlot import MdbPlyStackPlot
 
 __all__ = [
     "MdbPlyStackPlot",
 ]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "MdbPlyStackPlot": "abaqus.Property.PlyStackPlot:MdbPlyStackPlot",
+    },
+)
@@ -1,7 +1,20 @@
 from __future__ import annotations
 
-from abaqus.Region.Region import Region
+from typing import TYPE_CHECKING
+
+import abaqus  # noqa
+from abqpy.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from abaqus.Region.Region import Region
 
 __all__ = [
     "Region",
 ]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "Region": "abaqus.Region.Region:Region",
+    },
+)
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from abaqus import session
-from abaqus.Odb.OdbCommands import (
-    AnalyticSurfaceProfile,
-    isUpgradeRequiredForOdb,
-    maxEnvelope,
-    minEnvelope,
-    openOdb,
-    upgradeOdb,
-)
-from abaqus.Property.PlyStackPlot import OdbPlyStackPlot
 from abaqusConstants import *
+from abqpy.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from abaqus.Odb.OdbCommands import (
+        AnalyticSurfaceProfile,
+        isUpgradeRequiredForOdb,
+        maxEnvelope,
+        minEnvelope,
+        openOdb,
+        upgradeOdb,
+    )
+    from abaqus.Property.PlyStackPlot import OdbPlyStackPlot
 
 session.Viewport(name="Viewport: 1")
 
@@ -24,3 +29,16 @@ __all__ = [
     "AnalyticSurfaceProfile",
     "OdbPlyStackPlot",
 ]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "AnalyticSurfaceProfile": "abaqus.Odb.OdbCommands:AnalyticSurfaceProfile",
+        "isUpgradeRequiredForOdb": "abaqus.Odb.OdbCommands:isUpgradeRequiredForOdb",
+        "maxEnvelope": "abaqus.Odb.OdbCommands:maxEnvelope",
+        "minEnvelope": "abaqus.Odb.OdbCommands:minEnvelope",
+        "openOdb": "abaqus.Odb.OdbCommands:openOdb",
+        "upgradeOdb": "abaqus.Odb.OdbCommands:upgradeOdb",
+        "OdbPlyStackPlot": "abaqus.Property.PlyStackPlot:OdbPlyStackPlot",
+    },
+)
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
-from abaqus.XY.XYDataCommands import (
-    XYDataFromFile,
-    XYDataFromFreeBody,
-    XYDataFromHistory,
-    XYDataFromPath,
-    XYDataFromShellThickness,
-    xyDataListFromField,
-)
+from typing import TYPE_CHECKING
+
+import abaqus  # noqa
+from abqpy.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from abaqus.XY.XYDataCommands import (
+        XYDataFromFile,
+        XYDataFromFreeBody,
+        XYDataFromHistory,
+        XYDataFromPath,
+        XYDataFromShellThickness,
+        xyDataListFromField,
+    )
 
 __all__ = [
     "XYDataFromFile",
@@ -17,3 +23,15 @@ __all__ = [
     "XYDataFromShellThickness",
     "XYDataFromPath",
 ]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "XYDataFromFile": "abaqus.XY.XYDataCommands:XYDataFromFile",
+        "XYDataFromFreeBody": "abaqus.XY.XYDataCommands:XYDataFromFreeBody",
+        "XYDataFromHistory": "abaqus.XY.XYDataCommands:XYDataFromHistory",
+        "XYDataFromPath": "abaqus.XY.XYDataCommands:XYDataFromPath",
+        "XYDataFromShellThickness": "abaqus.XY.XYDataCommands:XYDataFromShellThickness",
+        "xyDataListFromField": "abaqus.XY.XYDataCommands:xyDataListFromField",
+    },
+)
@@ -21,3 +21,31 @@ def pytest_configure(config: pytest.Config) -> None:
     os.environ["ABQPY_SKIP_ABAQUS"] = "true"
     os.chdir(os.path.dirname(os.path.abspath(__file__)))
     sys.path.insert(0, os.path.abspath("../src"))
+
+
+FAKE_ABAQUS = """
+import os, sys, time
+print("abaqus", *sys.argv[1:], flush=True)
+print("fake abaqus error", file=sys.stderr, flush=True)
+time.sleep(float(os.environ.get("FAKE_ABAQUS_SLEEP", 0)))
+sys.exit(int(os.environ.get("FAKE_ABAQUS_EXIT", 0)))
+"""
+
+
+@pytest.fixture
+def fake_abaqus(tmp_path, monkeypatch: pytest.MonkeyPatch) -> str:
+    """A fake ``abaqus`` command set as ``ABAQUS_BAT_PATH``, it echoes its arguments to the standard output, writes a
+    line to the standard error, sleeps ``FAKE_ABAQUS_SLEEP`` seconds and exits with ``FAKE_ABAQUS_EXIT``.
+
+    Args:
+        tmp_path: The temporary directory of the test.
+        monkeypatch (pytest.MonkeyPatch): The monkeypatch fixture.
+
+    Returns:
+        str: The fake ``abaqus`` command.
+    """
+    script = tmp_path / "abaqus.py"
+    script.write_text(FAKE_ABAQUS)
+    command = f'"{sys.executable}" "{script}"'
+    monkeypatch.setenv("ABAQUS_BAT_PATH", command)
+    return command
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import pytest
+
+from abqpy.batch import batch_workers, format_summary, license_tokens
+from abqpy.cli import AbqpyCLI
+from abqpy.process import CommandResult
+
+
+@pytest.mark.parametrize(
+    "cases, cpus, workers, tokens, expected",
+    [(100, 1, 4, None, 4), (2, 1, 4, None, 2), (100, 1, 8, 12, 2), (100, 4, 8, 30, 3), (1, 1, None, None, 1)],
+)
+def test_batch_workers(cases: int, cpus: int, workers: int | None, tokens: int | None, expected: int):
+    assert batch_workers(cases, cpus, workers, tokens) == expected
+
+
+def test_license_tokens():
+    assert [license_tokens(cpus) for cpus in (1, 2, 4, 8, 16)] == [5, 6, 8, 12, 16]
+    with pytest.raises(ValueError, match="needs 8 license tokens"):
+        batch_workers(10, cpus=4, tokens=5)
+
+
+def test_batch(
+    fake_abaqus: str,
+    tmp_path_factory: pytest.TempPathFactory,
+    capsys: pytest.CaptureFixture,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    tmp_path = tmp_path_factory.mktemp("cases")
+    for name in ("a.py", "b.py", "sub/a.py", "job.inp"):
+        (tmp_path / name).parent.mkdir(exist_ok=True)
+        (tmp_path / name).touch()
+    directory = str(tmp_path / "batch")
+    results = AbqpyCLI().batch(str(tmp_path / "**/*.py"), str(tmp_path / "*.inp"), workers=2, directory=directory)
+    assert [result.returncode for result in results] == [0, 0, 0, 0]
+    assert sorted(os.listdir(directory)) == ["a", "a-2", "b", "job"]
+    with open(os.path.join(directory, "job", "abqpy.log")) as file:
+        # The standard output and error are read by different threads, their lines may be interleaved in any order
+        assert sorted(file.read().splitlines()) == [
+            f"abaqus job=job input={tmp_path / 'job.inp'} cpus=1 interactive",
+            "fake abaqus error",
+        ]
+    assert "4 of 4 cases succeeded" in capsys.readouterr().out
+
+    monkeypatch.setenv("FAKE_ABAQUS_EXIT", "2")
+    results = AbqpyCLI().batch(str(tmp_path / "b.py"), mode="python", directory=directory)
+    assert results[0].returncode == 2 and "0 of 1 cases succeeded" in capsys.readouterr().out
+    with open(os.path.join(directory, "b", "abqpy.log")) as file:
+        assert f"abaqus python {tmp_path / 'b.py'}" in file.read().splitlines()
+
+
+def test_format_summary():
+    results = [
+        CommandResult("a", 0, 1.0),
+        CommandResult("b", -15, 2.0, cancelled=True),
+        None,
+        OSError("No space left on device"),
+    ]
+    lines = format_summary(["a", "b", "c", "d"], results).splitlines()
+    assert [line.split()[:2] for line in lines[2:6]] == [
+        ["a", "ok"],
+        ["b", "cancelled"],
+        ["c", "cancelled"],
+        ["d", "failed"],
+    ]
+    assert lines[6:] == ["1 of 4 cases succeeded, 2 cancelled", "d: OSError: No space left on device"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="SIGINT cannot be sent to a console process")
+def test_batch_interrupt(fake_abaqus: str, tmp_path, monkeypatch: pytest.MonkeyPatch):
+    (tmp_path / "cases").mkdir()
+    for name in ("a.py", "b.py", "c.py"):
+        (tmp_path / "cases" / name).touch()
+    monkeypatch.setenv("FAKE_ABAQUS_SLEEP", "30")
+    monkeypatch.setenv("PYTHONPATH", os.path.abspath("../src"))
+    command = [sys.executable, "-m", "abqpy", "batch", str(tmp_path / "cases/*.py"), "--workers=2", "--directory=batch"]
+    process = subprocess.Popen(command, cwd=tmp_path, stdout=subprocess.PIPE, text=True)
+    while len(list(tmp_path.glob("batch/*/abqpy.log"))) < 2:
+        time.sleep(0.1)
+    start = time.perf_counter()
+    process.send_signal(signal.SIGINT)
+    stdout, _ = process.communicate(timeout=20)
+    # The running cases are terminated instead of waited for, and the pending one is never started
+    assert process.returncode != 0 and time.perf_counter() - start < 10
+    assert "0 of 3 cases succeeded, 3 cancelled" in stdout and not (tmp_path / "batch" / "c").exists()
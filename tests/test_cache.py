@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from abqpy.cache import ResultCache, parse_size, submission_key
+
+# Stands in for ``abaqus``, writes the output file of the script and counts its calls
+ABAQUS = """
+import sys
+with open("calls.txt", "a") as file:
+    file.write(" ".join(sys.argv[1:]) + "\\n")
+with open("results/out.csv", "w") as file:
+    file.write("U3\\n-0.1\\n")
+"""
+
+
+def test_parse_size():
+    assert [parse_size(size) for size in (100, "100", "2K", "1.5M", "10G", "10GiB")] == [
+        100,
+        100,
+        2048,
+        3 << 19,
+        10 << 30,
+        10 << 30,
+    ]
+
+
+def test_result_cache(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "script.py").write_text("print('hello')")
+    (tmp_path / "mesh.inp").write_text("*NODE")
+    key = submission_key("script.py", ["1"], "cae", {"gui": False}, ["*.inp"], ["*.odb"])
+    assert key == submission_key("script.py", ["1"], "cae", {"gui": False}, ["*.inp"], ["*.odb"])
+    assert key != submission_key("script.py", ["2"], "cae", {"gui": False}, ["*.inp"], ["*.odb"])
+    (tmp_path / "mesh.inp").write_text("*ELEMENT")
+    assert key != submission_key("script.py", ["1"], "cae", {"gui": False}, ["*.inp"], ["*.odb"])
+
+    cache = ResultCache(str(tmp_path / "cache"), size=250)
+    assert cache.restore(key) is None
+    for i, name in enumerate("abc"):
+        (tmp_path / f"{name}.odb").write_bytes(b"x" * 100)
+        assert cache.store(f"key-{name}", [f"{name}.odb"]) == [f"{name}.odb"]
+        os.utime(tmp_path / "cache" / f"key-{name}" / "manifest.json", (i, i))
+        if name == "b":
+            assert cache.restore("key-a") == ["a.odb"]  # a is now used more recently than b
+    assert [entry["key"] for entry in cache.entries()] == ["key-a", "key-c"]
+    assert cache.prune(100) == ["key-c"] and cache.clear() == 1 and cache.entries() == []
+
+
+def test_stale_outputs(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache"))
+    for name in ("stale.csv", "new.csv"):
+        (tmp_path / name).write_text("U3\n-0.1\n")
+    launched = os.path.getmtime(tmp_path / "new.csv")
+    os.utime(tmp_path / "stale.csv", (launched - 60, launched - 60))
+    assert cache.store("key", ["*.csv"], cwd=str(tmp_path), since=launched) == ["new.csv"]
+    assert cache.restore("key", str(tmp_path / "restored")) == ["new.csv"]
+    assert cache.store("stale", ["stale.csv"], cwd=str(tmp_path), since=launched) == []
+    assert cache.restore("stale") is None
+
+
+def test_run(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    (tmp_path / "fake_abaqus.py").write_text(ABAQUS)
+    (tmp_path / "results").mkdir()
+    (tmp_path / "script.py").write_text("from abaqus import *\n")
+    env = dict(
+        os.environ,
+        ABAQUS_BAT_PATH=f'"{sys.executable}" "{tmp_path / "fake_abaqus.py"}"',
+        ABQPY_CACHE_DIR=str(tmp_path / "cache"),
+        ABQPY_CACHE_OUTPUTS="results/*.csv",
+        PYTHONPATH=os.path.abspath("../src"),
+    )
+    env.pop("ABQPY_SKIP_ABAQUS")
+
+    def run(*argv: str) -> str:
+        command = [sys.executable, "script.py", *argv]
+        return subprocess.run(command, cwd=tmp_path, env=env, check=True, capture_output=True, text=True).stdout
+
+    run("1")
+    os.remove(tmp_path / "results" / "out.csv")
+    assert "restored from the cache: " + os.path.join("results", "out.csv") in run("1")
+    assert (tmp_path / "results" / "out.csv").read_text() == "U3\n-0.1\n"
+    run("2")
+    assert (tmp_path / "calls.txt").read_text().splitlines() == [
+        "cae noGUI=script.py -- 1",
+        "cae noGUI=script.py -- 2",
+    ]
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import threading
+import time
+
+import pytest
+
+from abqpy.cli import AbqpyCLI
+from abqpy.process import CommandResult
+
+
+def test_run(fake_abaqus: str):
+    stdout: list[str] = []
+    stderr: list[str] = []
+    result = AbqpyCLI(stdout=stdout.append, stderr=stderr.append).cae("script.py", "arg", gui=True)
+    assert isinstance(result, CommandResult) and result.returncode == 0 and result.wall_time > 0
+    assert result.command.startswith(fake_abaqus) and not (result.timed_out or result.cancelled)
+    assert stdout == ["abaqus cae script=script.py -- arg"] and stderr == ["fake abaqus error"]
+    assert result.peak_rss is None if sys.platform == "win32" else result.peak_rss > 0
+
+
+def test_returncode(fake_abaqus: str, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("FAKE_ABAQUS_EXIT", "3")
+    result = AbqpyCLI(stdout=lambda line: None).python("script.py")
+    assert result.returncode == 3
+    with pytest.raises(Exception, match="returned non-zero exit status 3"):
+        result.check_returncode()
+
+
+def test_timeout(fake_abaqus: str, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("FAKE_ABAQUS_SLEEP", "30")
+    result = AbqpyCLI(stdout=lambda line: None).run(f"{fake_abaqus} python script.py", timeout=0.5)
+    assert result.timed_out and result.returncode != 0 and result.wall_time < 10
+
+
+def test_cancel(fake_abaqus: str, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("FAKE_ABAQUS_SLEEP", "30")
+    cancel = threading.Event()
+    threading.Timer(0.5, cancel.set).start()
+    start = time.perf_counter()
+    result = AbqpyCLI(cancel=cancel, stdout=lambda line: None).python("script.py")
+    assert result.cancelled and not result.timed_out and time.perf_counter() - start < 10
+
+
+def test_async(fake_abaqus: str):
+    async def main():
+        stdout: list[str] = []
+        cli = AbqpyCLI(stdout=stdout.append, stderr=lambda line: None)
+        results = await asyncio.gather(
+            cli.acae("script.py", "arg"),
+            cli.apython("script.py", sim="model.sim"),
+            cli.aoptimization("task.par", "job", cpus=2),
+            cli.aabaqus("information=release"),
+        )
+        return results, stdout
+
+    results, stdout = asyncio.run(main())
+    assert all(isinstance(result, CommandResult) and result.returncode == 0 for result in results)
+    assert sorted(stdout) == [
+        "abaqus cae noGUI=script.py -- arg",
+        "abaqus information=release",
+        "abaqus optimization task=task.par job=job cpus=2",
+        "abaqus python script.py sim=model.sim",
+    ]
+
+
+def test_async_timeout_and_cancel(fake_abaqus: str, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("FAKE_ABAQUS_SLEEP", "30")
+    cli = AbqpyCLI(stdout=lambda line: None, stderr=lambda line: None)
+
+    async def cancel():
+        task = asyncio.ensure_future(cli.apython("script.py"))
+        await asyncio.sleep(0.5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    start = time.perf_counter()
+    assert asyncio.run(cli.arun(f"{fake_abaqus} python script.py", timeout=0.5)).timed_out
+    asyncio.run(cancel())
+    assert time.perf_counter() - start < 10
+
+
+def test_quote(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    echo = tmp_path / "echo.py"
+    echo.write_text("import json, sys\nprint(json.dumps(sys.argv[1:]))\n")
+    monkeypatch.setenv("ABAQUS_BAT_PATH", f'"{sys.executable}" "{echo}"')
+    script, model = str(tmp_path / "my model; rm -rf.py"), str(tmp_path / "it's a model.inp")
+    stdout: list[str] = []
+    cli = AbqpyCLI(stdout=stdout.append)
+    cli.cae(script, "an arg", "$HOME")
+    cli.python(script, "a&b", log="my log.txt")
+    cli.abaqus(job="job", input=model, interactive=True)
+    asyncio.run(cli.acae(script, "an arg"))
+    assert [json.loads(line) for line in stdout] == [
+        ["cae", f"noGUI={script}", "--", "an arg", "$HOME"],
+        ["python", script, "log=my log.txt", "a&b"],
+        ["job=job", f"input={model}", "interactive"],
+        ["cae", f"noGUI={script}", "--", "an arg"],
+    ]
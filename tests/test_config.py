@@ -41,3 +41,9 @@ def test_config(type: Literal["cae", "python"], envs: dict[str, str], expects: d
 
     for key, env in envs.items():
         del os.environ[key]
+
+
+@pytest.mark.parametrize("size", ["", "  "])
+def test_empty_cache_size(size: str, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("ABQPY_CACHE_SIZE", size)
+    assert reload(config_module).config.cache_size == 10 << 30
@@ -0,0 +1,15 @@
+import copy
+import pickle
+
+from abaqus.UtilityAndView.SymbolicConstant import abaqusConstants
+from abaqusConstants import *
+from symbolicConstants import *
+
+
+def test_constants():
+    assert THREE_D is abaqusConstants.THREE_D is abaqusConstants["THREE_D"] is abaqusConstants("THREE_D")
+    assert isinstance(THREE_D, SymbolicConstant) and THREE_D == "THREE_D"
+    assert repr(THREE_D) == str(THREE_D) == THREE_D.name == THREE_D.value == THREE_D.getText() == "THREE_D"
+    assert pickle.loads(pickle.dumps(THREE_D)) is copy.deepcopy(THREE_D) is THREE_D
+    assert len(abaqusConstants) == len(list(abaqusConstants)) == len(abaqusConstants.__members__)
+    assert isinstance(ON, AbaqusBoolean) and ON == 1 and OFF == 0
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import pytest
+
+from abqpy import decorators
+
+
+def make_class():
+    @decorators.abaqus_class_doc
+    class Part:
+        """The Part object defines the physical attributes of a part."""
+
+        @decorators.abaqus_method_doc
+        def setValues(self, name: str):
+            """This method modifies the Part object.
+
+            Parameters
+            ----------
+            name
+                A String specifying the repository key.
+            """
+
+    return Part
+
+
+@pytest.mark.parametrize("make_docs", [True, False])
+def test_class_doc(make_docs: bool, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(decorators.config, "make_docs", make_docs)
+    Part = make_class()
+    assert isinstance(vars(Part)["__doc__"], str if make_docs else decorators.LazyDocstring)
+    assert Part.__doc__ == Part().__doc__
+    assert Part.__doc__.endswith("simaker-c-partpyc.htm?contextscope=all>`__.")
+
+
+@pytest.mark.parametrize("make_docs", [True, False])
+def test_method_doc(make_docs: bool, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(decorators.config, "make_docs", make_docs)
+    Part = make_class()
+    assert ("help.3ds.com" in Part.setValues.__doc__) is make_docs
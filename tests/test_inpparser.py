@@ -0,0 +1,461 @@
+from __future__ import annotations
+
+import json
+import os
+import pickle
+import types
+
+import pytest
+
+from abqpy.cli import AbqpyCLI
+from inpParser import InputFile, Keyword, KeywordSequence, iterKeywords
+
+DECK = """*Heading
+** Job name: beam
+*Part, name=Beam
+*Node
+      1,           0.,           0.,           0.
+      2,          10.,           0.,           0.
+      3,          10.,           5.,           0.
+      4,           0.,           5.,           0.
+*Element, type=C3D20R,
+ elset=EALL
+1, 1, 2, 3, 4, 1, 2, 3, 4, 1, 2, 3, 4, 1, 2, 3,
+4, 1, 2, 3, 4
+*Nset, nset=TOP, generate
+ 3, 4, 1
+*Include, input=sets.inp
+*Include, input=missing.inp
+*End Part
+*Material, name="Steel, S355"
+*Elastic
+210000., 0.3
+*Step, name=Load, nlgeom=YES
+*Static
+0.1, 1., 1e-05, 0.1
+** BOUNDARY CONDITIONS
+*Boundary
+TOP, 1, 3
+*End Step
+"""
+
+SETS = """*Elset, elset=ALL
+1,
+"""
+
+
+@pytest.fixture
+def deck(tmp_path) -> str:
+    (tmp_path / "beam.inp").write_text(DECK)
+    (tmp_path / "sets.inp").write_text(SETS)
+    return str(tmp_path / "beam.inp")
+
+
+def names(keywords: KeywordSequence) -> list[str]:
+    return [keyword.name for keyword in keywords]
+
+
+def test_parse(deck: str, tmp_path):
+    inp = InputFile(deck)
+    keywords = inp.parse()
+    assert isinstance(keywords, KeywordSequence) and all(isinstance(keyword, Keyword) for keyword in keywords)
+    assert names(keywords) == [
+        "Heading",
+        "Part",
+        "Node",
+        "Element",
+        "Nset",
+        "Elset",
+        "End Part",
+        "Material",
+        "Elastic",
+        "Step",
+        "Static",
+        "Boundary",
+        "End Step",
+    ]
+    assert inp.directory == str(tmp_path)
+    assert inp.includes == (str(tmp_path / "sets.inp"),) and inp.missingIncludes == ("missing.inp",)
+
+    heading, part, node, element, nset, elset, _, material, elastic, step, static, boundary, _ = keywords
+    assert heading.comments == ("Job name: beam",) and boundary.comments == ()
+    assert static.comments == ("BOUNDARY CONDITIONS",)
+    assert part.parameter == {"name": "Beam"} and nset.parameter == {"nset": "TOP", "generate": ""}
+    assert node.data == ((1, 0.0, 0.0, 0.0), (2, 10.0, 0.0, 0.0), (3, 10.0, 5.0, 0.0), (4, 0.0, 5.0, 0.0))
+    assert element.parameter == {"type": "C3D20R", "elset": "EALL"}
+    assert element.data == ((1, *[1, 2, 3, 4] * 5),)
+    assert nset.data == ((3, 4, 1),) and elset.data == ((1,),)
+    assert material.parameter == {"name": '"Steel, S355"'} and elastic.data == ((210000.0, 0.3),)
+    assert step.parameter == {"name": "Load", "nlgeom": "YES"} and static.data == ((0.1, 1.0, 1e-05, 0.1),)
+    assert boundary.data == (("TOP", 1, 3),)
+
+    with pytest.raises(ValueError, match="already been parsed"):
+        inp.parse()
+
+
+def test_parse_options(deck: str):
+    keywords = InputFile(deck).parse(bulk=False)
+    assert [keyword.data for keyword in keywords[2:6]] == [(), (), (), ()]
+    assert keywords[8].data == ((210000.0, 0.3),)
+
+    keywords = InputFile(deck).parse(organize=True)
+    assert names(keywords) == ["Heading", "Part", "Material", "Step"]
+    assert names(keywords[1].suboptions) == ["Node", "Element", "Nset", "Elset", "End Part"]
+    assert names(keywords[2].suboptions) == ["Elastic"]
+    assert names(keywords[3].suboptions) == ["Static", "Boundary", "End Step"]
+
+
+def test_organize():
+    from abaqus.InputFileParser._nesting import organize_keywords
+
+    deck = [
+        "Material",
+        "Elastic",
+        "Damage Initiation",
+        "Damage Evolution",
+        "Density",
+        "Amplitude",
+        "Assembly",
+        "Instance",
+        "Node",
+        "End Instance",
+        "Nset",
+        "End Assembly",
+        "Step",
+        "Static",
+        "Output",
+        "Node Output",
+        "Element Output",
+        "Boundary",
+        "Output",
+        "End Step",
+        "End Step",
+    ]
+    keywords = organize_keywords(Keyword(name) for name in deck)
+    assert names(keywords) == ["Material", "Amplitude", "Assembly", "Step", "End Step"]
+    material, _, assembly, step, _ = keywords
+    assert names(material.suboptions) == ["Elastic", "Damage Initiation", "Density"]
+    assert names(material.suboptions[1].suboptions) == ["Damage Evolution"]
+    assert names(assembly.suboptions) == ["Instance", "Nset", "End Assembly"]
+    assert names(assembly.suboptions[0].suboptions) == ["Node", "End Instance"]
+    assert names(step.suboptions) == ["Static", "Output", "Boundary", "Output", "End Step"]
+    assert names(step.suboptions[1].suboptions) == ["Node Output", "Element Output"]
+
+    # An end keyword closes the blocks left open inside its block
+    keywords = organize_keywords(Keyword(name) for name in ["Part", "Instance", "Node", "End Part", "Node"])
+    assert names(keywords) == ["Part", "Node"] and names(keywords[0].suboptions) == ["Instance", "End Part"]
+
+
+def test_chunks(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    from abaqus.InputFileParser import _reader
+
+    monkeypatch.setattr(_reader, "CHUNK_SIZE", 100)
+    lines = [f"{i}, " + ", ".join(map(str, range(i, i + 15))) + ",\n" + f"{i + 15}, {i + 16}\n" for i in range(1, 8)]
+    (tmp_path / "mesh.inp").write_text("*Element, type=C3D20\n" + "".join(lines))
+    (element,) = InputFile(str(tmp_path / "mesh.inp")).parse()
+    assert element.data == tuple((i, *range(i, i + 17)) for i in range(1, 8))
+    (element,) = InputFile(str(tmp_path / "mesh.inp")).parse(usePyArray=True)
+    assert element.data.tolist() == [[i, *range(i, i + 17)] for i in range(1, 8)]
+
+
+def test_arrays(deck: str):
+    np = pytest.importorskip("numpy")
+    from abaqus.InputFileParser.AbaqusNDarray import AbaqusNDarray
+
+    keywords = InputFile(deck).parse(usePyArray=True)
+    node, element = keywords[2].data, keywords[3].data
+    assert isinstance(node, AbaqusNDarray) and node.colZeroIsInt and node.dtype == np.float64
+    assert isinstance(element, AbaqusNDarray) and not element.colZeroIsInt and element.dtype == np.int32
+    assert type(node[0, 0]) is int and type(node[0, 1]) is float and type(element[0][1]) is int
+    assert node.tolist() == [list(row) for row in InputFile(deck).parse()[2].data]
+    assert node.labels.tolist() == [1, 2, 3, 4] and node.values.shape == (4, 3)
+    assert not node[:, 1:].colZeroIsInt
+    assert pickle.loads(pickle.dumps(node)).colZeroIsInt
+    assert keywords[8].data.tolist() == [[210000.0, 0.3]]
+    assert keywords[0].data == ()
+
+
+def test_array_fallback(tmp_path):
+    pytest.importorskip("numpy")
+    (tmp_path / "sets.inp").write_text("*Nset, nset=A\n1, 2, 3\n4\n*Elset, elset=B\nA, 5\n*Node\n1, , 2.0, 3.0\n")
+    nset, elset, node = InputFile(str(tmp_path / "sets.inp")).parse(usePyArray=True)
+    assert nset.data == ((1, 2, 3), (4,))
+    assert elset.data == (("A", 5),)
+    assert node.data == ((1, "", 2.0, 3.0),)
+
+
+def test_index(deck: str, tmp_path):
+    inp = InputFile(deck)
+    element = inp.keyword("element", elset="eall")
+    assert element is not None and element.data == ((1, 1, 2, 3, 4, 1, 2, 3, 4, 1, 2, 3, 4, 1, 2, 3, 4, 1, 2, 3, 4),)
+    assert inp.keyword("*Element", elset="OTHER") is None
+    assert [keyword.parameter for keyword in inp.keywords("*NSET")] == [{"nset": "TOP", "generate": ""}]
+    (elset,) = inp.keywords("*Elset")
+    assert elset.data == ((1,),) and inp.includes == (str(tmp_path / "sets.inp"),)
+    assert inp.missingIncludes == ("missing.inp",)
+    assert inp.keyword("Material", name="steel, s355").name == "Material"
+    assert inp.keyword("*Static").data == ((0.1, 1.0, 1e-05, 0.1),)
+    assert inp.keyword("*Node", usePyArray=True).data.tolist() == [list(row) for row in InputFile(deck).parse()[2].data]
+
+    (tmp_path / "crlf.inp").write_bytes(DECK.replace("\n", "\r\n").encode())
+    assert [keyword.data for keyword in InputFile(str(tmp_path / "crlf.inp")).keywords("*Element")] == [element.data]
+
+
+def test_index_persist(deck: str, tmp_path):
+    InputFile(deck).index(persist=True)
+    output = tmp_path / "beam.inp.index.json"
+    assert output.exists()
+    index = InputFile(deck).index(persist=True)
+    assert [entry.key for entry in index.entries][:4] == ["HEADING", "PART", "NODE", "ELEMENT"]
+
+    (tmp_path / "sets.inp").write_text(SETS + "*Elset, elset=OTHER\n2,\n")
+    inp = InputFile(deck)
+    inp.index(persist=str(output))
+    assert [keyword.parameter["elset"] for keyword in inp.keywords("*Elset")] == ["ALL", "OTHER"]
+    assert '"OTHER"' in output.read_text()
+
+
+def test_cache(deck: str, tmp_path, monkeypatch: pytest.MonkeyPatch):
+    pytest.importorskip("numpy")
+    from abaqus.InputFileParser._cache import ParseCache
+
+    parsed: list[str] = []
+    parse = ParseCache.parse
+    monkeypatch.setattr(
+        ParseCache, "parse", lambda self, path: parsed.append(os.path.basename(path)) or parse(self, path)
+    )
+
+    expected = InputFile(deck).parse(usePyArray=True)
+    keywords = InputFile(deck).parse(usePyArray=True, cache=True)
+    assert parsed == ["beam.inp", "sets.inp"] and (tmp_path / "beam.inp.cache").is_dir()
+    assert [(keyword.name, keyword.parameter, keyword.comments) for keyword in keywords] == [
+        (keyword.name, keyword.parameter, keyword.comments) for keyword in expected
+    ]
+
+    parsed.clear()
+    inp = InputFile(deck)
+    keywords = inp.parse(usePyArray=True, cache=True, organize=True)
+    assert parsed == [] and inp.includes == (str(tmp_path / "sets.inp"),) and inp.missingIncludes == ("missing.inp",)
+    assert names(keywords[1].suboptions) == ["Node", "Element", "Nset", "Elset", "End Part"]
+    node = keywords[1].suboptions[0]
+    assert node.data.tolist() == expected[2].data.tolist() and node.data.colZeroIsInt
+    assert not node.data.flags.writeable  # A memory map of the cached array
+    assert keywords[1].suboptions[2].data.tolist() == [[3, 4, 1]]
+
+    os.utime(tmp_path / "beam.inp", ns=(0, 0))  # Touched, the content is unchanged
+    (tmp_path / "sets.inp").write_text(SETS + "*Elset, elset=OTHER\n2,\n")
+    keywords = InputFile(deck).parse(usePyArray=True, cache=True)
+    assert parsed == ["sets.inp"]
+    assert [keyword.parameter.get("elset") for keyword in keywords if keyword.name == "Elset"] == ["ALL", "OTHER"]
+
+    parsed.clear()
+    InputFile(deck).parse(cache=str(tmp_path / "cache"))
+    assert parsed == ["beam.inp", "sets.inp"]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_cache_changed(tmp_path, monkeypatch: pytest.MonkeyPatch, workers: int):
+    from abaqus.InputFileParser import _parallel
+    from abaqus.InputFileParser._cache import ParseCache
+
+    # The file is edited while it is parsed, its segment must not be cached with the stamp of the new content
+    path = tmp_path / "model.inp"
+    path.write_text("*Node\n1, 0., 0.\n")
+    parse, parse_segments = ParseCache.parse, _parallel.parse_segments
+
+    def edit(result):
+        path.write_text("*Node\n1, 9., 0.\n")
+        return result
+
+    monkeypatch.setattr(ParseCache, "parse", lambda self, file: edit(parse(self, file)))
+    monkeypatch.setattr(_parallel, "parse_segments", lambda *args: edit(parse_segments(*args)))
+    assert InputFile(str(path)).parse(cache=True, workers=workers)[0].data == ((1, 0.0, 0.0),)
+    monkeypatch.undo()
+    assert InputFile(str(path)).parse(cache=True, workers=workers)[0].data == ((1, 9.0, 0.0),)
+
+
+@pytest.mark.parametrize("usePyArray", [False, True])
+def test_workers(deck: str, tmp_path, monkeypatch: pytest.MonkeyPatch, usePyArray: bool):
+    from abaqus.InputFileParser import _parallel
+
+    monkeypatch.setattr(_parallel, "SPLIT_SIZE", 200)
+    nodes = "".join(f"{i}, {i * 0.5}, {i * 1.5}, 0.\n" for i in range(1, 100))
+    elements = "".join(
+        f"{i}, " + ", ".join(map(str, range(i, i + 15))) + ",\n" f"{i + 15}, {i + 16}\n" for i in range(1, 30)
+    )
+    (tmp_path / "mesh.inp").write_text(
+        f"*Node\n{nodes}** comment\n*Element, type=C3D20\n{elements}*Include, input=sets.inp\n"
+    )
+    (tmp_path / "beam.inp").write_text(DECK.replace("*End Part", "*Include, input=mesh.inp\n*End Part"))
+
+    def parse(**options) -> tuple[list, tuple[str, ...], tuple[str, ...]]:
+        inp = InputFile(deck)
+        keywords = inp.parse(usePyArray=usePyArray, **options)
+        data = [keyword.data if isinstance(keyword.data, tuple) else keyword.data.tolist() for keyword in keywords]
+        rows = [(keyword.name, keyword.parameter, keyword.comments) for keyword in keywords]
+        return list(zip(rows, data)), inp.includes, inp.missingIncludes
+
+    expected = parse()
+    assert len(expected[0][6][1]) == 99 and len(expected[0][7][1]) == 29 and len(expected[1]) == 3
+    assert parse(workers=2) == expected
+    assert parse(workers=2, cache=True) == expected
+    assert parse(workers=2, cache=True) == expected
+    assert parse(workers=2, bulk=False) == parse(bulk=False)
+
+
+@pytest.mark.parametrize("usePyArray", [False, True])
+def test_write(deck: str, tmp_path, usePyArray: bool):
+    keywords = InputFile(deck).parse(usePyArray=usePyArray, organize=True)
+    assert keywords.write(str(tmp_path / "copy.inp")) == []
+    text = (tmp_path / "copy.inp").read_text()
+    assert '*Material, name="Steel, S355"\n*Elastic\n210000.0, 0.3\n' in text
+    assert "1, 1, 2, 3, 4, 1, 2, 3, 4, 1, 2, 3, 4, 1, 2, 3,\n4, 1, 2, 3, 4\n" in text
+    assert "*Static\n0.1, 1.0, 1e-05, 0.1\n** BOUNDARY CONDITIONS\n*Boundary\n" in text
+    assert "\n1, 0.0, 0.0, 0.0\n2, 10.0, 0.0, 0.0\n" in text
+
+    def flat(keywords: KeywordSequence) -> list:
+        rows = []
+        for keyword in keywords:
+            data = keyword.data if isinstance(keyword.data, tuple) else tuple(map(tuple, keyword.data.tolist()))
+            rows.append((keyword.name, keyword.parameter, data, keyword.comments, flat(keyword.suboptions)))
+        return rows
+
+    assert flat(InputFile(str(tmp_path / "copy.inp")).parse(usePyArray=usePyArray, organize=True)) == flat(keywords)
+
+    keywords = InputFile(deck).parse(usePyArray=usePyArray)
+    included = keywords.write(str(tmp_path / "split.inp"), includeSize=3)
+    assert [os.path.basename(path) for path in included] == ["split-1-node.inp"]
+    assert "*Include, input=split-1-node.inp\n*Element" in (tmp_path / "split.inp").read_text()
+    inp = InputFile(str(tmp_path / "split.inp"))
+    assert flat(inp.parse(usePyArray=usePyArray)) == flat(keywords) and inp.includes == tuple(included)
+
+
+def test_iter_keywords(deck: str, tmp_path):
+    keywords = iterKeywords(deck)
+    assert isinstance(keywords, types.GeneratorType)
+    expected = InputFile(deck).parse()
+    assert [(keyword.name, keyword.data) for keyword in keywords] == [
+        (keyword.name, keyword.data) for keyword in expected
+    ]
+
+    keywords = list(iterKeywords("beam.inp", str(tmp_path), bulk=False))
+    assert [keyword.data for keyword in keywords[2:6]] == [(), (), (), ()] and len(keywords) == len(expected)
+    keywords = list(iterKeywords(deck, names=["step", "*Elastic", "*ELSET"]))
+    assert [(keyword.name, keyword.data) for keyword in keywords] == [
+        ("Elset", ((1,),)),
+        ("Elastic", ((210000.0, 0.3),)),
+        ("Step", ()),
+    ]
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_diff(deck: str, tmp_path, monkeypatch: pytest.MonkeyPatch, numpy: bool):
+    if not numpy:
+        monkeypatch.setattr("abaqus.InputFileParser._diff.np", None)
+    new = DECK.replace("** Job name: beam", "** Job name: new").replace("2,          10.,", "2,          12.,")
+    new = new.replace("      4,           0.,           5.,           0.", "      5,           1.,           5.,  0.")
+    new = new.replace('name="Steel, S355"\n*Elastic\n210000., 0.3', 'NAME="STEEL, S355"\n*ELASTIC\n200000., 0.3')
+    new = new.replace("*Boundary\nTOP, 1, 3", "*Cload\nTOP, 2, -1.")
+    (tmp_path / "new.inp").write_text(new)
+    diffs = InputFile(deck).diff(str(tmp_path / "new.inp"))
+    assert [(diff.status, (diff.old or diff.new).name) for diff in diffs] == [  # type: ignore[union-attr]
+        ("changed", "Node"),
+        ("changed", "Elastic"),
+        ("removed", "Boundary"),
+        ("added", "Cload"),
+    ]
+    assert [(row.status, row.label, row.delta) for row in diffs[0].rows] == [
+        ("removed", 4, None),
+        ("changed", 2, (2.0, 0.0, 0.0)),
+        ("added", 5, None),
+    ]
+    assert [(row.status, row.label, row.delta) for row in diffs[1].rows] == [("changed", 1, (-10000.0, 0.0))]
+    assert diffs[1].new.line == 19 and diffs[2].old.file == deck  # type: ignore[union-attr]
+    assert InputFile(deck).diff(InputFile("new.inp", str(tmp_path)), rows=False)[0].rows == ()
+    assert InputFile(deck).diff(deck) == []
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_diff_unlabeled(tmp_path, monkeypatch: pytest.MonkeyPatch, numpy: bool):
+    if not numpy:
+        monkeypatch.setattr("abaqus.InputFileParser._diff.np", None)
+    # The first entry of a material row is a value, not a label, even when it is an integer
+    (tmp_path / "old.inp").write_text("*Material, name=Steel\n*Elastic\n210000, 0.3\n*Node\n1, 0, 0\n")
+    (tmp_path / "new.inp").write_text("*Material, name=Steel\n*Elastic\n200000, 0.3\n*Node\n2, 0, 0\n")
+    diffs = InputFile(str(tmp_path / "old.inp")).diff(str(tmp_path / "new.inp"))
+    assert [[(row.status, row.label, row.delta) for row in diff.rows] for diff in diffs] == [
+        [("changed", 1, (-10000, 0))],
+        [("removed", 1, None), ("added", 2, None)],
+    ]
+
+
+def test_inpdiff(deck: str, tmp_path, capsys: pytest.CaptureFixture):
+    (tmp_path / "new.inp").write_text(DECK.replace("2,          10.,", "2,          12.,"))
+    AbqpyCLI().inpdiff(deck, str(tmp_path / "new.inp"))
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == f"changed  *Node  ({deck}:4 -> {tmp_path / 'new.inp'}:4)"
+    assert lines[1:] == ["    changed  2  delta 2, 0, 0", "0 added, 0 removed, 1 changed blocks"]
+    AbqpyCLI().inpdiff(deck, deck)
+    assert capsys.readouterr().out == "The input files have the same keyword blocks\n"
+
+
+ASSEMBLY = """*Part, name=Plate
+*Node
+1, 0., 0.
+2, 1., 0.
+3, 1., 1.
+** the last node
+4, 0., 1.
+*Element, type=S4R
+1, 1, 2, 3, 4
+*End Part
+*Assembly, name=Assembly
+*Instance, name=Plate-1, part=Plate
+*End Instance
+*Instance, name="Plate-2", part="plate"
+*End Instance
+*Node
+5, 0., 0., 2.
+*Element, type=T3D2,
+ elset=Truss
+2, 5, 1
+*Surface, name=Top
+*End Assembly
+*Step
+*Static
+*Output, field
+*Node Output
+U,
+ RF
+*Output, history, variable=PRESELECT
+*End Step
+"""
+
+
+def test_stats(deck: str, tmp_path):
+    stats = InputFile(deck).stats()
+    assert (stats.nodes, stats.elements, stats.sets, stats.dof) == (4, {"C3D20R": 1}, {"NSET": 1, "ELSET": 1}, 12)
+    assert (stats.materials, stats.steps, stats.parts, stats.instances) == (1, 1, 1, 0)
+    assert stats.includes == [str(tmp_path / "sets.inp")] and stats.missing == ["missing.inp"]
+
+    (tmp_path / "assembly.inp").write_bytes(ASSEMBLY.replace("\n", "\r\n").encode())
+    inp = InputFile("assembly.inp", str(tmp_path))
+    stats = inp.stats()
+    assert (stats.nodes, stats.elements, stats.surfaces, stats.steps) == (9, {"S4R": 2, "T3D2": 1}, 1, 1)
+    assert stats.outputs == {"FIELD OUTPUT": 1, "NODE OUTPUT": 1, "HISTORY OUTPUT": 1}
+    assert (stats.parts, stats.instances, stats.dof, inp.includes) == (1, 2, 54, ())
+
+    # The empty and whitespace only data lines are not counted, as they are not parsed
+    blank = "*Part, name=Bar\n*Node\n1, 0., 0.\n\n2, 1., 0.\n  \n*End Part\n*Assembly, name=Assembly\n"
+    blank += "*Instance, name=Bar-1, part=Bar\n*End Instance\n*Instance, name=Bar-2, part=Bar\n*End Instance\n"
+    (tmp_path / "blank.inp").write_bytes((blank + "*End Assembly\n").replace("\n", "\r\n").encode())
+    inp = InputFile("blank.inp", str(tmp_path))
+    assert inp.stats().nodes == 2 * len(inp.parse()[1].data) == 4
+
+
+def test_inpstat(deck: str, tmp_path, capsys: pytest.CaptureFixture):
+    AbqpyCLI().inpstat(deck, output=str(tmp_path / "stats.json"))
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[:3] == [f"{'nodes':<24}{4:>12}", f"{'elements':<24}{1:>12}", f"  {'C3D20R':<22}{1:>12}"]
+    assert lines[-1] == f"{'missing include':<24}{'missing.inp':>12}"
+    assert json.loads((tmp_path / "stats.json").read_text())["elements"] == {"C3D20R": 1}
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+def imported_modules(code: str) -> list[str]:
+    """Run the code in a fresh interpreter and return the names of the ``abaqus`` modules imported."""
+    env = dict(os.environ, ABQPY_SKIP_ABAQUS="true", PYTHONPATH=os.path.abspath("../src"))
+    code += "\nimport json, sys; print(json.dumps([m for m in sys.modules if m.split('.')[0] == 'abaqus']))"
+    output = subprocess.run([sys.executable, "-c", code], env=env, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+@pytest.fixture(scope="module")
+def eager() -> list[str]:
+    return imported_modules("from abaqus import *\nfrom caeModules import *\nfrom odbAccess import *")
+
+
+@pytest.mark.parametrize("module", ["abaqus", "caeModules", "odbAccess", "job", "part"])
+def test_import_is_lazy(module: str, eager: list[str]):
+    lazy = imported_modules(f"import {module}")
+    assert "abaqus.Mdb.Mdb" in eager and "abaqus.Mdb.Mdb" not in lazy
+    assert len(lazy) * 10 < len(eager), f"Importing {module} loads {len(lazy)} of {len(eager)} abaqus modules"
+
+
+def test_lazy_attributes():
+    code = """
+import abaqus.Mdb.MdbBase
+import abaqus
+from abaqus import Mdb, mdb, session
+from caeModules import mesh
+assert isinstance(Mdb, type) and abaqus.Mdb is Mdb and isinstance(mdb, Mdb)
+assert abaqus.session is session and mesh.ElemType.__name__ == "ElemType"
+assert {"mdb", "session", "openMdb"} <= set(dir(abaqus)) & set(abaqus.__all__)
+"""
+    modules = imported_modules(code)
+    assert "abaqus.Session.Session" in modules and "abaqus.Odb.Odb" in modules
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+from test_odbexport import ODB_ACCESS
+
+from abqpy.localodb import FieldValue, openOdb
+from abqpy.odbexport import export
+
+# A post-processing script written against odbAccess, run unchanged by the local backend
+SCRIPT = """
+import odbAccess
+from odbAccess import *
+from abaqusConstants import *
+
+# The symbolic constant LOCAL is not shadowed by the configuration of the backend
+assert odbAccess.openOdb is openOdb and odbAccess.LOCAL is LOCAL and "config" not in dir(odbAccess)
+
+odb = openOdb(path="job.odb", readOnly=True)
+frame = odb.steps["Step-2"].frames[-1]
+for value in frame.fieldOutputs["U"].values:
+    print(value.instance.name, value.nodeLabel, value.data[0], value.magnitude > 0)
+stress = frame.fieldOutputs["S"].getSubset(position=INTEGRATION_POINT)
+print(max(value.mises for value in stress.values))
+print(odb.steps["Step-1"].historyRegions["Node PART-1-1.1"].historyOutputs["U1"].data[-1])
+odb.close()
+"""
+
+
+@pytest.fixture
+def odb(tmp_path) -> str:
+    namespace: dict = {}
+    exec(ODB_ACCESS, namespace)
+    export(namespace["openOdb"]("job.odb"), str(tmp_path / "job-export"), verbose=False)
+    return str(tmp_path / "job.odb")
+
+
+def test_open(odb: str, tmp_path):
+    with pytest.raises(FileNotFoundError, match="abqpy export-odb"):
+        openOdb(str(tmp_path / "other.odb"))
+    odb = openOdb(odb)
+    assert list(odb.steps) == ["Step-1", "Step-2"] and odb.name == "job"
+    step = odb.steps["Step-2"]
+    assert [frame.frameValue for frame in step.frames] == [1.0, 1.5, 2.0] and step.totalTime == 1.0
+    assert step.getFrame(1.6).frameId == 1 and step.getFrame(1.6, match="AFTER").frameId == 2
+    with pytest.raises(ValueError):
+        step.getFrame(1.6, match="EXACT")
+    assert openOdb(str(tmp_path / "job-export")).steps["Step-2"].frames[-1].description == "Increment 2"
+
+
+def test_field_output(odb: str):
+    frame = openOdb(odb).steps["Step-1"].frames[1]
+    displacement = frame.fieldOutputs["U"]
+    assert (displacement.type, displacement.componentLabels, displacement.validInvariants) == (
+        "VECTOR",
+        ("U1", "U2", "U3"),
+        ("MAGNITUDE",),
+    )
+    (block,) = displacement.bulkDataBlocks
+    assert isinstance(block.data, np.memmap) and block.data.shape == (4, 3) and block.elementLabels is None
+    assert block.nodeLabels.tolist() == [1, 2, 3, 4] and block.instance.name == "PART-1-1"
+
+    values = displacement.values
+    assert len(values) == 4 and isinstance(values[-1], FieldValue)
+    value = values[1]
+    assert (value.nodeLabel, value.elementLabel, value.position, value.precision) == (
+        2,
+        None,
+        "NODAL",
+        "SINGLE_PRECISION",
+    )
+    assert value.data.tolist() == [3.5, 4.5, 5.5] and value.magnitude == pytest.approx(np.linalg.norm([3.5, 4.5, 5.5]))
+    assert [value.nodeLabel for value in values[1:3]] == [2, 3]
+
+    stress = frame.fieldOutputs["S"]
+    assert [value.elementLabel for value in stress.values] == [1, 1, 2, 2, 3]
+    assert [value.integrationPoint for value in stress.values] == [1, 2, 1, 2, 1]
+    assert stress.values[4].sectionPoint.number == 3 and stress.values[4].data == 0.5
+    assert stress.values[1].mises == 9.0
+    top = stress.getSubset(sectionPoint=stress.bulkDataBlocks[1].sectionPoint)
+    assert len(top.values) == 1 and len(stress.getSubset(position="NODAL").values) == 0
+    assert len(stress.getSubset(elementType="C3D8R").values) == 5
+
+    assert [value.data for value in stress.getScalarField(componentLabel="S11").values] == [0.5, 4.5, 8.5, 12.5, 0.5]
+    assert [value.data for value in displacement.getScalarField(componentLabel="U2").values] == [1.5, 4.5, 7.5, 10.5]
+    magnitude = displacement.getScalarField(invariant="MAGNITUDE")
+    assert magnitude.type == "SCALAR" and magnitude.values[0].data == pytest.approx(np.linalg.norm([0.5, 1.5, 2.5]))
+    assert [value.data for value in stress.getScalarField(invariant="MISES").values] == [1.0, 9.0, 17.0, 25.0, 1.0]
+    with pytest.raises(ValueError, match="MISES"):
+        displacement.getScalarField(invariant="MISES")
+
+
+def test_history_output(odb: str):
+    region = openOdb(odb).steps["Step-1"].historyRegions["Node PART-1-1.1"]
+    output = region.historyOutputs["U1"]
+    assert (region.position, output.type, output.conjugateData) == ("NODAL", "SCALAR", None)
+    assert output.data == ((0.0, 0.0), (0.5, 0.1), (1.0, 0.2))
+
+
+@pytest.mark.parametrize("first", ["odbAccess", "abaqus"])
+def test_script(odb: str, tmp_path, first: str):
+    # The script is run locally whichever of abaqus and odbAccess is imported first
+    (tmp_path / "post.py").write_text(f"import {first}\n" + SCRIPT)
+    env = dict(os.environ, ABQPY_ODB_BACKEND="local", PYTHONPATH=os.path.abspath("../src"), ABAQUS_BAT_PATH="false")
+    env.pop("ABQPY_SKIP_ABAQUS", None)
+    process = subprocess.run([sys.executable, "post.py"], cwd=tmp_path, env=env, capture_output=True, text=True)
+    assert process.returncode == 0, process.stderr
+    assert process.stdout.splitlines() == [
+        "PART-1-1 1 2.0 True",
+        "PART-1-1 2 5.0 True",
+        "PART-1-1 3 8.0 True",
+        "PART-1-1 4 11.0 True",
+        "28.0",
+        "(1.0, 0.2)",
+    ]
+
+
+def test_numpy_missing():
+    code = "import sys; sys.modules['numpy'] = None; import abqpy.localodb"
+    env = dict(os.environ, PYTHONPATH=os.path.abspath("../src"))
+    process = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True)
+    assert process.returncode and "pip install abqpy[odb]" in process.stderr
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import json
+import os
+
+from abqpy.notebook import convert_notebook
+
+NOTEBOOK = {
+    "cells": [
+        {"cell_type": "markdown", "metadata": {}, "source": ["# Model\n", "A cube."]},
+        {
+            "cell_type": "code",
+            "execution_count": 1,
+            "metadata": {},
+            "outputs": [],
+            "source": ["%matplotlib inline\n", "from abaqus import *\n", "!ls"],
+        },
+        {"cell_type": "code", "execution_count": None, "metadata": {}, "outputs": [], "source": "%%time\nx = 1"},
+        {"cell_type": "code", "execution_count": 2, "metadata": {}, "outputs": [], "source": "print(mdb)"},
+    ],
+    "metadata": {},
+    "nbformat": 4,
+    "nbformat_minor": 5,
+}
+
+
+def test_convert_notebook(tmp_path):
+    notebook = tmp_path / "model.ipynb"
+    notebook.write_text(json.dumps(NOTEBOOK))
+    script = convert_notebook(notebook)
+    assert script == str(tmp_path / "model.py")
+    with open(script) as file:
+        content = file.read()
+    assert content.splitlines()[2].startswith("# Converted from model.ipynb by abqpy, sha256: ")
+    assert content.endswith(
+        "# # Model\n# A cube.\n\n\n"
+        "# In[1]:\n\n\n# %matplotlib inline\nfrom abaqus import *\n# !ls\n\n\n"
+        "# In[ ]:\n\n\n# %%time\n# x = 1\n\n\n"
+        "# In[2]:\n\n\nprint(mdb)\n"
+    )
+    compile(content, script, "exec")
+
+    # The script is not rewritten while the notebook is unchanged
+    os.utime(script, (0, 0))
+    assert convert_notebook(notebook) == script and os.path.getmtime(script) == 0
+
+    NOTEBOOK["cells"][-1]["source"] = "print(session)"
+    notebook.write_text(json.dumps(NOTEBOOK))
+    convert_notebook(notebook)
+    assert os.path.getmtime(script) > 0
+    with open(script) as file:
+        assert file.read().endswith("print(session)\n")
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+
+from abqpy.cli import AbqpyCLI
+
+# Stands in for ``odbAccess``, an output database with two steps, a nodal field and a field at integration points
+ODB_ACCESS = """
+import numpy as np
+
+
+class Object(object):
+    def __init__(self, **attributes):
+        self.__dict__.update(attributes)
+
+
+def block(frame, position, labels, points, components, sectionPoint=None):
+    data = np.arange(len(labels) * len(components), dtype=np.float32).reshape(len(labels), -1) + frame
+    nodal = position == "NODAL"
+    return Object(
+        instance=Object(name="PART-1-1"),
+        elementType=None if nodal else "C3D8R",
+        position=position,
+        type="VECTOR" if nodal else "TENSOR_3D_FULL",
+        componentLabels=components,
+        sectionPoint=sectionPoint,
+        data=data,
+        conjugateData=None,
+        mises=None if nodal else data[:, 0] * 2,
+        nodeLabels=np.array(labels, dtype=np.int32) if nodal else None,
+        elementLabels=None if nodal else np.array(labels, dtype=np.int32),
+        integrationPoints=None if nodal else np.array(points, dtype=np.int32),
+    )
+
+
+def field(name, blocks):
+    return Object(
+        name=name,
+        description=name + " field",
+        type=blocks[0].type,
+        componentLabels=blocks[0].componentLabels,
+        validInvariants=("MAGNITUDE",),
+        isComplex=False,
+        bulkDataBlocks=blocks,
+    )
+
+
+def frame(step, index):
+    value = step + index * 0.5
+    fields = {
+        "U": field("U", [block(value, "NODAL", [1, 2, 3, 4], None, ("U1", "U2", "U3"))]),
+        "S": field(
+            "S",
+            [
+                block(value, "INTEGRATION_POINT", [1, 1, 2, 2], [1, 2, 1, 2], ("S11", "S22", "S33", "S12")),
+                block(value, "INTEGRATION_POINT", [3], [1], ("S11",), Object(number=3, description="top")),
+            ],
+        ),
+    }
+    return Object(frameId=index, incrementNumber=index, frameValue=value, description="Increment %d" % index,
+                  domain="TIME", fieldOutputs=fields)
+
+
+def history():
+    output = Object(description="Spatial displacement", type="SCALAR", data=((0.0, 0.0), (0.5, 0.1), (1.0, 0.2)),
+                    conjugateData=None)
+    return {"Node PART-1-1.1": Object(description="Output at node 1", position="NODAL",
+                                      historyOutputs={"U1": output})}
+
+
+class Odb(Object):
+    def close(self):
+        self.closed = True
+
+
+def openOdb(path, readOnly=True):
+    steps = {}
+    for number, name in enumerate(["Step-1", "Step-2"]):
+        steps[name] = Object(number=number + 1, description="", procedure="*STATIC", domain="TIME", timePeriod=1.0,
+                             totalTime=float(number), frames=[frame(number, index) for index in range(3)],
+                             historyRegions=history())
+    return Odb(name="job", path=path, steps=steps)
+"""
+
+# Stands in for ``abaqus``, runs ``abaqus python script args`` with the current Python interpreter
+PYTHON = """
+import os, sys
+os.execv(sys.executable, [sys.executable] + sys.argv[2:])
+"""
+
+
+@pytest.fixture
+def odb(tmp_path, monkeypatch: pytest.MonkeyPatch) -> str:
+    (tmp_path / "odbAccess.py").write_text(ODB_ACCESS)
+    (tmp_path / "fake_abaqus.py").write_text(PYTHON)
+    monkeypatch.setenv("ABAQUS_BAT_PATH", f'"{sys.executable}" "{tmp_path / "fake_abaqus.py"}"')
+    monkeypatch.setenv("PYTHONPATH", str(tmp_path))
+    return str(tmp_path / "job.odb")
+
+
+def test_export_odb(odb: str, tmp_path):
+    assert AbqpyCLI().export_odb(odb).returncode == 0
+    output = tmp_path / "job-export"
+    manifest = json.loads((output / "manifest.json").read_text())
+    assert manifest["version"] == 1 and [step["name"] for step in manifest["steps"]] == ["Step-1", "Step-2"]
+    frames = manifest["steps"][1]["frames"]
+    assert [frame["frameValue"] for frame in frames] == [1.0, 1.5, 2.0]
+
+    displacement = frames[2]["fieldOutputs"]["U"]
+    assert displacement["componentLabels"] == ["U1", "U2", "U3"] and len(displacement["blocks"]) == 1
+    block = displacement["blocks"][0]
+    assert (block["position"], block["instance"], block["length"]) == ("NODAL", "PART-1-1", 4)
+    data = np.load(output / block["data"], mmap_mode="r")
+    assert data.dtype == np.float32 and data.shape == (4, 3) and data[0].tolist() == [2.0, 3.0, 4.0]
+    assert block["data"] == "1/U/2-0-data.npy"
+    # The labels are saved once and shared by the following frames and steps
+    assert block["nodeLabels"] == "0/U/0-0-nodeLabels.npy" and "elementLabels" not in block
+    assert np.load(output / block["nodeLabels"]).tolist() == [1, 2, 3, 4]
+
+    stress = frames[0]["fieldOutputs"]["S"]["blocks"]
+    assert [block["sectionPoint"] for block in stress] == [None, {"number": 3, "description": "top"}]
+    assert np.load(output / stress[0]["integrationPoints"]).tolist() == [1, 2, 1, 2]
+    assert stress[1]["elementLabels"] == "0/S/0-1-elementLabels.npy"
+    assert np.load(output / stress[0]["mises"]).tolist() == [2.0, 10.0, 18.0, 26.0]
+
+    history = manifest["steps"][0]["historyRegions"]["Node PART-1-1.1"]["historyOutputs"]["U1"]
+    assert np.load(output / history["data"]).tolist() == [[0.0, 0.0], [0.5, 0.1], [1.0, 0.2]]
+
+
+def test_export_odb_selection(odb: str, tmp_path):
+    output = str(tmp_path / "selection")
+    result = AbqpyCLI().export_odb(odb, output, steps="Step-2", variables=("U",), frames=(0, -1), history=False)
+    assert result.returncode == 0
+    manifest = json.loads(open(os.path.join(output, "manifest.json")).read())
+    (step,) = manifest["steps"]
+    assert (step["name"], step["index"], step["historyRegions"]) == ("Step-2", 1, {})
+    assert [(frame["index"], list(frame["fieldOutputs"])) for frame in step["frames"]] == [(0, ["U"]), (2, ["U"])]
+    assert sorted(os.listdir(output)) == ["1", "manifest.json"]
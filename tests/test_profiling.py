@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import marshal
+import os
+import subprocess
+import sys
+
+import pytest
+
+from abqpy.cli import AbqpyCLI
+from abqpy.profiling import is_abaqus_call, stats_table
+
+# Runs ``abaqus python script [args ...]`` with the current interpreter
+ABAQUS = """
+import subprocess, sys
+sys.exit(subprocess.call([sys.executable] + sys.argv[2:]))
+"""
+
+SCRIPT = """
+import sys
+from odbAccess import *
+
+def work(n):
+    return sorted(range(n), key=lambda x: -x)
+
+work(int(sys.argv[1]))
+"""
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("<method 'setValues' of 'Part' objects>", True),
+        ("{method 'Job' of 'Mdb' objects}", True),
+        ("<built-in method openMdb>", True),
+        ("<built-in method odbAccess.openOdb>", True),
+        ("<method 'append' of 'list' objects>", False),
+        ("<method 'read' of '_io.TextIOWrapper' objects>", False),
+        ("<method 'get' of 'mappingproxy' objects>", False),
+        ("<built-in method builtins.sorted>", False),
+        ("<built-in method from_bytes>", False),
+        ("<lambda>", False),
+    ],
+)
+def test_is_abaqus_call(name: str, expected: bool):
+    assert is_abaqus_call(name) is expected
+
+
+def test_stats_table(tmp_path):
+    stats = {
+        ("~", 0, "<method 'submit' of 'Job' objects>"): (1, 1, 30.0, 30.0, {}),
+        ("~", 0, "<method 'setValues' of 'Part' objects>"): (100, 100, 2.0, 2.0, {}),
+        ("~", 0, "<method 'append' of 'list' objects>"): (1000, 1000, 0.5, 0.5, {}),
+        ("model.py", 1, "<module>"): (1, 1, 0.1, 32.6, {}),
+        ("model.py", 3, "mesh"): (10, 10, 0.1, 2.1, {}),
+    }
+    path = tmp_path / "model.prof"
+    path.write_bytes(marshal.dumps(stats))
+    table = stats_table(str(path))
+    assert table["abaqus"] == [("Job.submit", 1, 30.0, 30.0), ("Part.setValues", 100, 2.0, 2.0)]
+    assert [row[0] for row in table["python"]] == ["<module> (model.py:1)", "mesh (model.py:3)"]
+
+
+@pytest.mark.parametrize("profiler, suffix", [("cprofile", ".prof"), ("tracemalloc", ".snapshot")])
+def test_profile(profiler: str, suffix: str, tmp_path, capsys: pytest.CaptureFixture):
+    (tmp_path / "fake_abaqus.py").write_text(ABAQUS)
+    (tmp_path / "model.py").write_text(SCRIPT)
+    env = dict(
+        os.environ,
+        ABAQUS_BAT_PATH=f'"{sys.executable}" "{tmp_path / "fake_abaqus.py"}"',
+        ABQPY_PROFILE=profiler,
+        PYTHONPATH=os.path.abspath("../src"),
+    )
+    env.pop("ABQPY_SKIP_ABAQUS")
+    if profiler == "tracemalloc":
+        env.update(PYTHONTRACEMALLOC="1")  # Only trace the innermost frame, tracing 25 frames is slow
+    command = [sys.executable, "model.py", "1000"]
+    subprocess.run(command, cwd=tmp_path, env=env, check=True, capture_output=True)
+    assert (tmp_path / f"model{suffix}").exists()
+
+    AbqpyCLI().profile_report(str(tmp_path / "model.py"), limit=20)
+    output = capsys.readouterr().out
+    assert str(tmp_path / f"model{suffix}") in output
+    if profiler == "cprofile":
+        assert "<module> (model.py:1)" in output
+    else:
+        assert "size [KiB]" in output
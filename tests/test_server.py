@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import io
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+
+from abqpy import server
+
+SCRIPT = """
+import sys
+from odbAccess import *
+print("argv", *sys.argv[1:])
+print("error", file=sys.stderr)
+sys.exit(int(sys.argv[1]))
+"""
+
+# Stands in for ``abaqus``, runs ``abaqus python script args`` with the current Python interpreter
+PYTHON = """
+import os, sys
+os.execv(sys.executable, [sys.executable] + sys.argv[2:])
+"""
+
+
+@pytest.fixture
+def kernel(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    shim = tmp_path / "fake_abaqus.py"
+    shim.write_text(PYTHON)
+    connection = str(tmp_path / "kernel.json")
+    env = dict(os.environ, ABAQUS_BAT_PATH=f'"{sys.executable}" "{shim}"', PYTHONPATH=os.path.abspath("../src"))
+    process = subprocess.Popen([sys.executable, "-m", "abqpy", "serve", f"--connection={connection}"], env=env)
+    while server.ping(connection) is None:
+        assert process.poll() is None, "The kernel server exited"
+        time.sleep(0.1)
+    yield connection
+    subprocess.run([sys.executable, "-m", "abqpy", "serve", "--stop", f"--connection={connection}"], env=env)
+    assert process.wait(10) == 0 and not os.path.exists(connection)
+
+
+def test_submit(kernel: str, tmp_path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "script.py").write_text(SCRIPT)
+    assert server.ping(kernel)["mode"] == "python"
+    assert server.submit("script.py", ["0"], cae=True, connection=kernel) is None
+    for status in (0, 3):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        assert server.submit("script.py", [str(status)], connection=kernel, stdout=stdout, stderr=stderr) == status
+        assert stdout.getvalue() == f"argv {status}\n" and stderr.getvalue() == "error\n"
+    stderr = io.StringIO()
+    assert server.submit("script.py", ["x"], connection=kernel, stderr=stderr) == 1
+    assert "ValueError" in stderr.getvalue()
+
+
+def test_wrong_token(kernel: str, tmp_path):
+    with open(kernel) as file:
+        info = json.load(file)
+    connection = tmp_path / "wrong.json"
+    connection.write_text(json.dumps(dict(info, token="wrong")))
+    assert server.ping(str(connection)) == {"error": "invalid token"}
+    assert server.submit("script.py", [], connection=str(connection)) is None
+
+
+def test_run(kernel: str, tmp_path):
+    (tmp_path / "script.py").write_text(SCRIPT)
+    env = dict(os.environ, ABQPY_SERVER=kernel, PYTHONPATH=os.path.abspath("../src"))
+    env.pop("ABQPY_SKIP_ABAQUS")
+    output = subprocess.run(
+        [sys.executable, "script.py", "2"], cwd=tmp_path, env=env, capture_output=True, text=True, timeout=60
+    )
+    assert output.returncode == 2 and "argv 2" in output.stdout and "error" in output.stderr
+
+
+def test_busy(tmp_path):
+    # A kernel server busy with another script accepts the connections but does not answer them
+    with socket.socket() as listener:
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        connection = tmp_path / "kernel.json"
+        connection.write_text(json.dumps({"host": "127.0.0.1", "port": listener.getsockname()[1], "token": ""}))
+        start = time.perf_counter()
+        assert server.ping(str(connection), timeout=0.5) is None
+        assert server.submit("script.py", [], connection=str(connection), timeout=0.5) is None
+        assert time.perf_counter() - start < 5
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import csv
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import pytest
+
+from abqpy.sweep import parameter_sets, sweep
+
+# Runs ``abaqus python script [args ...]`` with the current interpreter
+FAKE_ABAQUS_PYTHON = """
+import subprocess, sys
+sys.exit(subprocess.call([sys.executable] + sys.argv[2:]))
+"""
+
+SCRIPT = """
+import json, os, sys
+params = dict(arg[2:].split("=") for arg in sys.argv[1:])
+assert json.loads(os.environ.get("ABQPY_SWEEP_PARAMS", "{}")) in ({}, {"E": float(params["E"]), "nu": 0.3})
+if float(params["E"]) < 0:
+    sys.exit(3)
+with open("data.csv", "w") as file:
+    file.write("time,U3\\n")
+    for time in (0.5, 1.0):
+        file.write("%s,%s\\n" % (time, -time / float(params["E"])))
+"""
+
+# Sweeps a script sleeping ``--t`` seconds with one worker
+SLEEP = """
+import sys, time
+from abqpy import sweep
+with open("sleep.py", "w") as file:
+    file.write("import sys, time; time.sleep(float(sys.argv[1][4:]))")
+sweep("sleep.py", {"t": [0, 30, 30]}, workers=1, mode="python", directory="runs")
+"""
+
+
+def test_parameter_sets():
+    assert parameter_sets({"a": [1, 2], "b": ["x", "y"]}) == [
+        {"a": 1, "b": "x"},
+        {"a": 1, "b": "y"},
+        {"a": 2, "b": "x"},
+        {"a": 2, "b": "y"},
+    ]
+    assert parameter_sets([{"a": 1}, {"a": 2, "b": 3}]) == [{"a": 1}, {"a": 2, "b": 3}]
+
+
+@pytest.mark.parametrize("env", [False, True])
+def test_sweep(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch, env: bool):
+    tmp_path = tmp_path_factory.mktemp("sweep")
+    (tmp_path / "shim.py").write_text(FAKE_ABAQUS_PYTHON)
+    (tmp_path / "model.py").write_text(SCRIPT)
+    monkeypatch.setenv("ABAQUS_BAT_PATH", f'"{sys.executable}" "{tmp_path / "shim.py"}"')
+    directory = str(tmp_path / "runs")
+
+    rows = sweep(
+        str(tmp_path / "model.py"),
+        {"E": [10.0, 100.0, -1.0], "nu": [0.3]},
+        workers=2,
+        result="data.csv",
+        env=env,
+        mode="python",
+        directory=directory,
+    )
+    assert [(row["case"], row["E"], row["returncode"], row.get("U3")) for row in rows] == [
+        (0, 10.0, 0, -0.05),
+        (0, 10.0, 0, -0.1),
+        (1, 100.0, 0, -0.005),
+        (1, 100.0, 0, -0.01),
+        (2, -1.0, 3, None),
+    ]
+    assert sorted(os.listdir(directory)) == ["case-0", "case-1", "case-2", "results.csv"]
+    with open(os.path.join(directory, "case-1", "params.json")) as file:
+        assert json.load(file) == {"E": 100.0, "nu": 0.3}
+    with open(os.path.join(directory, "results.csv")) as file:
+        table = list(csv.DictReader(file))
+    assert list(table[0]) == ["case", "E", "nu", "returncode", "wall_time", "time", "U3"]
+    assert len(table) == 5 and table[-1]["U3"] == ""
+
+
+def test_sweep_quote(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    (tmp_path / "shim.py").write_text(FAKE_ABAQUS_PYTHON)
+    (tmp_path / "my model; rm.py").write_text(
+        "import json, sys\njson.dump({'argv': json.dumps(sys.argv[1:])}, open('argv.json', 'w'))\n"
+    )
+    monkeypatch.setenv("ABAQUS_BAT_PATH", f'"{sys.executable}" "{tmp_path / "shim.py"}"')
+    names = ["it's a part", "a;b $HOME"]
+    rows = sweep(str(tmp_path / "my model; rm.py"), {"name": names}, result="argv.json", mode="python",
+                 directory=str(tmp_path / "runs"))  # fmt: skip
+    assert [json.loads(row["argv"]) for row in rows] == [[f"--name={name}"] for name in names]
+
+
+def test_sweep_mode():
+    with pytest.raises(ValueError, match="mode must be"):
+        sweep("model.py", {"E": [1]}, mode="job")
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="SIGINT cannot be sent to a console process")
+def test_sweep_interrupt(tmp_path):
+    (tmp_path / "shim.py").write_text(FAKE_ABAQUS_PYTHON)
+    env = dict(os.environ, ABAQUS_BAT_PATH=f'"{sys.executable}" "{tmp_path / "shim.py"}"')
+    env["PYTHONPATH"] = os.path.abspath("../src")
+    process = subprocess.Popen([sys.executable, "-c", SLEEP], cwd=tmp_path, env=env, stdout=subprocess.DEVNULL)
+    while not (tmp_path / "runs" / "case-1" / "abqpy.log").exists():
+        time.sleep(0.1)
+    start = time.perf_counter()
+    process.send_signal(signal.SIGINT)
+    process.wait(timeout=20)
+    assert process.returncode != 0 and time.perf_counter() - start < 10
+    # The finished and the terminated cases are written, the pending one never started
+    with open(tmp_path / "runs" / "results.csv") as file:
+        table = list(csv.DictReader(file))
+    assert [(row["case"], row["returncode"] == "0") for row in table] == [("0", True), ("1", False)]
+    assert not (tmp_path / "runs" / "case-2").exists()
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import asyncio
+import random
+
+import pytest
+from typeguard import TypeCheckError
+
+from abqpy.typecheck import typecheck
+
+
+def make_class() -> type:
+    class Checked:
+        def method(self, value: int) -> int:
+            return value
+
+        async def amethod(self, value: int) -> int:
+            return value
+
+        @property
+        def name(self) -> str:
+            return getattr(self, "_name", "name")
+
+    return Checked
+
+
+def errors(call, number: int = 200) -> int:
+    count = 0
+    for _ in range(number):
+        try:
+            call()
+        except TypeCheckError:
+            count += 1
+    return count
+
+
+def test_off():
+    cls = make_class()
+    assert typecheck(cls, "off") is cls
+    assert errors(lambda: cls().method("1")) == 0
+
+
+def test_full():
+    instance = typecheck(make_class(), "full")()
+    assert instance.method(1) == 1
+    assert errors(lambda: instance.method("1")) == 200
+    assert errors(lambda: asyncio.run(instance.amethod("1")), 10) == 10
+
+
+def test_sample():
+    random.seed(0)
+    instance = typecheck(make_class(), "sample", 0.25)()
+    assert 20 < errors(lambda: instance.method("1")) < 80
+    assert 0 < errors(lambda: asyncio.run(instance.amethod("1")), 50) < 50
+    instance._name = 1
+    assert 20 < errors(lambda: instance.name) < 80
+
+    def function(value: int) -> int:
+        return value
+
+    assert 20 < errors(lambda: typecheck(function, "sample", 0.25)("1")) < 80
+    assert errors(lambda: typecheck(function, "sample", 0)("1")) == 0
+
+
+def test_mode():
+    with pytest.raises(ValueError, match="must be one of off, sample, full"):
+        typecheck(make_class(), "some")